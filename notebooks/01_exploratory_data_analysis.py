@@ -16,10 +16,16 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+from data_loader import load_data
+from eda_stats import (load_descriptive_stats, load_distribution_aggregates, load_eda_state,
+                       resolve_stats_method, as_describe, boxplot_stats)
+from correlation import load_correlation
+from hypothesis_tests import (ttest_features, mannwhitney_features, permutation_test_features,
+                              chi2_tables, significance_stars, test_label)
+
 # Konfiguracja wizualizacji
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -34,8 +40,22 @@ print("="*80)
 print("EKSPLORACYJNA ANALIZA DANYCH - HEART FAILURE DATASET")
 print("="*80)
 
-# Wczytanie danych
-df = pd.read_csv('../data/heart_failure_data.csv')
+# Wczytanie danych (nazwy kolumn ujednolicone w data_loader.COLUMN_MAPPING)
+df = load_data()
+
+# Statystyki opisowe wszystkich kolumn (ogółem i w grupach DEATH_EVENT),
+# liczone raz i współdzielone z 02_generate_thesis_figures.py.
+# Tryb 'exact' dla małych plików, 'sketch' (szkice kwantyli KLL) dla dużych eksportów
+stats_method = resolve_stats_method()
+stats_all, stats_by_group = load_descriptive_stats(method=stats_method)
+
+# Agregaty rozkładów (histogramy, pięć liczb, wartości odstające) z tego samego
+# potoku - wykresy rozkładów nie sięgają do surowych wierszy
+distributions_all, distributions_by_group = load_distribution_aggregates(method=stats_method)
+
+# Łączalne statystyki dostateczne (współmomenty, tabele kontyngencji) -
+# nowe wiersze dopisywane są w O(liczba nowych wierszy), patrz streaming.py
+eda_state = load_eda_state()
 
 print("\n1. PODSTAWOWE INFORMACJE O ZBIORZE DANYCH")
 print("-"*80)
@@ -43,25 +63,6 @@ print(f"Liczba wierszy: {df.shape[0]}")
 print(f"Liczba kolumn: {df.shape[1]}")
 print(f"\nNazwy kolumn:\n{df.columns.tolist()}")
 
-# Mapowanie nazw kolumn na bardziej czytelne
-column_mapping = {
-    'TIME': 'time',
-    'Event': 'DEATH_EVENT',
-    'Gender': 'sex',
-    'Smoking': 'smoking',
-    'Diabetes': 'diabetes',
-    'BP': 'high_blood_pressure',
-    'Anaemia': 'anaemia',
-    'Age': 'age',
-    'Ejection.Fraction': 'ejection_fraction',
-    'Sodium': 'serum_sodium',
-    'Creatinine': 'serum_creatinine',
-    'Pletelets': 'platelets',
-    'CPK': 'creatinine_phosphokinase'
-}
-
-df = df.rename(columns=column_mapping)
-
 print("\n2. PIERWSZE 5 WIERSZY DANYCH")
 print("-"*80)
 print(df.head())
@@ -72,7 +73,7 @@ print(df.info())
 
 print("\n4. STATYSTYKI OPISOWE")
 print("-"*80)
-print(df.describe())
+print(as_describe(stats_all))
 
 # Sprawdzenie brakujących wartości
 print("\n5. BRAKUJĄCE WARTOŚCI")
@@ -130,23 +131,24 @@ numerical_features = ['age', 'ejection_fraction', 'serum_creatinine',
                       'serum_sodium', 'platelets', 'creatinine_phosphokinase', 'time']
 
 print("\nStatystyki opisowe dla cech numerycznych:")
-print(df[numerical_features].describe())
+print(as_describe(stats_all.loc[numerical_features]))
 
 # Rozkłady cech numerycznych
 fig, axes = plt.subplots(3, 3, figsize=(18, 15))
 axes = axes.ravel()
 
 for idx, feature in enumerate(numerical_features):
-    # Histogram z krzywą gęstości
-    axes[idx].hist(df[feature], bins=30, alpha=0.7, color='steelblue', edgecolor='black')
+    # Histogram z krzywą gęstości (gotowe liczności 30 przedziałów)
+    edges, counts = distributions_all[feature]['hist'][30]
+    axes[idx].hist(edges[:-1], bins=edges, weights=counts, alpha=0.7, color='steelblue', edgecolor='black')
     axes[idx].set_xlabel(feature, fontsize=11)
     axes[idx].set_ylabel('Częstość', fontsize=11)
     axes[idx].set_title(f'Rozkład: {feature}', fontsize=12, fontweight='bold')
     axes[idx].grid(axis='y', alpha=0.3)
     
     # Dodanie linii średniej i mediany
-    mean_val = df[feature].mean()
-    median_val = df[feature].median()
+    mean_val = stats_all.at[feature, 'mean']
+    median_val = stats_all.at[feature, '50%']
     axes[idx].axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Średnia: {mean_val:.2f}')
     axes[idx].axvline(median_val, color='green', linestyle='--', linewidth=2, label=f'Mediana: {median_val:.2f}')
     axes[idx].legend(fontsize=9)
@@ -216,8 +218,8 @@ print("\n" + "="*80)
 print("ANALIZA KORELACJI")
 print("="*80)
 
-# Macierz korelacji
-correlation_matrix = df.corr()
+# Macierz korelacji (silnik korelacji, wynik współdzielony z 02_generate_thesis_figures.py)
+correlation_matrix = load_correlation()
 
 print("\nMacierz korelacji:")
 print(correlation_matrix)
@@ -227,6 +229,15 @@ print("\nKorelacje z DEATH_EVENT (posortowane):")
 death_correlations = correlation_matrix['DEATH_EVENT'].sort_values(ascending=False)
 print(death_correlations)
 
+# Korelacje rangowe i punktowo-dwuseryjne - tylko kolumna DEATH_EVENT
+print("\nKorelacje Spearmana i punktowo-dwuseryjne z DEATH_EVENT:")
+point_biserial = load_correlation(method='pointbiserial', target='DEATH_EVENT')
+print(pd.DataFrame({
+    'Spearman': load_correlation(method='spearman', target='DEATH_EVENT'),
+    'point-biserial r': point_biserial['r'],
+    'p-value': point_biserial['p_value']
+}).drop('DEATH_EVENT').round(4).to_string())
+
 # Wizualizacja macierzy korelacji
 fig, ax = plt.subplots(figsize=(14, 12))
 sns.heatmap(correlation_matrix, annot=True, fmt='.2f', cmap='coolwarm', 
@@ -269,19 +280,35 @@ print(f"\nLiczba pacjentów, którzy przeżyli: {len(survived)}")
 print(f"Liczba pacjentów, którzy zmarli: {len(died)}")
 
 print("\nStatystyki opisowe - PRZEŻYLI:")
-print(survived[numerical_features].describe())
+print(as_describe(stats_by_group[0].loc[numerical_features]))
 
 print("\nStatystyki opisowe - ZMARLI:")
-print(died[numerical_features].describe())
+print(as_describe(stats_by_group[1].loc[numerical_features]))
+
+# Testy dla wszystkich cech naraz (korekta Holma w obrębie rodziny testów)
+student_tests = ttest_features(df, numerical_features, equal_var=True)
+welch_tests = ttest_features(df, numerical_features)
+mannwhitney_tests = mannwhitney_features(df, numerical_features)
+permutation_tests = permutation_test_features(df, numerical_features, n_resamples=9999)
+
+print("\nTesty porównujące grupy (p - surowe, p_adj - po korekcie Holma):")
+print(pd.DataFrame({
+    't-Studenta p': student_tests['p_value'],
+    'Welch p': welch_tests['p_value'],
+    'Welch p_adj': welch_tests['p_adjusted'],
+    'Mann-Whitney p': mannwhitney_tests['p_value'],
+    'Mann-Whitney p_adj': mannwhitney_tests['p_adjusted'],
+    'Permutacyjny p': permutation_tests['p_value']
+}).round(4).to_string())
 
 # Wykresy pudełkowe dla porównania grup
 fig, axes = plt.subplots(3, 3, figsize=(18, 15))
 axes = axes.ravel()
 
 for idx, feature in enumerate(numerical_features):
-    data_to_plot = [survived[feature], died[feature]]
-    bp = axes[idx].boxplot(data_to_plot, labels=['Przeżyli', 'Zmarli'],
-                            patch_artist=True, widths=0.6)
+    box_stats = [boxplot_stats(distributions_by_group[0][feature], 'Przeżyli'),
+                 boxplot_stats(distributions_by_group[1][feature], 'Zmarli')]
+    bp = axes[idx].bxp(box_stats, patch_artist=True, widths=0.6)
     
     # Kolorowanie
     colors = ['#2ecc71', '#e74c3c']
@@ -293,9 +320,9 @@ for idx, feature in enumerate(numerical_features):
     axes[idx].set_title(f'Porównanie: {feature}', fontsize=12, fontweight='bold')
     axes[idx].grid(axis='y', alpha=0.3)
     
-    # Test t-Studenta
-    t_stat, p_value = stats.ttest_ind(survived[feature], died[feature])
-    significance = "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*" if p_value < 0.05 else "ns"
+    # Test t-Studenta (policzony wyżej dla wszystkich cech)
+    p_value = student_tests.at[feature, 'p_value']
+    significance = significance_stars(p_value)
     axes[idx].text(0.5, 0.95, f'p-value: {p_value:.4f} {significance}',
                    transform=axes[idx].transAxes, ha='center', va='top',
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
@@ -317,22 +344,17 @@ print("\n" + "="*80)
 print("ANALIZA WARTOŚCI ODSTAJĄCYCH (OUTLIERS)")
 print("="*80)
 
-def detect_outliers_iqr(data, feature):
-    """Wykrywa wartości odstające metodą IQR"""
-    Q1 = data[feature].quantile(0.25)
-    Q3 = data[feature].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    outliers = data[(data[feature] < lower_bound) | (data[feature] > upper_bound)]
-    return outliers, lower_bound, upper_bound
-
+# Granice IQR i liczby wartości odstających pochodzą z silnika statystyk (eda_stats)
 print("\nWartości odstające (metoda IQR):")
+if stats_method == 'sketch':
+    print("(kwartyle ze szkicu KLL - granice i liczby wartości odstających są przybliżone)")
 for feature in numerical_features:
-    outliers, lower, upper = detect_outliers_iqr(df, feature)
+    lower = stats_all.at[feature, 'lower_bound']
+    upper = stats_all.at[feature, 'upper_bound']
+    n_outliers = int(stats_all.at[feature, 'n_outliers'])
     print(f"\n{feature}:")
     print(f"  Zakres normalny: [{lower:.2f}, {upper:.2f}]")
-    print(f"  Liczba wartości odstających: {len(outliers)} ({len(outliers)/len(df)*100:.2f}%)")
+    print(f"  Liczba wartości odstających: {n_outliers} ({n_outliers/len(df)*100:.2f}%)")
 
 # ============================================================================
 # 8. ANALIZA CECH BINARNYCH W KONTEKŚCIE DEATH_EVENT
@@ -342,12 +364,15 @@ print("\n" + "="*80)
 print("ANALIZA CECH BINARNYCH W KONTEKŚCIE DEATH_EVENT")
 print("="*80)
 
+# Testy chi-kwadrat (Fishera dla małych liczności) dla wszystkich tabel naraz
+binary_tests = chi2_tables(eda_state.contingency.counts, eda_state.contingency.features)
+
 fig, axes = plt.subplots(2, 3, figsize=(18, 10))
 axes = axes.ravel()
 
 for idx, feature in enumerate(binary_features):
     # Tabela kontyngencji
-    contingency_table = pd.crosstab(df[feature], df['DEATH_EVENT'])
+    contingency_table = eda_state.contingency.table(feature)
     
     # Wykres słupkowy zgrupowany
     contingency_table.plot(kind='bar', ax=axes[idx], color=['#2ecc71', '#e74c3c'], width=0.7)
@@ -358,10 +383,8 @@ for idx, feature in enumerate(binary_features):
     axes[idx].grid(axis='y', alpha=0.3)
     axes[idx].set_xticklabels(feature_labels[feature], rotation=0)
     
-    # Test chi-kwadrat
-    chi2, p_value, dof, expected = stats.chi2_contingency(contingency_table)
-    significance = "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*" if p_value < 0.05 else "ns"
-    axes[idx].text(0.5, 0.95, f'χ²={chi2:.2f}, p={p_value:.4f} {significance}',
+    # Test chi-kwadrat (test Fishera przy małych licznościach oczekiwanych)
+    axes[idx].text(0.5, 0.95, test_label(binary_tests.loc[feature]),
                    transform=axes[idx].transAxes, ha='center', va='top',
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
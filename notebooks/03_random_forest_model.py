@@ -7,16 +7,16 @@ Data: 2025-12-29
 
 Cel: Reprodukcja modelu Random Forest z publikacji bazowej, zgodnie z metodyką:
 - Wybór cech: age, ejection_fraction, serum_creatinine (bez 'time' - target leakage)
-- Randomized Cross-Validation do optymalizacji hiperparametrów
+- Losowe przeszukiwanie hiperparametrów z successive halving (walidacja krzyżowa)
 - Ewaluacja z metrykami: Accuracy, Precision, Recall, F1-score, AUC-ROC
 - Porównanie z wynikami z publikacji
 """
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.model_selection import train_test_split, cross_val_score, RandomizedSearchCV, StratifiedKFold
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (udostępnia HalvingRandomSearchCV)
+from sklearn.model_selection import train_test_split, HalvingRandomSearchCV, StratifiedKFold
+from sklearn.base import clone
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_score, 
@@ -25,12 +25,12 @@ from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_s
 import warnings
 warnings.filterwarnings('ignore')
 
-# Konfiguracja matplotlib
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['font.size'] = 11
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['savefig.bbox'] = 'tight'
+from data_loader import load_data
+from bootstrap import bootstrap_metrics, N_RESAMPLES, METRIC_LABELS
+from curves import CurveStore
+from cross_validation import FoldCache, cross_validate_model
+from forest_search import WarmStartForestSearchCV, oob_metrics
+from scoring import save_model
 
 print("="*80)
 print("REPRODUKCJA MODELU RANDOM FOREST")
@@ -45,26 +45,7 @@ print("ETAP 1: WCZYTANIE I PRZYGOTOWANIE DANYCH")
 print("="*80)
 
 # Wczytanie danych
-df = pd.read_csv('../data/heart_failure_data.csv')
-
-# Mapowanie nazw kolumn
-column_mapping = {
-    'TIME': 'time',
-    'Event': 'DEATH_EVENT',
-    'Gender': 'sex',
-    'Smoking': 'smoking',
-    'Diabetes': 'diabetes',
-    'BP': 'high_blood_pressure',
-    'Anaemia': 'anaemia',
-    'Age': 'age',
-    'Ejection.Fraction': 'ejection_fraction',
-    'Sodium': 'serum_sodium',
-    'Creatinine': 'serum_creatinine',
-    'Pletelets': 'platelets',
-    'CPK': 'creatinine_phosphokinase'
-}
-
-df = df.rename(columns=column_mapping)
+df = load_data()
 
 print(f"\nRozmiar zbioru danych: {df.shape[0]} wierszy, {df.shape[1]} kolumn")
 print(f"Rozkład klasy celu: {df['DEATH_EVENT'].value_counts().to_dict()}")
@@ -124,7 +105,7 @@ print("\nOdchylenia standardowe po standaryzacji (zbiór treningowy):")
 print(np.std(X_train_scaled, axis=0))
 
 # ============================================================================
-# 4. OPTYMALIZACJA HIPERPARAMETRÓW - RANDOMIZED SEARCH CV
+# 4. OPTYMALIZACJA HIPERPARAMETRÓW - SUCCESSIVE HALVING
 # ============================================================================
 
 print("\n" + "="*80)
@@ -142,6 +123,19 @@ param_distributions = {
     'class_weight': ['balanced', 'balanced_subsample', None]
 }
 
+# Successive halving: wszystkie konfiguracje oceniane najpierw małym kosztem,
+# do kolejnej rundy przechodzi najlepsza 1/HALVING_FACTOR z większym zasobem:
+# - mały zbiór (potrzebny każdy wiersz treningowy): liczba drzew - las każdej
+#   pary (konfiguracja, fold) rośnie przyrostowo przez wartości n_estimators
+#   z przestrzeni i jest oceniany przy każdej z nich (WarmStartForestSearchCV);
+#   konfiguracje z bootstrap=True oceniane out-of-bag jednym lasem zamiast 5 foldów
+#   (halving osobno dla OOB i CV, ostateczny wybór z wyników 5-fold)
+# - duże kohorty od HALVING_SAMPLES_MIN_ROWS wierszy: liczba wierszy
+#   treningowych (1/9 -> 1/3 -> całość), n_estimators pozostaje hiperparametrem
+N_CANDIDATES = 100
+HALVING_FACTOR = 3
+HALVING_SAMPLES_MIN_ROWS = 20_000
+
 print("\nPrzestrzeń hiperparametrów:")
 for param, values in param_distributions.items():
     print(f"  {param}: {values}")
@@ -152,25 +146,67 @@ rf_base = RandomForestClassifier(random_state=42)
 # Stratified K-Fold (5 foldów) - zachowuje proporcje klas
 cv_strategy = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
 
-# Randomized Search CV
-print("\nRozpoczynanie Randomized Search CV...")
-print("Liczba iteracji: 100")
+# Randomized Search CV z successive halving
+print("\nRozpoczynanie losowego przeszukiwania (successive halving)...")
+print(f"Liczba konfiguracji: {N_CANDIDATES}")
 print("Strategia walidacji krzyżowej: Stratified 5-Fold")
 
-random_search = RandomizedSearchCV(
-    estimator=rf_base,
-    param_distributions=param_distributions,
-    n_iter=100,  # Liczba losowych kombinacji do przetestowania
-    cv=cv_strategy,
-    scoring='f1',  # Optymalizujemy F1-score (ważne przy niezbalansowaniu)
-    n_jobs=-1,  # Użyj wszystkich dostępnych rdzeni
-    random_state=42,
-    verbose=1
-)
+if len(X_train) >= HALVING_SAMPLES_MIN_ROWS:
+    print(f"Zasób: liczba wierszy treningowych ({len(X_train) // HALVING_FACTOR**2} -> {len(X_train)})")
+    random_search = HalvingRandomSearchCV(
+        estimator=rf_base,
+        param_distributions=param_distributions,
+        n_candidates=N_CANDIDATES,  # Liczba losowych kombinacji w pierwszej rundzie
+        factor=HALVING_FACTOR,
+        resource='n_samples',
+        max_resources=len(X_train),
+        min_resources=len(X_train) // HALVING_FACTOR**2,
+        aggressive_elimination=True,  # Dodatkowe rundy na minimalnym zasobie (do ostatniej trafia <= factor konfiguracji)
+        cv=cv_strategy,
+        scoring='f1',  # Optymalizujemy F1-score (ważne przy niezbalansowaniu)
+        return_train_score=False,
+        n_jobs=-1,  # Użyj wszystkich dostępnych rdzeni
+        random_state=42,
+        verbose=1
+    )
+else:
+    n_estimators_grid = param_distributions.pop('n_estimators')
+    print(f"Zasób: liczba drzew, las rośnie przyrostowo ({' -> '.join(map(str, n_estimators_grid))})")
+    random_search = WarmStartForestSearchCV(
+        estimator=rf_base,
+        param_distributions=param_distributions,
+        n_estimators=n_estimators_grid,
+        n_candidates=N_CANDIDATES,
+        factor=HALVING_FACTOR,
+        oob=True,  # Lasy z bootstrap: ocena OOB (jeden trening zamiast 5 foldów), finaliści OOB także 5-fold
+        cv=cv_strategy,
+        scoring='f1',  # Optymalizujemy F1-score (ważne przy niezbalansowaniu)
+        n_jobs=-1,  # Użyj wszystkich dostępnych rdzeni (wątki)
+        random_state=42,
+        verbose=1
+    )
 
 random_search.fit(X_train_scaled, y_train)
 
 print("\n✓ Optymalizacja zakończona!")
+print("\nRundy successive halving:")
+search_results = random_search.cv_results_
+for round_index, (n_candidates, n_resources) in enumerate(zip(random_search.n_candidates_,
+                                                              random_search.n_resources_)):
+    in_round = search_results['iter'] == round_index
+    # Wyniki CV i OOB mają różne obciążenie - najlepszy wynik osobno dla każdego protokołu
+    best = {}
+    if 'oob_test_score' in search_results:
+        oob_scores = search_results['oob_test_score'][in_round]
+        if not np.isnan(oob_scores).all():
+            best['OOB'] = np.nanmax(oob_scores)
+        cv_scores = search_results['mean_test_score'][in_round & search_results['cv_scored']]
+    else:
+        cv_scores = search_results['mean_test_score'][in_round]
+    if len(cv_scores):
+        best['CV'] = np.nanmax(cv_scores)
+    print(f"  Runda {round_index + 1}: {n_candidates:3d} konfiguracji, zasób={n_resources:5d}, najlepszy F1: "
+          + ", ".join(f"{protocol}={score:.4f}" for protocol, score in best.items()))
 print(f"\nNajlepsze parametry:")
 for param, value in random_search.best_params_.items():
     print(f"  {param}: {value}")
@@ -188,7 +224,7 @@ print("ETAP 5: TRENING FINALNEGO MODELU")
 print("="*80)
 
 print("\nTrening modelu Random Forest z optymalnymi hiperparametrami...")
-# Model już wytrenowany przez RandomizedSearchCV, ale możemy go ponownie wytrenować
+# Model już wytrenowany przez wyszukiwarkę (refit), ale możemy go ponownie wytrenować
 best_rf.fit(X_train_scaled, y_train)
 print("✓ Trening zakończony!")
 
@@ -220,6 +256,12 @@ print(f"Recall:    {recall:.4f} ({recall*100:.2f}%)")
 print(f"F1-score:  {f1:.4f} ({f1*100:.2f}%)")
 print(f"AUC-ROC:   {roc_auc:.4f}")
 
+# Przedziały ufności (zbiór testowy ma tylko kilkadziesiąt obserwacji)
+test_intervals = bootstrap_metrics(y_test, y_pred, y_pred_proba)
+print(f"\nPrzedziały ufności 95% (bootstrap BCa, {N_RESAMPLES} prób):")
+for metric, row in test_intervals.iterrows():
+    print(f"{METRIC_LABELS[metric] + ':':<11}[{row['ci_low']:.4f}, {row['ci_high']:.4f}]")
+
 # Macierz pomyłek
 cm = confusion_matrix(y_test, y_pred)
 print("\n" + "-"*80)
@@ -236,34 +278,56 @@ print("RAPORT KLASYFIKACJI")
 print("-"*80)
 print(classification_report(y_test, y_pred, target_names=['Przeżył', 'Zmarł']))
 
-# ============================================================================
-# 7. WALIDACJA KRZYŻOWA NA CAŁYM ZBIORZE
-# ============================================================================
+# Krzywe ROC/PR liczone raz, przy trenowaniu - 04 i wybór progu czytają gotowe tablice
+curve_store = CurveStore.from_scores(y_test, {'Random Forest': y_pred_proba})
 
-print("\n" + "="*80)
-print("ETAP 7: WALIDACJA KRZYŻOWA (5-FOLD)")
-print("="*80)
+print("\n" + "-"*80)
+print("WYBÓR PROGU DECYZYJNEGO (KRZYWE ROC/PR)")
+print("-"*80)
+for label, point in [('Maksymalny F1', curve_store.select_threshold('Random Forest', 'f1')),
+                     ('Statystyka Youdena', curve_store.select_threshold('Random Forest', 'youden')),
+                     ('Czułość >= 0.90', curve_store.select_threshold('Random Forest', min_recall=0.9))]:
+    print(f"{label + ':':<20} próg={point['threshold']:.4f}  recall={point['tpr']:.4f}  "
+          f"precision={point['precision']:.4f}  FPR={point['fpr']:.4f}")
 
-# Przygotowanie pełnego zbioru (znormalizowanego)
-X_full_scaled = scaler.fit_transform(X)
+# ============================================================================
+# 7. WALIDACJA NA CAŁYM ZBIORZE (OOB LUB 5-FOLD)
+# ============================================================================
 
-# 5-Fold Cross-Validation
-cv_scores_accuracy = cross_val_score(best_rf, X_full_scaled, y, cv=5, scoring='accuracy')
-cv_scores_f1 = cross_val_score(best_rf, X_full_scaled, y, cv=5, scoring='f1')
-cv_scores_roc_auc = cross_val_score(best_rf, X_full_scaled, y, cv=5, scoring='roc_auc')
+# Metryki walidacji (nazwy jak parametr scoring w sklearn)
+VALIDATION_METRICS = {'accuracy': 'Accuracy', 'f1': 'F1-score', 'roc_auc': 'AUC-ROC'}
 
-print("\nWyniki walidacji krzyżowej (5-Fold):")
-print(f"\nAccuracy:")
-print(f"  Średnia: {cv_scores_accuracy.mean():.4f} ± {cv_scores_accuracy.std():.4f}")
-print(f"  Poszczególne foldy: {cv_scores_accuracy}")
+# Las z bootstrap: ocena out-of-bag z jednego treningu na pełnym zbiorze (każdy wiersz
+# przewidują drzewa, które go nie widziały) zamiast 5 treningów na foldach
+validation_oob = best_rf.get_params()['bootstrap']
+validation_method = 'OUT-OF-BAG' if validation_oob else '5-FOLD'
 
-print(f"\nF1-score:")
-print(f"  Średnia: {cv_scores_f1.mean():.4f} ± {cv_scores_f1.std():.4f}")
-print(f"  Poszczególne foldy: {cv_scores_f1}")
+print("\n" + "="*80)
+print(f"ETAP 7: WALIDACJA NA CAŁYM ZBIORZE ({validation_method})")
+print("="*80)
 
-print(f"\nAUC-ROC:")
-print(f"  Średnia: {cv_scores_roc_auc.mean():.4f} ± {cv_scores_roc_auc.std():.4f}")
-print(f"  Poszczególne foldy: {cv_scores_roc_auc}")
+if validation_oob:
+    # Las na surowych cechach - bez skalera dopasowanego do całego zbioru, którego statystyki
+    # obejmowałyby wiersze oceniane out-of-bag (drzewa nie wymagają standaryzacji)
+    oob_rf = clone(best_rf).set_params(oob_score=True).fit(X.to_numpy(), y)
+    validation_scores = {metric: np.array([score]) for metric, score
+                         in oob_metrics(oob_rf, y, VALIDATION_METRICS).items()}
+else:
+    # 5-Fold Cross-Validation - jeden trening na fold, wszystkie metryki z jego predykcji;
+    # scaler dopasowywany w każdym foldzie tylko do części treningowej (FoldCache)
+    validation_folds = cross_validate_model(best_rf, X, y, cv=FoldCache(5, y), metrics=VALIDATION_METRICS,
+                                            preprocess=('selected', StandardScaler()))
+    validation_scores = {metric: validation_folds[metric].to_numpy() for metric in VALIDATION_METRICS}
+
+print(f"\nWyniki walidacji ({validation_method}):")
+for metric, label in VALIDATION_METRICS.items():
+    scores = validation_scores[metric]
+    print(f"\n{label}:")
+    if validation_oob:
+        print(f"  Wynik OOB: {scores[0]:.4f}")
+    else:
+        print(f"  Średnia: {scores.mean():.4f} ± {scores.std():.4f}")
+        print(f"  Poszczególne foldy: {scores}")
 
 # ============================================================================
 # 8. WAŻNOŚĆ CECH (FEATURE IMPORTANCE)
@@ -297,12 +361,13 @@ results = {
     'Test_Recall': recall,
     'Test_F1': f1,
     'Test_AUC_ROC': roc_auc,
-    'CV_Accuracy_Mean': cv_scores_accuracy.mean(),
-    'CV_Accuracy_Std': cv_scores_accuracy.std(),
-    'CV_F1_Mean': cv_scores_f1.mean(),
-    'CV_F1_Std': cv_scores_f1.std(),
-    'CV_AUC_ROC_Mean': cv_scores_roc_auc.mean(),
-    'CV_AUC_ROC_Std': cv_scores_roc_auc.std(),
+    'Validation_Method': validation_method,
+    'CV_Accuracy_Mean': validation_scores['accuracy'].mean(),
+    'CV_Accuracy_Std': None if validation_oob else validation_scores['accuracy'].std(),
+    'CV_F1_Mean': validation_scores['f1'].mean(),
+    'CV_F1_Std': None if validation_oob else validation_scores['f1'].std(),
+    'CV_AUC_ROC_Mean': validation_scores['roc_auc'].mean(),
+    'CV_AUC_ROC_Std': None if validation_oob else validation_scores['roc_auc'].std(),
     'Feature_Importances': dict(zip(feature_names, feature_importances))
 }
 
@@ -326,11 +391,18 @@ with open('../results/random_forest_results.txt', 'w', encoding='utf-8') as f:
     f.write(f"  Recall:    {recall:.4f}\n")
     f.write(f"  F1-score:  {f1:.4f}\n")
     f.write(f"  AUC-ROC:   {roc_auc:.4f}\n\n")
+
+    f.write(f"PRZEDZIAŁY UFNOŚCI 95% (BOOTSTRAP BCa, {N_RESAMPLES} PRÓB):\n")
+    for metric, row in test_intervals.iterrows():
+        f.write(f"  {METRIC_LABELS[metric] + ':':<11}[{row['ci_low']:.4f}, {row['ci_high']:.4f}]\n")
+    f.write("\n")
     
-    f.write("WALIDACJA KRZYŻOWA (5-FOLD):\n")
-    f.write(f"  Accuracy:  {cv_scores_accuracy.mean():.4f} ± {cv_scores_accuracy.std():.4f}\n")
-    f.write(f"  F1-score:  {cv_scores_f1.mean():.4f} ± {cv_scores_f1.std():.4f}\n")
-    f.write(f"  AUC-ROC:   {cv_scores_roc_auc.mean():.4f} ± {cv_scores_roc_auc.std():.4f}\n\n")
+    f.write(f"WALIDACJA NA CAŁYM ZBIORZE ({validation_method}):\n")
+    for metric, label in VALIDATION_METRICS.items():
+        scores = validation_scores[metric]
+        spread = "" if validation_oob else f" ± {scores.std():.4f}"
+        f.write(f"  {label + ':':<10} {scores.mean():.4f}{spread}\n")
+    f.write("\n")
     
     f.write("WAŻNOŚĆ CECH:\n")
     for name, importance in zip(feature_names, feature_importances):
@@ -343,9 +415,14 @@ np.save('../results/rf_y_test.npy', y_test)
 np.save('../results/rf_y_pred.npy', y_pred)
 np.save('../results/rf_y_pred_proba.npy', y_pred_proba)
 np.save('../results/rf_feature_importances.npy', feature_importances)
+curve_store.save('../results/rf_curves.npz')
 
 print("✓ Dane do wizualizacji zapisane")
 
+# Model do scoringu wsadowego (scoring.py)
+save_model(best_rf, scaler, selected_features)
+print("✓ Model zapisany do: results/rf_model.joblib, results/rf_model.forest")
+
 print("\n" + "="*80)
 print("REPRODUKCJA MODELU RANDOM FOREST ZAKOŃCZONA POMYŚLNIE")
 print("="*80)
@@ -10,9 +10,7 @@ Cel: Przetestowanie różnych technik inżynierii cech i porównanie z modelem b
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import (accuracy_score, precision_score, recall_score, 
@@ -20,31 +18,17 @@ from sklearn.metrics import (accuracy_score, precision_score, recall_score,
 import warnings
 warnings.filterwarnings('ignore')
 
+from data_loader import load_data
+from curves import CurveStore
+from cross_validation import FoldCache, cross_validate_model, summarize_folds, stratified_folds
+
 print("="*80)
 print("NOWE EKSPERYMENTY - INŻYNIERIA CECH")
 print("="*80)
 
 # Wczytanie danych
-df = pd.read_csv('../data/heart_failure_data.csv')
+df = load_data()
 print(f"\nRozmiar zbioru danych: {df.shape[0]} wierszy, {df.shape[1]} kolumn")
-
-# Mapowanie nazw kolumn
-column_mapping = {
-    'Age': 'age',
-    'Ejection.Fraction': 'ejection_fraction',
-    'Creatinine': 'serum_creatinine',
-    'Sodium': 'serum_sodium',
-    'CPK': 'creatinine_phosphokinase',
-    'Pletelets': 'platelets',
-    'BP': 'high_blood_pressure',
-    'Anaemia': 'anaemia',
-    'Diabetes': 'diabetes',
-    'Gender': 'sex',
-    'Smoking': 'smoking',
-    'TIME': 'time',
-    'Event': 'DEATH_EVENT'
-}
-df = df.rename(columns=column_mapping)
 print(f"Kolumny po mapowaniu: {list(df.columns)}")
 
 # Parametry stałe (z modelu bazowego)
@@ -67,6 +51,44 @@ BEST_PARAMS = {
 # Słownik do przechowywania wyników
 results = {}
 
+# Tabele foldów walidacji krzyżowej i ich podsumowania (średnia, std) dla eksperymentów
+cv_tables = []
+cv_summaries = {}
+
+y = df['DEATH_EVENT'].copy()
+
+# Jeden podział train/test dla wszystkich eksperymentów (te same indeksy co
+# train_test_split ze stratyfikacją); skalery dopasowywane tylko do części
+# treningowej, raz na parę (zestaw cech, skaler)
+holdout = FoldCache(StratifiedShuffleSplit(n_splits=1, test_size=TEST_SIZE, random_state=RANDOM_STATE), y)
+train_idx, test_idx = holdout.folds[0]
+y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+
+# Wspólny podział zbioru treningowego na foldy walidacji krzyżowej
+cv_cache = FoldCache(stratified_folds(CV_FOLDS, RANDOM_STATE), y_train)
+
+
+def cross_validate_experiment(name, features, scaler, X):
+    """
+    Walidacja krzyżowa eksperymentu na zbiorze treningowym
+
+    Skaler dopasowywany w każdym foldzie tylko do jego części treningowej
+    (cv_cache - wspólny dla eksperymentów z tym samym zestawem cech);
+    każdy fold trenowany raz.
+    Zwraca średnie i odchylenia metryk (klucze cv_<metryka>_mean/std).
+    """
+    folds = cross_validate_model(RandomForestClassifier(**BEST_PARAMS), X.iloc[train_idx], y_train,
+                                 cv=cv_cache, preprocess=(features, scaler))
+    cv_tables.append(folds.reset_index().assign(model=name))
+    summary = cv_summaries[name] = summarize_folds(folds)
+
+    print(f"\nWalidacja krzyżowa ({CV_FOLDS}-fold, zbiór treningowy):")
+    for metric, row in summary.iterrows():
+        print(f"  {metric + ':':<10} {row['mean']:.4f} ± {row['std']:.4f}")
+
+    return {f'cv_{metric}_{stat}': value for metric, row in summary.iterrows()
+            for stat, value in row.items()}
+
 # ============================================================================
 # EKSPERYMENT 0: MODEL BAZOWY (BASELINE)
 # ============================================================================
@@ -79,19 +101,11 @@ print("Normalizacja: StandardScaler")
 
 # Przygotowanie danych bazowych
 X_baseline = df[['age', 'ejection_fraction', 'serum_creatinine']].copy()
-y = df['DEATH_EVENT'].copy()
 print(f"\nKształt X_baseline: {X_baseline.shape}")
 print(f"Kształt y: {y.shape}")
 
-# Podział
-X_train_base, X_test_base, y_train, y_test = train_test_split(
-    X_baseline, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-)
-
-# Standaryzacja
-scaler_base = StandardScaler()
-X_train_base_scaled = scaler_base.fit_transform(X_train_base)
-X_test_base_scaled = scaler_base.transform(X_test_base)
+# Podział i standaryzacja (scaler dopasowany do części treningowej)
+(X_train_base_scaled, X_test_base_scaled), = holdout.transformed('base', StandardScaler(), X_baseline)
 
 # Trening
 rf_baseline = RandomForestClassifier(**BEST_PARAMS)
@@ -119,6 +133,8 @@ print(f"  Recall:    {results['Baseline']['recall']:.4f}")
 print(f"  F1-score:  {results['Baseline']['f1']:.4f}")
 print(f"  AUC-ROC:   {results['Baseline']['auc']:.4f}")
 
+results['Baseline'].update(cross_validate_experiment('Baseline', 'base', StandardScaler(), X_baseline))
+
 # ============================================================================
 # EKSPERYMENT 1: DYSKRETYZACJA CECH
 # ============================================================================
@@ -149,9 +165,10 @@ X_discrete['ef_cat'] = pd.cut(
 
 # Dyskretyzacja Serum Creatinine (kreatynina)
 # Przedziały: norma (0.5-1.2), podwyższony (1.2-3.0), wysoki (>3.0)
+# Progi w precyzji kolumny (float32), aby wartość 1.2 trafiła do przedziału "norma"
 X_discrete['creat_cat'] = pd.cut(
     X_discrete['serum_creatinine'], 
-    bins=[0, 1.2, 3.0, 10], 
+    bins=np.array([0, 1.2, 3.0, 10], dtype=X_discrete['serum_creatinine'].dtype), 
     labels=[0, 1, 2]
 ).astype(int)
 
@@ -163,15 +180,8 @@ print(f"Age categories: {X_discrete_only['age_cat'].value_counts().sort_index().
 print(f"EF categories: {X_discrete_only['ef_cat'].value_counts().sort_index().to_dict()}")
 print(f"Creatinine categories: {X_discrete_only['creat_cat'].value_counts().sort_index().to_dict()}")
 
-# Podział
-X_train_disc, X_test_disc, _, _ = train_test_split(
-    X_discrete_only, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-)
-
-# Standaryzacja (nawet dla kategorii, dla spójności)
-scaler_disc = StandardScaler()
-X_train_disc_scaled = scaler_disc.fit_transform(X_train_disc)
-X_test_disc_scaled = scaler_disc.transform(X_test_disc)
+# Podział i standaryzacja (nawet dla kategorii, dla spójności)
+(X_train_disc_scaled, X_test_disc_scaled), = holdout.transformed('discrete', StandardScaler(), X_discrete_only)
 
 # Trening
 rf_discrete = RandomForestClassifier(**BEST_PARAMS)
@@ -199,6 +209,8 @@ print(f"  Recall:    {results['Discretization']['recall']:.4f}")
 print(f"  F1-score:  {results['Discretization']['f1']:.4f}")
 print(f"  AUC-ROC:   {results['Discretization']['auc']:.4f}")
 
+results['Discretization'].update(cross_validate_experiment('Discretization', 'discrete', StandardScaler(), X_discrete_only))
+
 # ============================================================================
 # EKSPERYMENT 2: CECHY INTERAKCYJNE
 # ============================================================================
@@ -212,22 +224,16 @@ print("Dodanie cech reprezentujących interakcje między zmiennymi")
 X_interact = df[['age', 'ejection_fraction', 'serum_creatinine']].copy()
 
 # Tworzenie cech interakcyjnych
+# (iloczyn dwóch kolumn uint8 przekracza zakres typu - rzutowanie na float32)
 X_interact['age_x_creat'] = X_interact['age'] * X_interact['serum_creatinine']
-X_interact['ef_x_sodium'] = df['ejection_fraction'] * df['serum_sodium']
+X_interact['ef_x_sodium'] = df['ejection_fraction'].astype('float32') * df['serum_sodium']
 X_interact['age_x_ef'] = X_interact['age'] * X_interact['ejection_fraction']
 
 print(f"\nCechy: {list(X_interact.columns)}")
 print(f"Liczba cech: {X_interact.shape[1]}")
 
-# Podział
-X_train_int, X_test_int, _, _ = train_test_split(
-    X_interact, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-)
-
-# Standaryzacja
-scaler_int = StandardScaler()
-X_train_int_scaled = scaler_int.fit_transform(X_train_int)
-X_test_int_scaled = scaler_int.transform(X_test_int)
+# Podział i standaryzacja
+(X_train_int_scaled, X_test_int_scaled), = holdout.transformed('interact', StandardScaler(), X_interact)
 
 # Trening
 rf_interact = RandomForestClassifier(**BEST_PARAMS)
@@ -255,6 +261,8 @@ print(f"  Recall:    {results['Interactions']['recall']:.4f}")
 print(f"  F1-score:  {results['Interactions']['f1']:.4f}")
 print(f"  AUC-ROC:   {results['Interactions']['auc']:.4f}")
 
+results['Interactions'].update(cross_validate_experiment('Interactions', 'interact', StandardScaler(), X_interact))
+
 # Feature importance dla interakcji
 feature_imp_int = rf_interact.feature_importances_
 print(f"\nWażność cech (z interakcjami):")
@@ -270,14 +278,8 @@ print("EKSPERYMENT 3: MINMAX NORMALIZACJA")
 print("="*80)
 print("Użycie MinMaxScaler zamiast StandardScaler")
 
-# Użycie tych samych cech bazowych
-X_train_mm = X_train_base.copy()
-X_test_mm = X_test_base.copy()
-
-# MinMax normalizacja
-scaler_mm = MinMaxScaler()
-X_train_mm_scaled = scaler_mm.fit_transform(X_train_mm)
-X_test_mm_scaled = scaler_mm.transform(X_test_mm)
+# Te same cechy bazowe i podział, MinMax normalizacja
+(X_train_mm_scaled, X_test_mm_scaled), = holdout.transformed('base', MinMaxScaler(), X_baseline)
 
 # Trening
 rf_minmax = RandomForestClassifier(**BEST_PARAMS)
@@ -305,6 +307,8 @@ print(f"  Recall:    {results['MinMax']['recall']:.4f}")
 print(f"  F1-score:  {results['MinMax']['f1']:.4f}")
 print(f"  AUC-ROC:   {results['MinMax']['auc']:.4f}")
 
+results['MinMax'].update(cross_validate_experiment('MinMax', 'base', MinMaxScaler(), X_baseline))
+
 # ============================================================================
 # EKSPERYMENT 4: WSZYSTKIE CECHY + INTERAKCJE
 # ============================================================================
@@ -323,20 +327,13 @@ X_all = df[all_features].copy()
 
 # Dodanie interakcji
 X_all['age_x_creat'] = X_all['age'] * X_all['serum_creatinine']
-X_all['ef_x_sodium'] = X_all['ejection_fraction'] * X_all['serum_sodium']
+X_all['ef_x_sodium'] = X_all['ejection_fraction'].astype('float32') * X_all['serum_sodium']
 X_all['age_x_ef'] = X_all['age'] * X_all['ejection_fraction']
 
 print(f"\nLiczba cech: {X_all.shape[1]}")
 
-# Podział
-X_train_all, X_test_all, _, _ = train_test_split(
-    X_all, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-)
-
-# Standaryzacja
-scaler_all = StandardScaler()
-X_train_all_scaled = scaler_all.fit_transform(X_train_all)
-X_test_all_scaled = scaler_all.transform(X_test_all)
+# Podział i standaryzacja
+(X_train_all_scaled, X_test_all_scaled), = holdout.transformed('all', StandardScaler(), X_all)
 
 # Trening
 rf_all = RandomForestClassifier(**BEST_PARAMS)
@@ -364,6 +361,8 @@ print(f"  Recall:    {results['All_Features']['recall']:.4f}")
 print(f"  F1-score:  {results['All_Features']['f1']:.4f}")
 print(f"  AUC-ROC:   {results['All_Features']['auc']:.4f}")
 
+results['All_Features'].update(cross_validate_experiment('All_Features', 'all', StandardScaler(), X_all))
+
 # Top 10 cech
 feature_imp_all = rf_all.feature_importances_
 top_10_idx = np.argsort(feature_imp_all)[-10:][::-1]
@@ -386,6 +385,12 @@ comparison_df = comparison_df.round(4)
 
 print("\n" + comparison_df.to_string())
 
+# Walidacja krzyżowa (średnia ± std z foldów zbioru treningowego)
+cv_summary = pd.DataFrame({name: summary['mean'].map('{:.4f}'.format) + ' ± ' + summary['std'].map('{:.4f}'.format)
+                           for name, summary in cv_summaries.items()}).T
+print(f"\nWalidacja krzyżowa ({CV_FOLDS}-fold, zbiór treningowy):")
+print(cv_summary.to_string())
+
 # Zapisanie wyników
 comparison_df.to_csv('../results/feature_engineering_comparison.csv')
 print("\n✓ Zapisano: results/feature_engineering_comparison.csv")
@@ -396,6 +401,11 @@ with open('../results/feature_engineering_details.json', 'w') as f:
     json.dump(results, f, indent=2)
 print("✓ Zapisano: results/feature_engineering_details.json")
 
+# Wyniki poszczególnych foldów (wiersz na eksperyment x fold)
+cv_folds_df = pd.concat(cv_tables, ignore_index=True).set_index(['model', 'fold'])
+cv_folds_df.to_csv('../results/fe_cv_folds.csv')
+print("✓ Zapisano: results/fe_cv_folds.csv")
+
 # Zapisanie predykcji dla najlepszego modelu
 best_model_name = comparison_df['f1'].idxmax()
 print(f"\n🏆 Najlepszy model (F1-score): {best_model_name}")
@@ -418,6 +428,17 @@ np.save('../results/fe_minmax_proba.npy', y_pred_proba_mm)
 np.save('../results/fe_all_pred.npy', y_pred_all)
 np.save('../results/fe_all_proba.npy', y_pred_proba_all)
 
+# Krzywe ROC/PR wszystkich wariantów z jednego sortowania (czytane przez 06)
+curve_store = CurveStore.from_scores(y_test, {
+    'Baseline': y_pred_proba_base,
+    'Discretization': y_pred_proba_disc,
+    'Interactions': y_pred_proba_int,
+    'MinMax': y_pred_proba_mm,
+    'All_Features': y_pred_proba_all
+})
+curve_store.save('../results/fe_curves.npz')
+print("✓ Zapisano: results/fe_curves.npz")
+
 print("\n" + "="*80)
 print("EKSPERYMENTY ZAKOŃCZONE POMYŚLNIE")
 print("="*80)
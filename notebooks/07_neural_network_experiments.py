@@ -20,6 +20,9 @@ from sklearn.metrics import (accuracy_score, precision_score, recall_score,
 import warnings
 warnings.filterwarnings('ignore')
 
+from data_loader import load_data
+from cross_validation import CV_FOLDS, cross_validate_model, summarize_folds, stratified_folds
+
 # Ustawienie seed dla reprodukowalności
 np.random.seed(42)
 tf.random.set_seed(42)
@@ -30,25 +33,7 @@ print("="*80)
 print(f"TensorFlow version: {tf.__version__}")
 
 # Wczytanie danych
-df = pd.read_csv('../data/heart_failure_data.csv')
-
-# Mapowanie nazw kolumn
-column_mapping = {
-    'Age': 'age',
-    'Ejection.Fraction': 'ejection_fraction',
-    'Creatinine': 'serum_creatinine',
-    'Sodium': 'serum_sodium',
-    'CPK': 'creatinine_phosphokinase',
-    'Pletelets': 'platelets',
-    'BP': 'high_blood_pressure',
-    'Anaemia': 'anaemia',
-    'Diabetes': 'diabetes',
-    'Gender': 'sex',
-    'Smoking': 'smoking',
-    'TIME': 'time',
-    'Event': 'DEATH_EVENT'
-}
-df = df.rename(columns=column_mapping)
+df = load_data()
 
 # Parametry stałe
 RANDOM_STATE = 42
@@ -368,6 +353,44 @@ np.save('../results/nn_best_pred.npy', y_pred)
 np.save('../results/nn_best_proba.npy', y_pred_proba)
 np.save('../results/nn_y_test.npy', y_test)
 
+# Walidacja krzyżowa najlepszej konfiguracji na zbiorze treningowym (te same foldy co w 05)
+def fit_predict_best_mlp(X_fold_train, y_fold_train, X_fold_test):
+    """
+    Trening najlepszej konfiguracji na foldzie: skaler i zbiór walidacyjny
+    (early stopping) wydzielane tylko z części treningowej foldu
+    """
+    X_fit, X_stop, y_fit, y_stop = train_test_split(
+        X_fold_train, y_fold_train, test_size=VALIDATION_SPLIT,
+        random_state=RANDOM_STATE, stratify=y_fold_train
+    )
+    fold_scaler = StandardScaler().fit(X_fit)
+    model = build_model(architecture=[128, 64], activation='relu', dropout_rate=0.3, l2_reg=0.01)
+    model.compile(optimizer=keras.optimizers.Adam(learning_rate=0.001), loss='binary_crossentropy')
+    model.fit(
+        fold_scaler.transform(X_fit), y_fit,
+        validation_data=(fold_scaler.transform(X_stop), y_stop),
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        callbacks=[callbacks.EarlyStopping(monitor='val_loss', patience=15, restore_best_weights=True)],
+        verbose=0
+    )
+    proba = model.predict(fold_scaler.transform(X_fold_test), verbose=0).flatten()
+    return (proba > 0.5).astype(int), proba
+
+# Modele Keras trenowane kolejno w jednym procesie (n_jobs=1)
+cv_folds = cross_validate_model(fit_predict_best_mlp, X_train_full, y_train_full,
+                                cv=stratified_folds(CV_FOLDS, RANDOM_STATE), n_jobs=1)
+cv_summary = summarize_folds(cv_folds)
+results['Best_MLP'].update({f'cv_{metric}_{stat}': value for metric, row in cv_summary.iterrows()
+                            for stat, value in row.items()})
+
+print(f"\nWalidacja krzyżowa ({CV_FOLDS}-fold, zbiór treningowy):")
+for metric, row in cv_summary.iterrows():
+    print(f"  {metric + ':':<10} {row['mean']:.4f} ± {row['std']:.4f}")
+
+cv_folds.to_csv('../results/nn_cv_folds.csv')
+print("✓ Zapisano: results/nn_cv_folds.csv")
+
 # ============================================================================
 # PODSUMOWANIE I PORÓWNANIE Z RANDOM FOREST
 # ============================================================================
@@ -0,0 +1,77 @@
+"""
+Przedziały ufności metryk wszystkich modeli - bootstrap
+=======================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Ocena niepewności metryk na zbiorze testowym (60 pacjentów) dla każdego
+modelu, którego predykcje zapisano w results/:
+- Random Forest (03): rf_y_test.npy, rf_y_pred.npy, rf_y_pred_proba.npy
+- Feature engineering (05): fe_y_test.npy, fe_<wariant>_pred.npy, fe_<wariant>_proba.npy
+- Sieci neuronowe (07): nn_y_test.npy, nn_<wariant>_pred.npy, nn_<wariant>_proba.npy
+
+Dla każdego modelu: 10 000 prób bootstrap, przedziały BCa 95% dla Accuracy,
+Precision, Recall, F1-score i AUC-ROC. Wynik: results/bootstrap_confidence_intervals.csv
+"""
+
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from bootstrap import bootstrap_metrics, N_RESAMPLES, CONFIDENCE, METRIC_LABELS
+
+RESULTS_DIR = '../results'
+
+
+def find_models(results_dir=RESULTS_DIR):
+    """Zwraca słownik {nazwa modelu: (y_test, y_pred, y_proba)} dla plików .npy z results/"""
+    models = {}
+    rf_files = [os.path.join(results_dir, f'rf_{name}.npy') for name in ('y_test', 'y_pred', 'y_pred_proba')]
+    if all(os.path.exists(path) for path in rf_files):
+        models['rf'] = tuple(np.load(path) for path in rf_files)
+
+    for prefix in ('fe', 'nn'):
+        y_test_path = os.path.join(results_dir, f'{prefix}_y_test.npy')
+        if not os.path.exists(y_test_path):
+            continue
+        y_test = np.load(y_test_path)
+        for pred_path in sorted(glob.glob(os.path.join(results_dir, f'{prefix}_*_pred.npy'))):
+            variant = os.path.basename(pred_path)[len(prefix) + 1:-len('_pred.npy')]
+            proba_path = os.path.join(results_dir, f'{prefix}_{variant}_proba.npy')
+            y_proba = np.load(proba_path) if os.path.exists(proba_path) else None
+            models[f'{prefix}_{variant}'] = (y_test, np.load(pred_path), y_proba)
+    return models
+
+
+if __name__ == '__main__':
+    print("="*80)
+    print("PRZEDZIAŁY UFNOŚCI METRYK - BOOTSTRAP")
+    print("="*80)
+
+    models = find_models()
+    print(f"\nZnalezione modele: {len(models)}")
+    print(f"Liczba prób bootstrap: {N_RESAMPLES}, poziom ufności: {CONFIDENCE:.0%}, metoda: BCa")
+
+    start = time.perf_counter()
+    tables = {}
+    for name, (y_test, y_pred, y_proba) in models.items():
+        tables[name] = bootstrap_metrics(y_test, y_pred, y_proba)
+    elapsed = time.perf_counter() - start
+
+    results = pd.concat(tables, names=['model'])
+    results.to_csv(os.path.join(RESULTS_DIR, 'bootstrap_confidence_intervals.csv'))
+
+    for name, table in tables.items():
+        print("\n" + "-"*80)
+        print(f"MODEL: {name} (n = {len(models[name][0])})")
+        print("-"*80)
+        for metric, row in table.iterrows():
+            print(f"  {METRIC_LABELS[metric] + ':':<11}{row['estimate']:.4f}  "
+                  f"[{row['ci_low']:.4f}, {row['ci_high']:.4f}]  (SE {row['std_error']:.4f})")
+
+    print(f"\n✓ Czas obliczeń: {elapsed:.2f} s")
+    print("✓ Zapisano: results/bootstrap_confidence_intervals.csv")
@@ -0,0 +1,144 @@
+"""
+Benchmark predykcji lasu: sklearn a płaska reprezentacja
+========================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Pomiar opóźnienia predykcji zapisanego modelu (results/rf_model.joblib
+i artefakt results/rf_model.forest):
+1. Pojedynczy wiersz - mediana z wielu wywołań (scoring na żądanie)
+2. Duża porcja (domyślnie 1 mln wierszy syntetycznych, synthetic_data.py)
+   - mediana z kilku wywołań (scoring wsadowy)
+3. Kontrola zgodności: prawdopodobieństwa FlatForest identyczne bitowo
+   z RandomForestClassifier.predict_proba dla wszystkich wierszy, także
+   scoring.predict_proba na artefakcie (standaryzacja + las) wobec sklearn
+4. Wczytanie modelu: joblib (pickle) a artefakt mapowany w pamięci; pamięć
+   mapowania artefaktu w kilku równoległych procesach (część prywatna
+   powinna być zerowa - strony współdzielone)
+
+Użycie:
+    python benchmark_inference.py [--rows N] [--workers N]
+    (kod wyjścia 1, jeśli wyniki nie są identyczne)
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from data_loader import load_data
+from flat_forest import FlatForest
+from model_artifact import mapping_memory
+from scoring import ARTIFACT_PATH, MODEL_PATH, load_estimator, load_model, predict_proba
+from synthetic_data import SyntheticGenerator
+
+BATCH_ROWS = 1_000_000
+SINGLE_ROW_REPEATS = 200
+BATCH_REPEATS = 3
+LOAD_REPEATS = 20
+WORKERS = 4
+
+
+def median_time(function, repeats):
+    """Mediana czasu wywołania (sekundy)"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def synthetic_rows(n_rows):
+    """Ramka wierszy syntetycznych (kanoniczne nazwy kolumn)"""
+    return SyntheticGenerator().fit(load_data()).sample(n_rows, np.random.default_rng(0))
+
+
+def worker_load(path, frame, barrier, queue):
+    """Proces scoringu: wczytanie artefaktu, predykcja, pomiar pamięci przy wszystkich procesach aktywnych"""
+    start = time.perf_counter()
+    bundle = load_model(path)
+    load_time = time.perf_counter() - start
+    predict_proba(bundle, frame)
+    barrier.wait()
+    queue.put((load_time, mapping_memory(path)))
+    barrier.wait()
+
+
+if __name__ == '__main__':
+    import multiprocessing
+
+    args = sys.argv[1:]
+    options = {'--rows': BATCH_ROWS, '--workers': WORKERS}
+    for option in options:
+        if option in args:
+            index = args.index(option)
+            options[option] = int(args[index + 1])
+            del args[index:index + 2]
+    n_rows, n_workers = options['--rows'], options['--workers']
+
+    estimator = load_estimator(MODEL_PATH)
+    forest = estimator['model']
+    artifact = load_model(ARTIFACT_PATH)
+
+    print("="*80)
+    print("BENCHMARK PREDYKCJI LASU: SKLEARN A FLATFOREST")
+    print("="*80)
+
+    start = time.perf_counter()
+    engine = FlatForest.from_sklearn(forest)
+    print(f"\nLas: {len(forest.estimators_)} drzew, {engine.n_nodes} węzłów, głębokość {engine.max_depth}")
+    print(f"Eksport do tablic: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    frame = synthetic_rows(n_rows)
+    X = estimator['scaler'].transform(frame[estimator['features']])
+    row = X[:1]
+
+    sklearn_proba = forest.predict_proba(X)[:, 1]
+    identical = (np.array_equal(sklearn_proba, engine.predict_proba(X))
+                 and np.array_equal(sklearn_proba, predict_proba(artifact, frame)))
+
+    timings = {
+        '1 wiersz': (median_time(lambda: forest.predict_proba(row), SINGLE_ROW_REPEATS),
+                     median_time(lambda: engine.predict_proba(row), SINGLE_ROW_REPEATS)),
+        f'{n_rows:,} wierszy': (median_time(lambda: forest.predict_proba(X), BATCH_REPEATS),
+                               median_time(lambda: engine.predict_proba(X), BATCH_REPEATS)),
+    }
+
+    print(f"\n{'Porcja':<18} {'sklearn':>12} {'FlatForest':>12} {'Przyspieszenie':>15}")
+    for label, (sklearn_time, flat_time) in timings.items():
+        print(f"{label:<18} {sklearn_time * 1000:>9.2f} ms {flat_time * 1000:>9.2f} ms "
+              f"{sklearn_time / flat_time:>14.1f}x")
+
+    # Wczytanie modelu: pickle a mapowanie pliku
+    joblib_time = median_time(lambda: load_estimator(MODEL_PATH), LOAD_REPEATS)
+    artifact_time = median_time(lambda: load_model(ARTIFACT_PATH), LOAD_REPEATS)
+    print(f"\nWczytanie modelu (mediana z {LOAD_REPEATS}):")
+    print(f"  joblib ({os.path.getsize(MODEL_PATH) / 1024:.0f} KB):   {joblib_time * 1000:8.2f} ms")
+    print(f"  artefakt ({os.path.getsize(ARTIFACT_PATH) / 1024:.0f} KB): {artifact_time * 1000:8.2f} ms")
+
+    # Procesy scoringu mapujące ten sam plik (start 'spawn' - niezależne procesy jak w kontenerach)
+    context = multiprocessing.get_context('spawn')
+    barrier, queue = context.Barrier(n_workers), context.Queue()
+    workers = [context.Process(target=worker_load, args=(ARTIFACT_PATH, frame.iloc[:10_000], barrier, queue))
+               for _ in range(n_workers)]
+    for worker in workers:
+        worker.start()
+    reports = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    print(f"\nProcesy scoringu ({n_workers}) z jednym plikiem artefaktu:")
+    for i, (load_time, memory) in enumerate(reports):
+        memory_text = ("pamięć mapowania niedostępna" if memory is None else
+                       f"mapowanie: {memory['rss']} kB, w tym współdzielone {memory['shared']} kB, "
+                       f"prywatne {memory['private']} kB")
+        print(f"  proces {i + 1}: wczytanie {load_time * 1000:.2f} ms, {memory_text}")
+
+    print("\n" + "="*80)
+    print(f"✓ Wyniki identyczne bitowo ({n_rows:,} wierszy)" if identical
+          else "✗ WYNIKI RÓŻNE OD SKLEARN")
+    print("="*80)
+    sys.exit(0 if identical else 1)
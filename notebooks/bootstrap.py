@@ -0,0 +1,254 @@
+"""
+Przedziały ufności metodą bootstrap
+===================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Niepewność statystyk EDA i metryk modeli (zbiór testowy to tylko 60 wierszy):
+1. Wszystkie indeksy prób bootstrap losowane naraz jako macierz całkowita
+   (liczba prób x liczba wierszy)
+2. Statystyki (mean, median, AUC, F1, recall, precision, accuracy) liczone
+   wektorowo dla wszystkich prób z bloku macierzy naraz - AUC z jednego
+   sortowania wyników modelu i liczności wierszy w każdej próbie
+3. Bloki prób rozdzielane na procesy (joblib)
+4. Przedziały percentylowe lub BCa (z poprawką obciążenia i przyspieszeniem
+   wyznaczonym metodą jackknife)
+
+Użycie:
+    from bootstrap import bootstrap_metrics
+    intervals = bootstrap_metrics(y_test, y_pred, y_pred_proba)
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import stats
+
+# Domyślna liczba prób bootstrap i poziom ufności
+N_RESAMPLES = 10_000
+CONFIDENCE = 0.95
+
+# Liczba prób w jednym bloku (jedno zadanie dla procesu)
+BOOTSTRAP_BLOCK = 2_000
+
+# Powyżej tej liczby wierszy jackknife dla BCa usuwa grupy wierszy zamiast pojedynczych
+JACKKNIFE_GROUPS = 1_000
+
+# Nazwy metryk w raportach
+METRIC_LABELS = {
+    'accuracy': 'Accuracy',
+    'precision': 'Precision',
+    'recall': 'Recall',
+    'f1': 'F1-score',
+    'auc': 'AUC-ROC'
+}
+
+
+def resample_indices(n, n_resamples=N_RESAMPLES, random_state=42):
+    """Macierz indeksów prób bootstrap (n_resamples x n) losowanych ze zwracaniem"""
+    rng = np.random.default_rng(random_state)
+    dtype = np.int32 if n < 2**31 else np.int64
+    return rng.integers(0, n, size=(n_resamples, n), dtype=dtype)
+
+
+def _row_counts(indices, n):
+    """Liczba wystąpień każdego wiersza w każdej próbie (próby x wiersze)"""
+    n_resamples = indices.shape[0]
+    offsets = np.arange(n_resamples, dtype=np.int64)[:, None] * n
+    return np.bincount((indices + offsets).ravel(), minlength=n_resamples * n).reshape(n_resamples, n)
+
+
+# ============================================================================
+# STATYSTYKI LICZONE DLA WSZYSTKICH PRÓB NARAZ
+# ============================================================================
+
+def _mean(indices, values):
+    return values[indices].mean(axis=1)
+
+
+def _median(indices, values):
+    return np.median(values[indices], axis=1)
+
+
+def _confusion(indices, y_true, y_pred):
+    true, pred = y_true[indices], y_pred[indices]
+    tp = (true & pred).sum(axis=1)
+    fp = (~true & pred).sum(axis=1)
+    fn = (true & ~pred).sum(axis=1)
+    return tp, fp, fn, indices.shape[1]
+
+
+def _ratio(numerator, denominator):
+    # Jak w sklearn (zero_division=0): 0 gdy mianownik jest zerowy
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+
+def _accuracy(indices, y_true, y_pred):
+    return (y_true[indices] == y_pred[indices]).mean(axis=1)
+
+
+def _precision(indices, y_true, y_pred):
+    tp, fp, fn, n = _confusion(indices, y_true, y_pred)
+    return _ratio(tp, tp + fp)
+
+
+def _recall(indices, y_true, y_pred):
+    tp, fp, fn, n = _confusion(indices, y_true, y_pred)
+    return _ratio(tp, tp + fn)
+
+
+def _f1(indices, y_true, y_pred):
+    tp, fp, fn, n = _confusion(indices, y_true, y_pred)
+    return _ratio(2 * tp, 2 * tp + fp + fn)
+
+
+def _auc(indices, y_true, y_score):
+    """
+    AUC-ROC wszystkich prób z jednego sortowania wyników
+
+    Próba bootstrap to wielozbiór wierszy oryginalnych, więc wystarczą liczności
+    wierszy w próbie. Dla każdej grupy równych wyników: AUC = suma po pozytywnych
+    (liczba negatywnych z niższym wynikiem + połowa remisów) / (n_pos * n_neg).
+    """
+    order = np.argsort(y_score, kind='stable')
+    sorted_score = y_score[order]
+    positive = y_true[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_score[1:] != sorted_score[:-1]])
+
+    counts = _row_counts(indices, len(y_score))[:, order]
+    n_positive = np.add.reduceat(counts * positive, group_starts, axis=1)
+    n_negative = np.add.reduceat(counts * ~positive, group_starts, axis=1)
+    negative_below = np.cumsum(n_negative, axis=1) - n_negative
+
+    pairs = n_positive.sum(axis=1) * n_negative.sum(axis=1)
+    wins = (n_positive * (negative_below + 0.5 * n_negative)).sum(axis=1)
+    # Próba z jedną klasą nie ma zdefiniowanego AUC
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(pairs > 0, wins / pairs, np.nan)
+
+
+STATISTICS = {
+    'mean': _mean,
+    'median': _median,
+    'accuracy': _accuracy,
+    'precision': _precision,
+    'recall': _recall,
+    'f1': _f1,
+    'auc': _auc
+}
+
+
+def _evaluate(statistics, arrays, indices):
+    """Wartości wszystkich statystyk dla bloku prób (statystyki x próby)"""
+    return np.array([STATISTICS[name](indices, *arrays[name]) for name in statistics])
+
+
+def _jackknife(statistics, arrays, n):
+    """
+    Wartości jackknife (statystyki x grupy) - pominięcie jednego wiersza,
+    a dla dużych zbiorów kolejnych grup wierszy (najwyżej JACKKNIFE_GROUPS grup)
+    """
+    size = -(-n // min(n, JACKKNIFE_GROUPS))
+    n_groups = n // size
+    kept = np.arange(n - size)
+    values = []
+    # Bloki grup tak, aby macierz indeksów miała najwyżej ~10^7 elementów
+    step = max(1, 10**7 // n)
+    for start in range(0, n_groups, step):
+        groups = np.arange(start, min(start + step, n_groups))[:, None]
+        # Pominięcie grupy g = wierszy [g*size, (g+1)*size)
+        values.append(_evaluate(statistics, arrays, kept + size * (kept >= size * groups)))
+    if n % size:
+        values.append(_evaluate(statistics, arrays, np.arange(n_groups * size)[None, :]))
+    return np.concatenate(values, axis=1)
+
+
+def _bca_levels(estimate, resampled, jackknife, alpha):
+    """Skorygowane poziomy kwantyli przedziału BCa dla jednej statystyki"""
+    resampled = resampled[~np.isnan(resampled)]
+    jackknife = jackknife[~np.isnan(jackknife)]
+    # Poprawka obciążenia (część prób poniżej estymatora, remisy liczone po połowie)
+    below = (np.sum(resampled < estimate) + 0.5 * np.sum(resampled == estimate)) / len(resampled)
+    z0 = stats.norm.ppf(np.clip(below, 1e-10, 1 - 1e-10))
+    # Przyspieszenie z jackknife
+    deviation = jackknife.mean() - jackknife
+    denominator = 6 * np.sum(deviation ** 2) ** 1.5
+    acceleration = np.sum(deviation ** 3) / denominator if denominator > 0 else 0.0
+
+    z = stats.norm.ppf([alpha / 2, 1 - alpha / 2])
+    return stats.norm.cdf(z0 + (z0 + z) / (1 - acceleration * (z0 + z)))
+
+
+def bootstrap(statistics, arrays, n_resamples=N_RESAMPLES, confidence=CONFIDENCE,
+              method='bca', n_jobs=-1, random_state=42):
+    """
+    Przedziały ufności bootstrap dla wielu statystyk na wspólnych próbach
+
+    Args:
+        statistics: nazwy statystyk z STATISTICS
+        arrays: słownik {statystyka: krotka tablic}, np. {'auc': (y_true, y_score)}
+        method: 'bca' lub 'percentile'
+
+    Zwraca ramkę (wiersz = statystyka) z kolumnami: estimate, std_error,
+    ci_low, ci_high.
+    """
+    if method not in ('bca', 'percentile'):
+        raise ValueError(f"Nieznana metoda przedziału: {method} (dostępne: bca, percentile)")
+    statistics = list(statistics)
+    n = len(next(iter(arrays.values()))[0])
+    indices = resample_indices(n, n_resamples, random_state)
+
+    blocks = [indices[start:start + BOOTSTRAP_BLOCK] for start in range(0, n_resamples, BOOTSTRAP_BLOCK)]
+    resampled = np.concatenate(Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate)(statistics, arrays, block) for block in blocks
+    ), axis=1)
+    estimate = _evaluate(statistics, arrays, np.arange(n)[None, :])[:, 0]
+
+    alpha = 1 - confidence
+    if method == 'bca':
+        jackknife = _jackknife(statistics, arrays, n)
+        levels = [_bca_levels(estimate[i], resampled[i], jackknife[i], alpha)
+                  for i in range(len(statistics))]
+    else:
+        levels = [np.array([alpha / 2, 1 - alpha / 2])] * len(statistics)
+
+    intervals = np.array([np.nanquantile(values, level) for values, level in zip(resampled, levels)])
+    return pd.DataFrame({
+        'estimate': estimate,
+        'std_error': np.nanstd(resampled, axis=1, ddof=1),
+        'ci_low': intervals[:, 0],
+        'ci_high': intervals[:, 1]
+    }, index=pd.Index(statistics, name='statistic'))
+
+
+def bootstrap_metrics(y_true, y_pred, y_score=None, metrics=None, **kwargs):
+    """
+    Przedziały ufności metryk klasyfikacji na zbiorze testowym
+
+    Domyślnie: accuracy, precision, recall, f1 oraz auc (gdy podano y_score).
+    Pozostałe argumenty jak w bootstrap().
+    """
+    y_true = np.asarray(y_true).astype(bool)
+    y_pred = np.asarray(y_pred).astype(bool)
+    if metrics is None:
+        metrics = ['accuracy', 'precision', 'recall', 'f1'] + (['auc'] if y_score is not None else [])
+    arrays = {metric: (y_true, y_pred) for metric in metrics if metric != 'auc'}
+    if 'auc' in metrics:
+        arrays['auc'] = (y_true, np.asarray(y_score, dtype=np.float64))
+    return bootstrap(metrics, arrays, **kwargs)
+
+
+def bootstrap_columns(df, columns, statistics=('mean', 'median'), **kwargs):
+    """
+    Przedziały ufności średnich i median kolumn (np. cech numerycznych w EDA)
+
+    Wszystkie kolumny korzystają z tej samej macierzy indeksów prób.
+    Zwraca ramkę z indeksem (kolumna, statystyka).
+    """
+    tables = {}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        tables[column] = bootstrap(statistics, {name: (values,) for name in statistics}, **kwargs)
+    return pd.concat(tables, names=['feature'])
@@ -0,0 +1,309 @@
+"""
+Kompaktowa (skwantowana) reprezentacja lasu losowego
+=====================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Las z 03_random_forest_model.py w jak najmniejszej pamięci - wiele lasów
+(np. osobnych dla kohort) mieszczących się w pamięci podręcznej L2/L3 i RAM
+hostów scoringu:
+1. Progi jako kody przedziałów cech (uint16) względem krawędzi float32 - próg
+   zaokrąglony w dół do float32 daje dla wejścia float32 (jak w sklearn)
+   dokładnie te same porównania x <= próg, więc podziały są bezstratne
+2. Cecha i kierunek braków danych w jednym bajcie (uint8), lewe dziecko zawsze
+   w następnym węźle (kolejność budowy drzew sklearn), prawe jako przesunięcie
+   względem węzła (int16, int32 tylko przy bardzo dużych drzewach)
+3. Prawdopodobieństwa liści jako kody uint8 słownika do N_CODES wartości:
+   dokładne wartości, jeśli unikalnych jest najwyżej N_CODES, w przeciwnym razie
+   środki skwantowane jednowymiarowym algorytmem Lloyda (k-średnich)
+4. Kontrola równoważności z pełnym modelem (compare_predictions): największa
+   różnica prawdopodobieństw, odsetek zmienionych decyzji (próg 0.5) i różnice
+   accuracy/F1/ROC AUC na danych kohorty i wierszach syntetycznych
+
+Użycie:
+    from compact_forest import CompactForest
+    compact = CompactForest.from_flat(FlatForest.from_sklearn(best_rf))
+    proba = compact.predict_proba(X_scaled)
+
+    python compact_forest.py [--rows N]   (kod wyjścia 1, jeśli model nie jest równoważny)
+"""
+
+import sys
+
+import numpy as np
+
+from flat_forest import BLOCK_NODES, FeatureBins
+
+# Liczba wartości słownika prawdopodobieństw liści (kod uint8)
+N_CODES = 256
+
+# Bajt cechy: bity 0-6 - indeks cechy (LEAF_FEATURE - liść), bit 7 - brak danych do lewego dziecka
+LEAF_FEATURE = 0x7F
+MISSING_LEFT_BIT = 0x80
+
+# Kroki algorytmu Lloyda przy kwantyzacji słownika
+LLOYD_ITERATIONS = 20
+
+# Tablice zapisywane przez to_arrays
+COMPACT_ARRAYS = ('node_feature', 'split', 'right_offset', 'leaf_code', 'codebook', 'roots',
+                  'edges', 'edge_offsets')
+
+# Kryterium równoważności: metryki zgodne do 4 miejsc po przecinku
+METRIC_TOLERANCE = 5e-5
+
+
+def float32_floor(values):
+    """Największa liczba float32 nie większa od wartości float64"""
+    rounded = values.astype(np.float32)
+    above = rounded.astype(np.float64) > values
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+
+def quantize_values(values, n_codes=N_CODES, n_iter=LLOYD_ITERATIONS):
+    """
+    Słownik (rosnący, float64) i kody uint8 wartości
+
+    Przy najwyżej n_codes unikalnych wartościach słownik jest dokładny;
+    inaczej środki startowe w kwantylach i kroki Lloyda (przypisanie do
+    najbliższego środka przez punkty środkowe, środek jako średnia).
+    """
+    unique, inverse = np.unique(values, return_inverse=True)
+    if len(unique) <= n_codes:
+        return unique, inverse.astype(np.uint8)
+
+    # Start z kwantyli wartości unikalnych - n_codes różnych środków także przy wielu powtórzeniach
+    centers = np.quantile(unique, (np.arange(n_codes) + 0.5) / n_codes)
+    for _ in range(n_iter):
+        centers = np.unique(centers)
+        codes = np.searchsorted((centers[:-1] + centers[1:]) / 2, values)
+        counts = np.bincount(codes, minlength=len(centers))
+        sums = np.bincount(codes, weights=values, minlength=len(centers))
+        updated = np.where(counts > 0, sums / np.maximum(counts, 1), centers)
+        if np.array_equal(updated, centers):
+            break
+        centers = updated
+    centers = np.unique(centers)
+    codes = np.searchsorted((centers[:-1] + centers[1:]) / 2, values)
+    return centers, codes.astype(np.uint8)
+
+
+class CompactForest:
+    """
+    Las w skwantowanych tablicach węzłów (węzły wszystkich drzew jeden za drugim)
+
+    Args:
+        node_feature: cecha podziału i bit braku danych (uint8; LEAF_FEATURE - liść)
+        split: kod progu względem krawędzi cechy (uint16/uint32)
+        right_offset: przesunięcie prawego dziecka względem węzła (int16/int32)
+        leaf_code: kod prawdopodobieństwa klasy 1 w liściu (uint8)
+        codebook: prawdopodobieństwa odpowiadające kodom (float64)
+        roots: indeksy korzeni drzew
+        edges, edge_offsets: krawędzie przedziałów cech (float32) jak w FeatureBins
+        n_features: liczba cech wejściowych
+    """
+
+    def __init__(self, node_feature, split, right_offset, leaf_code, codebook, roots, edges, edge_offsets,
+                 n_features):
+        self.node_feature = node_feature
+        self.split = split
+        self.right_offset = right_offset
+        self.leaf_code = leaf_code
+        self.codebook = codebook
+        self.roots = roots
+        self.edges = edges
+        self.edge_offsets = edge_offsets
+        self.n_features = int(n_features)
+        self.bins = FeatureBins(edges, edge_offsets)
+
+    @classmethod
+    def from_flat(cls, flat, n_codes=N_CODES):
+        """Kwantyzacja FlatForest (flat_forest.py) - progi bezstratnie, liście słownikiem n_codes wartości"""
+        if flat.n_features >= LEAF_FEATURE:
+            raise ValueError(f"CompactForest obsługuje najwyżej {LEAF_FEATURE - 1} cech, "
+                             f"las ma {flat.n_features}")
+        if n_codes > 256:
+            raise ValueError("Kody liści są typu uint8 - n_codes najwyżej 256")
+        nodes = np.arange(flat.n_nodes)
+        inner = ~flat.is_leaf
+        if not np.array_equal(flat.left[inner], nodes[inner] + 1):
+            raise ValueError("Lewe dziecko każdego węzła musi być następnym węzłem (kolejność budowy sklearn)")
+
+        # Krawędzie float32 (progi zaokrąglone w dół); progi równe po zaokrągleniu dają ten sam podział
+        edges, split = [], np.zeros(flat.n_nodes, np.int64)
+        for feature in range(flat.n_features):
+            mask = inner & (flat.feature == feature)
+            thresholds = float32_floor(flat.threshold[mask])
+            edges.append(np.unique(thresholds))
+            split[mask] = np.searchsorted(edges[-1], thresholds)
+        max_edges = max(len(part) for part in edges)
+
+        node_feature = np.where(inner, flat.feature, LEAF_FEATURE).astype(np.uint8)
+        node_feature[flat.missing_left & inner] |= MISSING_LEFT_BIT
+        right_offset = np.where(inner, flat.right - nodes, 0)
+
+        codebook, codes = quantize_values(flat.value[flat.is_leaf], n_codes)
+        leaf_code = np.zeros(flat.n_nodes, np.uint8)
+        leaf_code[flat.is_leaf] = codes
+
+        return cls(node_feature=node_feature,
+                   split=split.astype(np.uint16 if max_edges < 2**16 else np.uint32),
+                   right_offset=right_offset.astype(np.int16 if right_offset.max() < 2**15 else np.int32),
+                   leaf_code=leaf_code, codebook=codebook, roots=flat.roots.astype(np.int32),
+                   edges=np.concatenate(edges),
+                   edge_offsets=np.cumsum([0] + [len(part) for part in edges]).astype(np.int64),
+                   n_features=flat.n_features)
+
+    @classmethod
+    def from_arrays(cls, arrays, n_features):
+        """Las z tablic to_arrays (np. widoków pliku mapowanego w pamięci)"""
+        return cls(**{name: arrays[name] for name in COMPACT_ARRAYS}, n_features=n_features)
+
+    def to_arrays(self):
+        return {name: getattr(self, name) for name in COMPACT_ARRAYS}
+
+    @property
+    def n_nodes(self):
+        return len(self.node_feature)
+
+    @property
+    def nbytes(self):
+        """Rozmiar tablic modelu (bajty)"""
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    def _traverse(self, codes):
+        """Przejście wszystkich drzew dla wierszy kodów; średnia prawdopodobieństw ze słownika"""
+        n_trees = len(self.roots)
+        proba = np.empty(len(codes))
+        block = max(1, BLOCK_NODES // n_trees)
+        has_missing = bool((codes == self.bins.nan_code).any())
+
+        for start in range(0, len(codes), block):
+            part = codes[start:start + block]
+            flat = part.ravel()
+            # Pary (drzewo, wiersz) w kolejności drzew; aktywne - jeszcze nie w liściu
+            leaves = np.repeat(self.roots, len(part))
+            active = np.flatnonzero(self.node_feature[leaves] != LEAF_FEATURE)
+            nodes = leaves[active]
+            base = np.tile(np.arange(len(part), dtype=np.int32) * self.n_features, n_trees)[active]
+            while len(nodes):
+                # Cecha i bit braku danych dekodowane z jednego bajtu (bez dodatkowych tablic)
+                node_feature = self.node_feature[nodes]
+                feature = node_feature & LEAF_FEATURE
+                code = flat[base + feature]
+                go_right = code > self.split[nodes]
+                if has_missing:
+                    go_right = np.where(code == self.bins.nan_code[feature],
+                                        (node_feature & MISSING_LEFT_BIT) == 0, go_right)
+                nodes = nodes + np.where(go_right, self.right_offset[nodes], 1)
+                done = self.node_feature[nodes] == LEAF_FEATURE
+                if done.any():
+                    leaves[active[done]] = nodes[done]
+                    inner = ~done
+                    active, nodes, base = active[inner], nodes[inner], base[inner]
+
+            # Suma w kolejności drzew, potem dzielenie - jak w RandomForestClassifier
+            total = np.zeros(len(part))
+            for leaf_values in self.codebook[self.leaf_code[leaves]].reshape(n_trees, len(part)):
+                total += leaf_values
+            proba[start:start + block] = total / n_trees
+        return proba
+
+    def predict_proba(self, X):
+        """Prawdopodobieństwo klasy 1 dla wierszy X (n_wierszy x n_cech)"""
+        X = np.asarray(X, dtype=np.float32)  # jak sklearn (drzewa porównują wartości float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Oczekiwano macierzy o {self.n_features} kolumnach, otrzymano kształt {X.shape}")
+        unique_codes, inverse = self.bins.unique_codes(self.bins.codes(X))
+        proba = self._traverse(unique_codes)
+        return proba if inverse is None else proba[inverse]
+
+
+def flat_nbytes(flat):
+    """Rozmiar tablic FlatForest (węzły i tablice pomocnicze przejścia, bajty)"""
+    return sum(array.nbytes for array in flat.to_arrays().values())
+
+
+def compare_predictions(reference, compact, y=None):
+    """
+    Równoważność predykcji modelu kompaktowego z pełnym modelem
+
+    Zwraca słownik: max_abs_diff, changed_decisions (odsetek wierszy ze zmienioną
+    decyzją proba > 0.5) i - przy podanych etykietach y - metryki obu modeli
+    ('accuracy', 'f1', 'roc_auc': (pełny, kompaktowy)).
+    """
+    from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+    report = {'max_abs_diff': float(np.abs(reference - compact).max()),
+              'changed_decisions': float(np.mean((reference > 0.5) != (compact > 0.5)))}
+    if y is not None:
+        metrics = {'accuracy': lambda proba: accuracy_score(y, proba > 0.5),
+                   'f1': lambda proba: f1_score(y, proba > 0.5),
+                   'roc_auc': lambda proba: roc_auc_score(y, proba)}
+        for name, metric in metrics.items():
+            report[name] = (metric(reference), metric(compact))
+    return report
+
+
+def is_equivalent(report):
+    """Brak zmienionych decyzji i metryki zgodne do 4 miejsc po przecinku"""
+    metrics = [value for value in report.values() if isinstance(value, tuple)]
+    return report['changed_decisions'] == 0 and all(abs(full - compact) < METRIC_TOLERANCE
+                                                   for full, compact in metrics)
+
+
+if __name__ == '__main__':
+    from data_loader import load_data
+    from flat_forest import FlatForest
+    from scoring import load_estimator
+    from benchmark_inference import synthetic_rows
+
+    n_rows = int(sys.argv[sys.argv.index('--rows') + 1]) if '--rows' in sys.argv else 100_000
+
+    estimator = load_estimator()
+    flat = FlatForest.from_sklearn(estimator['model'])
+    compact = CompactForest.from_flat(flat)
+
+    print("="*80)
+    print("KOMPAKTOWA REPREZENTACJA LASU")
+    print("="*80)
+
+    flat_size, compact_size = flat_nbytes(flat), compact.nbytes
+    print(f"\nLas: {len(flat.roots)} drzew, {flat.n_nodes} węzłów, {flat.n_features} cech")
+    print(f"Typy: split {compact.split.dtype}, right_offset {compact.right_offset.dtype}, "
+          f"leaf_code {compact.leaf_code.dtype}")
+    n_leaf_values = len(np.unique(flat.value[flat.is_leaf]))
+    print(f"Prawdopodobieństwa liści: {n_leaf_values} unikalnych -> słownik {len(compact.codebook)} wartości "
+          f"({'dokładny' if n_leaf_values <= N_CODES else 'skwantowany'})")
+    print(f"\n{'Reprezentacja':<15} {'Rozmiar':>12} {'Bajtów/węzeł':>14}")
+    print(f"{'FlatForest':<15} {flat_size / 1024:>9.1f} KB {flat_size / flat.n_nodes:>14.1f}")
+    print(f"{'CompactForest':<15} {compact_size / 1024:>9.1f} KB {compact_size / compact.n_nodes:>14.1f}")
+    print(f"Zmniejszenie: {flat_size / compact_size:.1f}x")
+
+    data = load_data()
+    features = estimator['features']
+    cohort = estimator['scaler'].transform(data[features])
+    synthetic = estimator['scaler'].transform(synthetic_rows(n_rows)[features])
+
+    reports = {
+        f'Kohorta ({len(cohort)} wierszy)': compare_predictions(
+            estimator['model'].predict_proba(cohort)[:, 1], compact.predict_proba(cohort),
+            data['DEATH_EVENT'].to_numpy()),
+        f'Syntetyczne ({n_rows:,} wierszy)': compare_predictions(
+            estimator['model'].predict_proba(synthetic)[:, 1], compact.predict_proba(synthetic))
+    }
+    for label, report in reports.items():
+        print(f"\n{label}:")
+        print(f"  Największa różnica prawdopodobieństw: {report['max_abs_diff']:.2e}")
+        print(f"  Zmienione decyzje (próg 0.5): {report['changed_decisions']:.4%}")
+        for name in ('accuracy', 'f1', 'roc_auc'):
+            if name in report:
+                full, quantized = report[name]
+                print(f"  {name:<9} pełny {full:.4f}  kompaktowy {quantized:.4f}  różnica {quantized - full:+.2e}")
+
+    equivalent = all(is_equivalent(report) for report in reports.values())
+    print("\n" + "="*80)
+    print("✓ Model kompaktowy równoważny pełnemu" if equivalent else "✗ MODEL KOMPAKTOWY NIE JEST RÓWNOWAŻNY")
+    print("="*80)
+    sys.exit(0 if equivalent else 1)
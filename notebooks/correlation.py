@@ -0,0 +1,148 @@
+"""
+Silnik korelacji - Heart Failure Dataset
+========================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Macierze korelacji dla 01_exploratory_data_analysis.py
+i 02_generate_thesis_figures.py liczone raz i współdzielone:
+- Pearson: kolumny standaryzowane raz, macierz liczona blokami kolumn
+  jako iloczyny macierzy float32 (pamięć O(wiersze x blok) na wynik częściowy)
+- Spearman: rangi liczone raz dla każdej kolumny, dalej jak Pearson
+- punktowo-dwuseryjna (point-biserial) z p-wartościami - korelacja cech
+  ze zmienną binarną (DEATH_EVENT)
+- Kendall (tylko w trybie korelacji ze zmienną celu)
+
+Tryb korelacji ze zmienną celu liczy jedną kolumnę macierzy (O(wiersze x cechy)
+zamiast O(wiersze x cechy²)) - wystarcza dla wykresów korelacji z DEATH_EVENT.
+Wyniki zapisywane są w data/cache/ pod kluczem skrótu pliku CSV.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from data_loader import DATA_PATH, CACHE_DIR, cache_key, load_data
+from schema import TARGET
+
+# Wersja formatu wyników - zmiana sposobu liczenia wymaga nowej wersji
+CORRELATION_VERSION = 1
+
+# Liczba kolumn w jednym bloku iloczynu macierzy
+CORR_BLOCK = 1024
+
+METHODS = ('pearson', 'spearman')
+TARGET_METHODS = ('pearson', 'spearman', 'kendall', 'pointbiserial')
+
+
+def _standardize(values, dtype=np.float32):
+    """Kolumny wycentrowane (w float64) i znormalizowane do długości 1"""
+    values = np.asarray(values, dtype=np.float64)
+    centered = values - values.mean(axis=0)
+    norms = np.sqrt((centered ** 2).sum(axis=0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (centered / norms).astype(dtype)
+
+
+def _rank_columns(values):
+    """Rangi (średnie dla remisów) w każdej kolumnie - jak df.corr(method='spearman')"""
+    return stats.rankdata(values, axis=0)
+
+
+def correlation_matrix(values, block_size=CORR_BLOCK, dtype=np.float32):
+    """
+    Macierz korelacji Pearsona kolumn macierzy `values`
+
+    Wynik liczony jest blokami po block_size kolumn: Z[:, blok].T @ Z,
+    gdzie Z to kolumny standaryzowane w typie dtype.
+    """
+    z = _standardize(values, dtype)
+    n_columns = z.shape[1]
+    result = np.empty((n_columns, n_columns))
+    for start in range(0, n_columns, block_size):
+        result[start:start + block_size] = z[:, start:start + block_size].T @ z
+    np.clip(result, -1.0, 1.0, out=result)
+    # Przekątna dokładnie 1 (poza kolumnami stałymi)
+    diagonal = np.diag_indices(n_columns)
+    result[diagonal] = np.where(np.isnan(result[diagonal]), np.nan, 1.0)
+    return result
+
+
+def correlation_vector(values, target, dtype=np.float32):
+    """Korelacje Pearsona wszystkich kolumn `values` z jedną zmienną `target`"""
+    z = _standardize(values, dtype)
+    z_target = _standardize(np.asarray(target).reshape(-1, 1), dtype)[:, 0]
+    return np.clip(z.T @ z_target, -1.0, 1.0).astype(np.float64)
+
+
+def correlation(df, columns=None, method='pearson', block_size=CORR_BLOCK):
+    """Macierz korelacji (jak df.corr(method)) dla metod z METHODS"""
+    if method not in METHODS:
+        raise ValueError(f"Nieznana metoda korelacji: {method} (dostępne: {', '.join(METHODS)})")
+    columns = list(df.columns) if columns is None else list(columns)
+    values = df[columns].to_numpy(dtype=np.float64)
+    if method == 'spearman':
+        values = _rank_columns(values)
+    return pd.DataFrame(correlation_matrix(values, block_size), index=columns, columns=columns)
+
+
+def target_correlation(df, target=TARGET, method='pearson', columns=None):
+    """
+    Korelacje wszystkich kolumn ze zmienną celu (jak df.corr(method)[target])
+
+    Dla method='pointbiserial' zwraca ramkę z kolumnami r i p_value,
+    dla pozostałych metod - serię współczynników.
+    """
+    if method not in TARGET_METHODS:
+        raise ValueError(f"Nieznana metoda korelacji: {method} "
+                         f"(dostępne: {', '.join(TARGET_METHODS)})")
+    columns = list(df.columns) if columns is None else list(columns)
+    values = df[columns].to_numpy(dtype=np.float64)
+    target_values = df[target].to_numpy(dtype=np.float64)
+
+    if method == 'kendall':
+        r = np.array([stats.kendalltau(column, target_values).statistic for column in values.T])
+        return pd.Series(r, index=columns, name=target)
+    if method == 'spearman':
+        values, target_values = _rank_columns(values), stats.rankdata(target_values)
+
+    r = correlation_vector(values, target_values)
+    if method != 'pointbiserial':
+        return pd.Series(r, index=columns, name=target)
+
+    # Korelacja punktowo-dwuseryjna = Pearson ze zmienną 0/1; test t z n - 2 stopniami swobody
+    n = len(target_values)
+    with np.errstate(divide='ignore'):
+        t_stat = r * np.sqrt((n - 2) / (1 - r ** 2))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), n - 2)
+    return pd.DataFrame({'r': r, 'p_value': p_value}, index=pd.Index(columns, name='feature'))
+
+
+def load_correlation(path=DATA_PATH, method='pearson', target=None):
+    """
+    Macierz korelacji wszystkich kolumn albo (gdy podano `target`) tylko
+    korelacje ze zmienną celu
+
+    Wyniki są liczone raz na zawartość pliku CSV i zapisywane w data/cache/.
+    """
+    suffix = method if target is None else f'{method}_{target}'
+    result_dir = os.path.join(CACHE_DIR, cache_key(path))
+    result_path = os.path.join(result_dir, f'correlation_{suffix}_v{CORRELATION_VERSION}.csv')
+
+    if os.path.exists(result_path):
+        result = pd.read_csv(result_path, index_col=0, float_precision='round_trip')
+        return result if target is None or method == 'pointbiserial' else result[target]
+
+    df = load_data(path)
+    if target is None:
+        result = correlation(df, method=method)
+    else:
+        result = target_correlation(df, target, method)
+    os.makedirs(result_dir, exist_ok=True)
+    tmp_path = f'{result_path}.tmp{os.getpid()}'
+    result.to_csv(tmp_path)
+    os.replace(tmp_path, result_path)
+    return result
@@ -0,0 +1,199 @@
+"""
+Walidacja krzyżowa z jednym treningiem na fold
+==============================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Wspólny silnik walidacji krzyżowej dla skryptów 03, 05 i 07:
+1. Każdy fold trenowany dokładnie raz - predykcje i prawdopodobieństwa klasy 1
+   foldu testowego zapisywane zamiast osobnego cross_val_score na każdą metrykę
+2. Wszystkie metryki liczone z zapisanych predykcji (te same modele dla każdej metryki)
+3. Foldy trenowane równolegle (joblib)
+4. Wynik jako jedna tabela: wiersz na fold (liczności, czas treningu, metryki);
+   summarize_folds - średnia i odchylenie standardowe
+5. Przetwarzanie wstępne bez wycieku (FoldCache): przekształcenie (np. skaler)
+   dopasowywane tylko do części treningowej foldu, raz na parę
+   (specyfikacja przekształcenia, fold); przekształcone macierze współdzielone
+   przez wszystkie modele i eksperymenty na tych samych foldach
+
+Model to estymator sklearn (klonowany w każdym foldzie, predykcja z predict)
+albo funkcja fit_predict(X_train, y_train, X_test) -> (y_pred, y_proba)
+dla modeli spoza sklearn (sieci Keras w 07).
+
+Użycie:
+    from cross_validation import FoldCache, cross_validate_model, summarize_folds
+    folds = cross_validate_model(make_pipeline(StandardScaler(), rf), X, y, cv=5)
+    summarize_folds(folds)
+
+    cache = FoldCache(5, y)
+    folds = cross_validate_model(rf, X, y, cv=cache, preprocess=('base', StandardScaler()))
+"""
+
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.model_selection import StratifiedKFold, check_cv
+
+CV_FOLDS = 5
+
+# Metryki z predykcji i prawdopodobieństw klasy 1 (nazwy jak parametr scoring w sklearn)
+METRICS = {
+    'accuracy': lambda y, pred, proba: accuracy_score(y, pred),
+    'precision': lambda y, pred, proba: precision_score(y, pred, zero_division=0),
+    'recall': lambda y, pred, proba: recall_score(y, pred),
+    'f1': lambda y, pred, proba: f1_score(y, pred),
+    'roc_auc': lambda y, pred, proba: roc_auc_score(y, proba)
+}
+
+CV_METRICS = tuple(METRICS)
+
+
+def stratified_folds(n_splits=CV_FOLDS, random_state=42):
+    """Stratyfikowany podział z tasowaniem - ten sam dla wszystkich eksperymentów"""
+    return StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+
+class FoldCache:
+    """
+    Foldy liczone raz i pamięć podręczna przekształceń dopasowanych w każdym foldzie
+
+    Obiekt podziału jak w sklearn (split, get_n_splits) - można go przekazać jako cv
+    do cross_validate_model i do funkcji sklearn. Przekształcenie jest klonowane
+    i dopasowywane wyłącznie do wierszy treningowych foldu, więc statystyki wierszy
+    testowych nie trafiają do modelu (poprawność z konstrukcji).
+
+    Args:
+        cv: liczba foldów albo obiekt podziału (jak w cross_val_score)
+        y: etykiety (stratyfikacja)
+    """
+
+    def __init__(self, cv, y):
+        y = np.asarray(y)
+        self.folds = list(check_cv(cv, y, classifier=True).split(np.zeros((len(y), 1)), y))
+        self.n_rows = len(y)
+        self._transformed = {}
+
+    def split(self, X=None, y=None, groups=None):
+        return iter(self.folds)
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        return len(self.folds)
+
+    def transformed(self, name, transformer, X):
+        """
+        Lista par (X_train, X_test) po przekształceniu - po jednej na fold
+
+        Klucz pamięci: nazwa zestawu cech (name) i parametry przekształcenia
+        (repr estymatora sklearn); dopasowanie przy pierwszym wywołaniu,
+        kolejne zwracają te same macierze. Wpis pamięta dane, na których go
+        policzono - ta sama nazwa z innymi danymi (kształt, kolumny, wartości)
+        zgłasza ValueError zamiast zwracać macierze innego zestawu cech.
+        """
+        key = (name, repr(transformer))
+        if key in self._transformed:
+            source, pairs = self._transformed[key]
+            if not _same_data(source, X):
+                raise ValueError(f"FoldCache: zestaw cech '{name}' zapamiętany dla innych danych "
+                                 f"(kształt {np.shape(source)}, teraz {np.shape(X)}) - użyj innej nazwy")
+            return pairs
+        if len(X) != self.n_rows:
+            raise ValueError(f"FoldCache: foldy dla {self.n_rows} wierszy, dane mają {len(X)}")
+        pairs = []
+        for train, test in self.folds:
+            fitted = clone(transformer).fit(_take(X, train))
+            pairs.append((fitted.transform(_take(X, train)), fitted.transform(_take(X, test))))
+        self._transformed[key] = (X, pairs)
+        return pairs
+
+
+def _fit_predict_estimator(estimator, X_train, y_train, X_test):
+    """Klon estymatora trenowany na foldzie: predict i predict_proba klasy 1"""
+    model = clone(estimator).fit(X_train, y_train)
+    return model.predict(X_test), model.predict_proba(X_test)[:, 1]
+
+
+def _same_data(a, b):
+    """Te same dane: ten sam obiekt albo równy kształt, kolumny i wartości"""
+    if a is b:
+        return True
+    if np.shape(a) != np.shape(b) or list(getattr(a, 'columns', [])) != list(getattr(b, 'columns', [])):
+        return False
+    return np.array_equal(np.asarray(a), np.asarray(b), equal_nan=True)
+
+
+def _take(X, index):
+    return X.iloc[index] if hasattr(X, 'iloc') else X[index]
+
+
+def _run_fold(fit_predict, X_train, y_train, X_test, y_test, metrics):
+    """Jeden trening na foldzie; metryki z zapisanych predykcji"""
+    start = time.perf_counter()
+    y_pred, y_proba = fit_predict(X_train, y_train, X_test)
+    fit_time = time.perf_counter() - start
+    scores = {metric: METRICS[metric](y_test, y_pred, y_proba) for metric in metrics}
+    return scores, fit_time, np.asarray(y_proba)
+
+
+def cross_validate_model(model, X, y, cv=CV_FOLDS, metrics=CV_METRICS, preprocess=None, n_jobs=-1,
+                         return_predictions=False):
+    """
+    Walidacja krzyżowa z jednym treningiem na fold i wszystkimi metrykami naraz
+
+    Args:
+        model: estymator sklearn albo funkcja fit_predict(X_train, y_train, X_test)
+               zwracająca (y_pred, y_proba klasy 1)
+        X, y: dane (DataFrame lub tablica)
+        cv: liczba foldów, obiekt podziału jak w cross_val_score
+            (cv=5 daje te same foldy co cross_val_score) albo FoldCache
+        metrics: nazwy metryk z METRICS
+        preprocess: para (nazwa zestawu cech, przekształcenie) dopasowywane
+                    w każdym foldzie przez FoldCache (przekazany jako cv
+                    - macierze współdzielone między wywołaniami)
+        n_jobs: liczba równoległych foldów (1 dla modeli, których nie można
+                trenować w osobnych procesach, np. Keras)
+        return_predictions: dodatkowo prawdopodobieństwa out-of-fold dla każdego wiersza
+
+    Returns:
+        DataFrame (indeks: fold; kolumny: n_train, n_test, fit_time, metryki)
+        [, tablica prawdopodobieństw out-of-fold]
+    """
+    y = np.asarray(y)
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Nieznane metryki: {sorted(unknown)}; dostępne: {sorted(METRICS)}")
+    # partial funkcji modułu (a nie lambda) - przekazywany do procesów joblib
+    fit_predict = partial(_fit_predict_estimator, model) if hasattr(model, 'fit') else model
+    cache = cv if isinstance(cv, FoldCache) else FoldCache(cv, y)
+    folds = cache.folds
+    if preprocess is None:
+        fold_data = ((_take(X, train), _take(X, test)) for train, test in folds)
+    else:
+        fold_data = cache.transformed(*preprocess, X)
+
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_run_fold)(fit_predict, X_train, y[train], X_test, y[test], metrics)
+        for (train, test), (X_train, X_test) in zip(folds, fold_data))
+
+    table = pd.DataFrame([
+        {'n_train': len(train), 'n_test': len(test), 'fit_time': fit_time, **scores}
+        for (train, test), (scores, fit_time, _) in zip(folds, results)
+    ])
+    table.index.name = 'fold'
+    if not return_predictions:
+        return table
+    oof_proba = np.empty(len(y))
+    for (_, test), (_, _, y_proba) in zip(folds, results):
+        oof_proba[test] = y_proba
+    return table, oof_proba
+
+
+def summarize_folds(folds, metrics=None):
+    """Średnia i odchylenie standardowe metryk z tabeli foldów (wiersz na metrykę)"""
+    metrics = [column for column in folds.columns if column in METRICS] if metrics is None else list(metrics)
+    return pd.DataFrame({'mean': folds[metrics].mean(), 'std': folds[metrics].std(ddof=0)})
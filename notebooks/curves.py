@@ -0,0 +1,191 @@
+"""
+Magazyn krzywych ROC i Precision-Recall
+=======================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Krzywe liczone raz, w chwili trenowania modeli (03, 05), a nie przy każdym
+uruchomieniu skryptów z wykresami (04, 06):
+1. Wyniki wszystkich modeli ocenianych na tym samym zbiorze testowym ułożone
+   w macierz (liczba modeli x liczba wierszy) i posortowane jednym wywołaniem
+   argsort; liczby TP i FP dla każdego progu z sum skumulowanych
+2. Punkty pracy (próg, FPR, TPR, precyzja) wszystkich modeli zapisane płasko
+   w jednym pliku .npz z przesunięciami początków krzywych
+3. Odczyt krzywych w układzie sklearn.metrics.roc_curve / precision_recall_curve
+   (te same wartości co do bitu) i wybór progu decyzyjnego z tych samych tablic
+
+Użycie:
+    from curves import CurveStore
+    store = CurveStore.from_scores(y_test, {'Random Forest': y_pred_proba})
+    store.save('../results/rf_curves.npz')
+
+    store = CurveStore.load('../results/rf_curves.npz')
+    fpr, tpr, thresholds = store.roc('Random Forest')
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Wersja formatu pliku magazynu (CurveStore.save)
+CURVES_VERSION = 1
+
+
+class CurveStore:
+    """
+    Punkty pracy klasyfikatorów binarnych - po jednym na każdą różną wartość wyniku
+
+    Tablice thresholds / tps / fps / fpr / tpr / precision są złączeniem krzywych
+    wszystkich modeli; krzywa modelu i zajmuje zakres offsets[i]:offsets[i+1].
+    Progi są malejące, a punkt o progu t oznacza predykcję 1 dla wyniku >= t.
+    """
+
+    def __init__(self, models, offsets, thresholds, tps, fps, n_pos, n_neg):
+        self.models = list(models)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        self.tps = np.asarray(tps, dtype=np.int64)
+        self.fps = np.asarray(fps, dtype=np.int64)
+        self.n_pos = int(n_pos)
+        self.n_neg = int(n_neg)
+        # Te same działania co w sklearn (tps / tps[-1] itd.) - wyniki identyczne
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.tpr = self.tps / self.n_pos
+            self.fpr = self.fps / self.n_neg
+            self.precision = np.divide(self.tps, self.tps + self.fps,
+                                       out=np.zeros(self.tps.shape), where=(self.tps + self.fps) != 0)
+        self.roc_auc = np.array([_auc(*self.roc(model)[:2]) for model in self.models])
+        self.pr_auc = np.array([_auc(*self.pr(model)[1::-1]) for model in self.models])
+
+    @classmethod
+    def from_scores(cls, y_true, scores):
+        """
+        Krzywe wszystkich modeli z jednego sortowania macierzy wyników
+
+        Args:
+            y_true: etykiety 0/1 zbioru testowego (wspólne dla wszystkich modeli)
+            scores: słownik {model: prawdopodobieństwa klasy 1}
+        """
+        y_true = np.asarray(y_true).astype(np.int64)
+        models = list(scores)
+        matrix = np.vstack([np.asarray(scores[model], dtype=np.float64) for model in models])
+        n_models, n_rows = matrix.shape
+
+        # Kolejność malejąca wyników (jak w sklearn: stabilne sortowanie i odwrócenie)
+        order = np.argsort(matrix, axis=1, kind='mergesort')[:, ::-1]
+        sorted_scores = np.take_along_axis(matrix, order, axis=1)
+        cumulative_tps = np.cumsum(y_true[order], axis=1)
+
+        # Ostatnia pozycja każdej grupy równych wyników wyznacza punkt krzywej
+        last = np.ones((n_models, n_rows), dtype=bool)
+        last[:, :-1] = np.diff(sorted_scores, axis=1) != 0
+        positions = np.broadcast_to(np.arange(n_rows), (n_models, n_rows))[last]
+        tps = cumulative_tps[last]
+
+        offsets = np.concatenate([[0], np.cumsum(last.sum(axis=1))])
+        n_pos = int(y_true.sum())
+        return cls(models, offsets, sorted_scores[last], tps, positions + 1 - tps,
+                   n_pos, n_rows - n_pos)
+
+    def _slice(self, model):
+        index = self.models.index(model)
+        return slice(self.offsets[index], self.offsets[index + 1])
+
+    def roc(self, model, drop_intermediate=True):
+        """(fpr, tpr, thresholds) w układzie sklearn.metrics.roc_curve"""
+        part = self._slice(model)
+        fps, tps, thresholds = self.fps[part], self.tps[part], self.thresholds[part]
+        fpr, tpr = self.fpr[part], self.tpr[part]
+        if drop_intermediate and len(fps) > 2:
+            # Pomijanie punktów współliniowych (jak w sklearn)
+            optimal = np.where(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True])[0]
+            fpr, tpr, thresholds = fpr[optimal], tpr[optimal], thresholds[optimal]
+        return np.r_[0, fpr], np.r_[0, tpr], np.r_[np.inf, thresholds]
+
+    def pr(self, model):
+        """(precision, recall, thresholds) w układzie sklearn.metrics.precision_recall_curve"""
+        part = self._slice(model)
+        precision, recall, thresholds = self.precision[part], self.tpr[part], self.thresholds[part]
+        return np.hstack((precision[::-1], 1)), np.hstack((recall[::-1], 0)), thresholds[::-1]
+
+    def auc(self, model):
+        """(AUC-ROC, AUC-PR) - pola pod krzywymi liczone przy zapisie magazynu"""
+        index = self.models.index(model)
+        return self.roc_auc[index], self.pr_auc[index]
+
+    def operating_points(self, model):
+        """
+        Tabela punktów pracy modelu: próg, TP, FP, FN, TN, TPR (recall), FPR,
+        precyzja, F1 i statystyka Youdena (TPR - FPR)
+        """
+        part = self._slice(model)
+        tps, fps = self.tps[part], self.fps[part]
+        precision, recall = self.precision[part], self.tpr[part]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+        return pd.DataFrame({
+            'threshold': self.thresholds[part],
+            'tp': tps,
+            'fp': fps,
+            'fn': self.n_pos - tps,
+            'tn': self.n_neg - fps,
+            'tpr': recall,
+            'fpr': self.fpr[part],
+            'precision': precision,
+            'f1': f1,
+            'youden': recall - self.fpr[part]
+        })
+
+    def select_threshold(self, model, criterion='f1', min_recall=None):
+        """
+        Próg decyzyjny z tablic magazynu (bez ponownej predykcji)
+
+        Args:
+            criterion: 'f1' (maksymalny F1) lub 'youden' (maksymalne TPR - FPR)
+            min_recall: jeśli podano - najwyższy próg o czułości >= min_recall
+                        (np. 0.9 przy badaniu przesiewowym); criterion jest wtedy pomijane
+
+        Zwraca wiersz tabeli operating_points() dla wybranego progu.
+        """
+        points = self.operating_points(model)
+        if min_recall is not None:
+            # Progi są malejące, a czułość rosnąca - pierwszy spełniający warunek
+            index = int(np.argmax(points['tpr'].to_numpy() >= min_recall))
+        elif criterion in ('f1', 'youden'):
+            index = int(points[criterion].to_numpy().argmax())
+        else:
+            raise ValueError(f"Nieznane kryterium progu: {criterion} (dostępne: f1, youden)")
+        return points.iloc[index]
+
+    def save(self, path):
+        """Zapisuje magazyn do pliku .npz"""
+        arrays = {
+            'version': np.array(CURVES_VERSION),
+            'models': np.array(self.models),
+            'offsets': self.offsets,
+            'thresholds': self.thresholds,
+            'tps': self.tps,
+            'fps': self.fps,
+            'counts': np.array([self.n_pos, self.n_neg])
+        }
+        # Zapis do pliku tymczasowego - przerwany zapis nie psuje poprzedniego magazynu
+        tmp_path = f'{path}.tmp{os.getpid()}.npz'
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as arrays:
+            if int(arrays['version']) != CURVES_VERSION:
+                raise ValueError(f"Niezgodny format magazynu krzywych: {path}")
+            n_pos, n_neg = arrays['counts']
+            return cls(arrays['models'].tolist(), arrays['offsets'], arrays['thresholds'],
+                       arrays['tps'], arrays['fps'], n_pos, n_neg)
+
+
+def _auc(x, y):
+    """Pole pod krzywą metodą trapezów (jak sklearn.metrics.auc dla x monotonicznego)"""
+    area = np.trapezoid(y, x)
+    return -area if np.all(np.diff(x) <= 0) else area
@@ -0,0 +1,178 @@
+"""
+Wspólne wczytywanie danych - Heart Failure Dataset
+===================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Jedno miejsce, w którym wczytywany jest plik heart_failure_data.csv:
+1. Parsowanie CSV tylko raz, nadanie kanonicznych nazw kolumn i typów
+   zadeklarowanych w schema.py
+2. Zapis binarnej kopii (kolumny .npy) w katalogu data/cache/,
+   kluczowanej skrótem SHA-256 zawartości pliku CSV
+3. Kolejne uruchomienia odczytują kopię przez np.memmap zamiast CSV
+4. Dla dużych eksportów (nie mieszczących się w RAM) - odczyt porcjami
+   (iter_chunks), przekazywanymi dalej do reduktorów z streaming.py
+
+Użycie w skryptach z katalogu notebooks/:
+    from data_loader import load_data
+    df = load_data()
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from schema import COLUMN_MAPPING, COLUMN_DTYPES, validate
+
+# Ścieżki względem położenia modułu (skrypty uruchamiane są z notebooks/)
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DATA_PATH = os.path.join(PROJECT_DIR, 'data', 'heart_failure_data.csv')
+CACHE_DIR = os.path.join(PROJECT_DIR, 'data', 'cache')
+
+# Domyślny rozmiar porcji przy odczycie strumieniowym (liczba wierszy)
+CHUNK_SIZE = 500_000
+
+# Wersja formatu cache - zmiana mapowania lub typów wymaga nowej wersji
+CACHE_VERSION = 2
+
+
+def file_hash(path, block_size=1 << 20, size=None):
+    """Zwraca skrót SHA-256 zawartości pliku (czytanego blokami) lub jego pierwszych size bajtów"""
+    digest = hashlib.sha256()
+    remaining = float('inf') if size is None else size
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            block = f.read(int(min(block_size, remaining)))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+# Skróty plików policzone w tym procesie: (ścieżka, rozmiar, czas modyfikacji) -> SHA-256
+_file_hashes = {}
+
+
+def cache_key(path):
+    """
+    Klucz cache: skrót zawartości CSV połączony z wersją formatu
+
+    Skrót liczony jest raz na proces dla danej ścieżki, rozmiaru i czasu
+    modyfikacji pliku - kolejne wywołania (load_*, kolejne statystyki)
+    nie czytają ponownie całego pliku.
+    """
+    stat = os.stat(path)
+    file_id = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    if file_id not in _file_hashes:
+        _file_hashes[file_id] = file_hash(path)
+    return f"{_file_hashes[file_id]}_v{CACHE_VERSION}"
+
+
+def prepare_frame(df, columns=None, check_ranges=True):
+    """
+    Zmienia nazwy kolumn, sprawdza dane i nadaje typy ze schematu (opcjonalnie tylko columns)
+
+    check_ranges=False - bez zakresów kohorty, tylko warunki bezpiecznego rzutowania
+    """
+    df = df.rename(columns=COLUMN_MAPPING)
+    validate(df, columns, check_ranges)
+    if columns is None:
+        return df.astype(COLUMN_DTYPES)
+    return df[list(columns)].astype({name: COLUMN_DTYPES[name] for name in columns})
+
+
+def _write_cache(df, cache_path):
+    """Zapisuje ramkę jako osobne pliki .npy (po jednym na kolumnę)"""
+    tmp_path = f'{cache_path}.tmp{os.getpid()}'
+    os.makedirs(tmp_path, exist_ok=True)
+    for column in df.columns:
+        np.save(os.path.join(tmp_path, f'{column}.npy'), df[column].to_numpy())
+    with open(os.path.join(tmp_path, 'columns.json'), 'w') as f:
+        json.dump(list(df.columns), f)
+    # Zmiana nazwy katalogu na końcu - przerwany zapis nie zostawia uszkodzonego cache
+    if not os.path.exists(cache_path):
+        try:
+            os.replace(tmp_path, cache_path)
+            return
+        except OSError:
+            # Inny proces utworzył katalog w międzyczasie
+            pass
+    # Katalog już istnieje (np. z wynikami z eda_stats) - przeniesienie plików,
+    # columns.json jako ostatni oznacza kompletną kopię
+    for name in sorted(os.listdir(tmp_path), key=lambda name: name == 'columns.json'):
+        os.replace(os.path.join(tmp_path, name), os.path.join(cache_path, name))
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _read_cache(cache_path, mmap=True):
+    """Odczytuje ramkę z katalogu cache (kolumny mapowane do pamięci)"""
+    with open(os.path.join(cache_path, 'columns.json')) as f:
+        columns = json.load(f)
+    mmap_mode = 'r' if mmap else None
+    data = {column: np.load(os.path.join(cache_path, f'{column}.npy'), mmap_mode=mmap_mode)
+            for column in columns}
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+
+def load_data(path=DATA_PATH, use_cache=True, mmap=True):
+    """
+    Wczytuje zbiór danych z kanonicznymi nazwami kolumn i typami
+
+    Args:
+        path: ścieżka do pliku CSV
+        use_cache: czy korzystać z binarnej kopii w data/cache/
+        mmap: czy mapować kolumny z cache do pamięci (tylko do odczytu)
+    """
+    if not use_cache:
+        return prepare_frame(pd.read_csv(path))
+
+    cache_path = os.path.join(CACHE_DIR, cache_key(path))
+    if os.path.exists(os.path.join(cache_path, 'columns.json')):
+        return _read_cache(cache_path, mmap=mmap)
+
+    df = prepare_frame(pd.read_csv(path))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _write_cache(df, cache_path)
+    return _read_cache(cache_path, mmap=mmap)
+
+
+def iter_chunks(path=DATA_PATH, chunksize=CHUNK_SIZE, columns=None, check_ranges=True, offset=0):
+    """
+    Odczytuje plik CSV porcjami o stałej liczbie wierszy
+
+    Każda porcja ma kanoniczne nazwy kolumn, jest sprawdzana względem schematu
+    i rzutowana na zwarte typy. Zużycie pamięci zależy od chunksize,
+    a nie od rozmiaru pliku. columns (nazwy kanoniczne) ogranicza odczyt
+    do części kolumn - np. plik do scoringu nie musi zawierać zmiennej celu.
+    check_ranges=False (scoring, nowe wiersze) pomija zakresy kohorty ze schematu
+    - sprawdzane są tylko typy (schema.validate).
+    offset (bajt początku wiersza, > 0) - odczyt tylko wierszy dopisanych za tym
+    miejscem; nagłówek pochodzi z pierwszej linii pliku.
+    """
+    if columns is None:
+        usecols = list(COLUMN_MAPPING)
+    else:
+        source_names = {name: source for source, name in COLUMN_MAPPING.items()}
+        usecols = [source_names[name] for name in columns]
+    if not offset:
+        reader = pd.read_csv(path, chunksize=chunksize, usecols=usecols)
+        with reader:
+            for chunk in reader:
+                yield prepare_frame(chunk, columns, check_ranges)
+        return
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        if not f.read(1):
+            return
+        f.seek(offset)
+        reader = pd.read_csv(f, chunksize=chunksize, header=None, names=header, usecols=usecols)
+        with reader:
+            for chunk in reader:
+                yield prepare_frame(chunk, columns, check_ranges)
@@ -0,0 +1,384 @@
+"""
+Silnik statystyk opisowych dla EDA
+==================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Wszystkie statystyki opisowe używane przez 01_exploratory_data_analysis.py
+i 02_generate_thesis_figures.py liczone raz, w jednym przebiegu:
+- count / mean / std / min / max
+- kwartyle (25%, 50%, 75%) i IQR
+- granice metody IQR oraz liczba wartości odstających
+
+Każda kolumna jest sortowana dokładnie raz - kwantyle, minimum, maksimum
+i liczby wartości odstających odczytywane są z posortowanej macierzy.
+Wyniki zapisywane są w data/cache/ obok binarnej kopii danych (ten sam klucz
+skrótu CSV), więc kolejne skrypty nie liczą ich ponownie.
+
+Dla eksportów, które nie mieszczą się w pamięci, kwartyle, granice IQR
+i liczby wartości odstających liczone są w jednym przebiegu po porcjach
+pliku ze szkiców kwantyli KLL (tryb 'sketch', streaming.QuantileSketch)
+z ograniczonym błędem rangi i stałą pamięcią. Tryb dokładny ('exact')
+pozostaje domyślny dla małych plików.
+
+Agregaty rozkładów (histogramy, pięć liczb wykresu pudełkowego, wartości
+odstające, ograniczona próbka wierszy) zapisywane są jako przenośny plik JSON
+(load_distribution_aggregates) - wykresy rozkładów rysowane są wyłącznie z niego,
+więc można je odtworzyć z podsumowań bez dostępu do surowych wierszy.
+
+Korelacje i tabele kontyngencji pochodzą z łączalnego stanu EDAState
+(streaming.py), który można uzupełniać o nowe wiersze bez ponownego
+przeliczania całego zbioru - load_eda_state po dopisaniu wierszy na końcu pliku
+CSV przetwarza tylko nowe wiersze.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_PATH, CACHE_DIR, CHUNK_SIZE, cache_key, file_hash, load_data, iter_chunks
+from schema import SCHEMA, TARGET, NUMERICAL_FEATURES
+from streaming import (SKETCH_K, EDAState, DistributionReducer, MomentsReducer,
+                       QuantileSketchReducer, build_state, run_pipeline)
+
+# Wersja formatu wyników - zmiana zestawu statystyk wymaga nowej wersji
+STATS_VERSION = 1
+
+# Współczynnik metody IQR (granice: Q1 - 1.5*IQR, Q3 + 1.5*IQR)
+IQR_FACTOR = 1.5
+
+# Tryb 'auto': pliki większe niż ten próg liczone są szkicami kwantyli
+EXACT_MAX_BYTES = 512 * 2**20
+
+# Wiersze w kolejności zgodnej z df.describe()
+DESCRIBE_ROWS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def _sorted_quantiles(sorted_values, q):
+    """
+    Kwantyle z kolumn już posortowanych (interpolacja liniowa jak w np.quantile)
+    """
+    n = sorted_values.shape[0]
+    position = q * (n - 1)
+    low = int(np.floor(position))
+    high = min(low + 1, n - 1)
+    gamma = position - low
+    a, b = sorted_values[low], sorted_values[high]
+    diff = b - a
+    # Ten sam wzór co w numpy, aby wyniki były identyczne z df.quantile()
+    return b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma
+
+
+def describe_numeric(df, features=None, iqr_factor=IQR_FACTOR):
+    """
+    Statystyki opisowe i granice IQR dla wszystkich cech naraz
+
+    Zwraca ramkę (wiersz = cecha) z kolumnami: count, mean, std, min, 25%, 50%,
+    75%, max, iqr, lower_bound, upper_bound, n_outliers.
+    """
+    features = list(df.columns) if features is None else list(features)
+    values = df[features].to_numpy(dtype=np.float64)
+    n = values.shape[0]
+
+    sorted_values = np.sort(values, axis=0)
+    q1 = _sorted_quantiles(sorted_values, 0.25)
+    median = _sorted_quantiles(sorted_values, 0.5)
+    q3 = _sorted_quantiles(sorted_values, 0.75)
+    iqr = q3 - q1
+    lower_bound = q1 - iqr_factor * iqr
+    upper_bound = q3 + iqr_factor * iqr
+
+    # Wartości odstające: x < dolna granica lub x > górna granica
+    n_outliers = np.array([
+        np.searchsorted(column, low, side='left') + n - np.searchsorted(column, high, side='right')
+        for column, low, high in zip(sorted_values.T, lower_bound, upper_bound)
+    ])
+
+    return _stats_frame(features, n, values.mean(axis=0), values.std(axis=0, ddof=1),
+                        sorted_values[0], q1, median, q3, sorted_values[-1],
+                        lower_bound, upper_bound, n_outliers)
+
+
+def _stats_frame(features, n, mean, std, minimum, q1, median, q3, maximum,
+                 lower_bound, upper_bound, n_outliers):
+    return pd.DataFrame({
+        'count': np.full(len(features), float(n)),
+        'mean': mean,
+        'std': std,
+        'min': minimum,
+        '25%': q1,
+        '50%': median,
+        '75%': q3,
+        'max': maximum,
+        'iqr': q3 - q1,
+        'lower_bound': lower_bound,
+        'upper_bound': upper_bound,
+        'n_outliers': n_outliers
+    }, index=pd.Index(features, name='feature'))
+
+
+def describe_sketch(moments, sketches, iqr_factor=IQR_FACTOR):
+    """
+    Statystyki opisowe ze stanów strumieniowych (ten sam układ co describe_numeric)
+
+    Liczność, średnia, odchylenie, minimum i maksimum pochodzą z momentów
+    (dokładne), kwartyle i liczby wartości odstających - ze szkiców KLL
+    (błąd rangi rzędu 1/SKETCH_K).
+
+    Args:
+        moments: streaming.Moments dla cech
+        sketches: słownik {cecha: streaming.QuantileSketch}
+    """
+    features = list(sketches)
+    quartiles = np.array([sketch.quantile([0.25, 0.5, 0.75]) for sketch in sketches.values()])
+    q1, median, q3 = quartiles.T
+    iqr = q3 - q1
+    lower_bound = q1 - iqr_factor * iqr
+    upper_bound = q3 + iqr_factor * iqr
+    n_outliers = np.array([
+        sketch.rank(low, side='left') + sketch.n - sketch.rank(high, side='right')
+        for sketch, low, high in zip(sketches.values(), lower_bound, upper_bound)
+    ])
+    return _stats_frame(features, moments.n, moments.mean, moments.std(), moments.min,
+                        q1, median, q3, moments.max, lower_bound, upper_bound, n_outliers)
+
+
+def as_describe(stats):
+    """Widok wyników w układzie df.describe() (wiersze = statystyki)"""
+    return stats[DESCRIBE_ROWS].T.rename_axis(columns=None)
+
+
+def _compute_descriptive_stats(df, by):
+    tables = {'all': describe_numeric(df)}
+    groups = df[by].to_numpy()
+    for key in np.unique(groups):
+        tables[str(key)] = describe_numeric(df[groups == key])
+    return pd.concat(tables, names=['group'])
+
+
+def _compute_sketch_stats(path, by, chunksize=CHUNK_SIZE):
+    """Statystyki w jednym przebiegu po porcjach pliku (pamięć niezależna od liczby wierszy)"""
+    features = list(SCHEMA)
+    reducers = [MomentsReducer(features), QuantileSketchReducer(features),
+                MomentsReducer(features, by=by), QuantileSketchReducer(features, by=by)]
+    run_pipeline(iter_chunks(path, chunksize), reducers)
+    moments, sketches, moments_by_group, sketches_by_group = reducers
+
+    tables = {'all': describe_sketch(moments.states[None], sketches.result()[None])}
+    sketches_by_group = sketches_by_group.result()
+    for key, state in sorted(moments_by_group.states.items()):
+        tables[str(key)] = describe_sketch(state, sketches_by_group[key])
+    return pd.concat(tables, names=['group'])
+
+
+def resolve_stats_method(path=DATA_PATH, method='auto'):
+    """Zamienia tryb 'auto' na 'exact' (małe pliki) lub 'sketch' (duże pliki)"""
+    if method not in ('auto', 'exact', 'sketch'):
+        raise ValueError(f"Nieznany tryb statystyk: {method} (dostępne: auto, exact, sketch)")
+    if method == 'auto':
+        method = 'exact' if os.path.getsize(path) <= EXACT_MAX_BYTES else 'sketch'
+    return method
+
+
+def _stats_path(path, name, method, extension):
+    """Ścieżka wyniku w data/cache/ (klucz skrótu CSV, tryb i wersja formatu w nazwie)"""
+    suffix = '' if method == 'exact' else f'_sketch{SKETCH_K}'
+    return os.path.join(CACHE_DIR, cache_key(path), f'{name}{suffix}_v{STATS_VERSION}.{extension}')
+
+
+def load_descriptive_stats(path=DATA_PATH, by=TARGET, method='auto'):
+    """
+    Statystyki opisowe wszystkich kolumn - ogółem i w grupach zmiennej `by`
+
+    Wyniki są liczone raz na zawartość pliku CSV i zapisywane w data/cache/.
+    Tryb 'exact' sortuje kolumny w pamięci, tryb 'sketch' liczy kwartyle
+    i wartości odstające szkicami KLL w jednym przebiegu po porcjach pliku,
+    'auto' wybiera tryb na podstawie rozmiaru pliku (EXACT_MAX_BYTES).
+    Zwraca krotkę (statystyki_ogółem, {wartość_grupy: statystyki_grupy}).
+    """
+    method = resolve_stats_method(path, method)
+    stats_path = _stats_path(path, f'descriptive_stats_{by}', method, 'csv')
+
+    if os.path.exists(stats_path):
+        table = pd.read_csv(stats_path, index_col=['group', 'feature'],
+                            dtype={'group': str}, float_precision='round_trip')
+    else:
+        if method == 'exact':
+            table = _compute_descriptive_stats(load_data(path), by)
+        else:
+            table = _compute_sketch_stats(path, by)
+        os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+        tmp_path = f'{stats_path}.tmp{os.getpid()}'
+        table.to_csv(tmp_path)
+        os.replace(tmp_path, stats_path)
+
+    groups = table.index.get_level_values('group').unique()
+    by_group = {int(key): table.loc[key] for key in groups if key != 'all'}
+    return table.loc['all'], by_group
+
+
+def _compute_distribution_aggregates(chunks, stats_all, stats_by_group, by):
+    """Agregaty ogółem i w grupach w jednym przebiegu po porcjach danych"""
+    overall = DistributionReducer(NUMERICAL_FEATURES, {None: stats_all})
+    grouped = DistributionReducer(NUMERICAL_FEATURES, stats_by_group, by=by)
+    aggregates_all, aggregates_by_group = run_pipeline(chunks, [overall, grouped])
+    return {'all': aggregates_all[None], **{str(key): value for key, value in aggregates_by_group.items()}}
+
+
+def _aggregate_to_json(aggregate):
+    entry = {name: value.tolist() if isinstance(value, np.ndarray) else value
+             for name, value in aggregate.items() if name != 'hist'}
+    entry['hist'] = {str(bins): {'edges': edges.tolist(), 'counts': counts.tolist()}
+                     for bins, (edges, counts) in aggregate['hist'].items()}
+    return entry
+
+
+def _aggregate_from_json(entry):
+    aggregate = dict(entry)
+    aggregate['fliers'] = np.array(entry['fliers'], dtype=np.float64)
+    aggregate['sample'] = np.array(entry['sample'], dtype=np.float64)
+    aggregate['hist'] = {int(bins): (np.array(hist['edges']), np.array(hist['counts'], dtype=np.int64))
+                         for bins, hist in entry['hist'].items()}
+    return aggregate
+
+
+def read_distribution_aggregates(artifact_path):
+    """
+    Agregaty rozkładów z pliku JSON (np. skopiowanego z przebiegu produkcyjnego)
+
+    Zwraca krotkę ({cecha: agregat ogółem}, {wartość_grupy: {cecha: agregat}}).
+    Agregat: n, mean, min, max, q1, med, q3, whislo, whishi, n_fliers, fliers,
+    hist {liczba przedziałów: (granice, liczności)}, sample.
+    """
+    with open(artifact_path, 'r', encoding='utf-8') as f:
+        artifact = json.load(f)
+    groups = {key: {feature: _aggregate_from_json(entry) for feature, entry in features.items()}
+              for key, features in artifact['groups'].items()}
+    return groups.pop('all'), {int(key): value for key, value in groups.items()}
+
+
+def load_distribution_aggregates(path=DATA_PATH, by=TARGET, method='auto'):
+    """
+    Agregaty rozkładów cech numerycznych - ogółem i w grupach zmiennej `by`
+
+    Granice histogramów, kwartyle i granice IQR pochodzą ze statystyk opisowych
+    (load_descriptive_stats, ten sam tryb), wąsy, wartości odstające i liczności
+    - z jednego przebiegu po danych (po porcjach pliku w trybie 'sketch').
+    Wynik zapisywany jest raz na zawartość pliku CSV jako JSON w data/cache/.
+    """
+    method = resolve_stats_method(path, method)
+    artifact_path = _stats_path(path, f'distribution_aggregates_{by}', method, 'json')
+
+    if not os.path.exists(artifact_path):
+        stats_all, stats_by_group = load_descriptive_stats(path, by, method)
+        chunks = [load_data(path)] if method == 'exact' else iter_chunks(path)
+        groups = _compute_distribution_aggregates(chunks, stats_all, stats_by_group, by)
+        artifact = {
+            'version': STATS_VERSION,
+            'by': by,
+            'method': method,
+            'groups': {key: {feature: _aggregate_to_json(aggregate) for feature, aggregate in features.items()}
+                       for key, features in groups.items()}
+        }
+        os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
+        tmp_path = f'{artifact_path}.tmp{os.getpid()}'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(artifact, f)
+        os.replace(tmp_path, artifact_path)
+
+    return read_distribution_aggregates(artifact_path)
+
+
+def boxplot_stats(aggregate, label=None):
+    """Słownik dla Axes.bxp() z agregatu rozkładu (odpowiednik cbook.boxplot_stats)"""
+    return {
+        'med': aggregate['med'], 'q1': aggregate['q1'], 'q3': aggregate['q3'],
+        'whislo': aggregate['whislo'], 'whishi': aggregate['whishi'],
+        'fliers': aggregate['fliers'], 'mean': aggregate['mean'], 'label': label
+    }
+
+
+def _source_state(path):
+    """Opis pliku, z którego zbudowano stan: rozmiar (bajt końca) i skrót zawartości"""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.seek(max(size - 1, 0))
+        complete = f.read(1) == b'\n'
+    return {'size': size, 'sha256': file_hash(path), 'complete': complete}
+
+
+def load_eda_state(path=DATA_PATH):
+    """
+    Łączalny stan statystyk (momenty, współmomenty, tabele kontyngencji)
+
+    Stan zapisywany jest w data/cache/ pod kluczem ścieżki pliku, razem z opisem
+    źródła (rozmiar w bajtach, skrót SHA-256, liczba wierszy). Jeśli plik CSV
+    został tylko uzupełniony na końcu (początek zgadza się ze skrótem), do stanu
+    dopisywane są wyłącznie nowe wiersze - od zapisanego bajtu końca, w
+    O(liczba nowych wierszy). Każda inna zmiana pliku oznacza pełną przebudowę.
+
+    Zapisany stan to zwykły plik EDAState - ten sam format, który aktualizuje
+    streaming.py update, a stany z osobnych plików łączy EDAState.merge().
+    """
+    path_key = hashlib.sha256(os.path.realpath(path).encode()).hexdigest()[:16]
+    state_dir = os.path.join(CACHE_DIR, 'eda_state', path_key)
+    state_path = os.path.join(state_dir, f'eda_state_v{STATS_VERSION}.npz')
+    source_path = os.path.join(state_dir, 'source.json')
+
+    state = None
+    if os.path.exists(state_path) and os.path.exists(source_path):
+        with open(source_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        size = os.path.getsize(path)
+        if (previous['complete'] and previous['size'] <= size
+                and file_hash(path, size=previous['size']) == previous['sha256']):
+            state = EDAState.load(state_path)
+            if state.n_rows != previous['n_rows']:
+                # Stan i opis źródła z różnych zapisów - przebudowa
+                state = None
+            elif previous['size'] == size:
+                return state
+
+    source = _source_state(path)
+    if state is None:
+        # Stan łączalny - budowa po porcjach pliku, bez wczytywania całej tabeli
+        state, _ = build_state(path)
+    else:
+        # Plik tylko uzupełniony na końcu - dopisanie nowych wierszy
+        state, _ = build_state(path, state=state, offset=previous['size'])
+    if os.path.getsize(path) != source['size']:
+        # Plik zmienił się w trakcie odczytu - stan bez zapisu
+        return state
+
+    os.makedirs(state_dir, exist_ok=True)
+    state.save(state_path)
+    source['n_rows'] = int(state.n_rows)
+    tmp_path = f'{source_path}.tmp{os.getpid()}'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(source, f)
+    os.replace(tmp_path, source_path)
+    return state
+
+
+if __name__ == '__main__':
+    # Raport wartości odstających, także dla plików większych niż pamięć:
+    #   python eda_stats.py [ścieżka_do_csv] [auto|exact|sketch]
+    path = sys.argv[1] if len(sys.argv) > 1 else DATA_PATH
+    method = resolve_stats_method(path, sys.argv[2] if len(sys.argv) > 2 else 'auto')
+    stats_all, _ = load_descriptive_stats(path, method=method)
+
+    print("="*80)
+    print(f"WARTOŚCI ODSTAJĄCE (METODA IQR, TRYB: {method})")
+    print("="*80)
+    for feature in NUMERICAL_FEATURES:
+        n_outliers = int(stats_all.at[feature, 'n_outliers'])
+        print(f"\n{feature}:")
+        print(f"  Zakres normalny: [{stats_all.at[feature, 'lower_bound']:.2f}, "
+              f"{stats_all.at[feature, 'upper_bound']:.2f}]")
+        print(f"  Liczba wartości odstających: {n_outliers} "
+              f"({n_outliers/stats_all.at[feature, 'count']*100:.2f}%)")
@@ -0,0 +1,88 @@
+"""
+Eksport zestawu wykresów do jednego pliku PDF
+=============================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Cały zestaw wykresów skryptów 02, 04, 06, 08 i 09 w jednym pliku:
+1. Zadania wykresów (build_jobs) pobierane ze skryptów - te same funkcje
+   rysujące i dane wejściowe co przy zapisie plików PNG
+2. Wszystkie strony rysowane w jednym procesie do jednego wektorowego PDF
+   (figure_jobs.export_pdf) - wspólne czcionki i zasoby, bez startu puli
+   procesów i bez rastrowania stron w 300 dpi
+3. Profil roboczy (--draft): elementy rastrowe w DRAFT_DPI - mniejszy plik
+   do szybkiego przeglądu
+
+Eksport korzysta wyłącznie z zapisanych wyników (03, 05, 07 i historii treningu 09).
+
+Użycie:
+    python export_figures.py [--draft] [skrypt ...]
+    (np. python export_figures.py 02_generate_thesis_figures.py)
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import time
+
+from figure_jobs import STYLE, draft_style, export_pdf
+
+RESULTS_DIR = '../results'
+PDF_PATH = f'{RESULTS_DIR}/figures.pdf'
+DRAFT_PDF_PATH = f'{RESULTS_DIR}/figures_draft.pdf'
+
+
+def learning_curve_jobs(module):
+    """09: wykresy z zapisanych historii treningu (eksport nigdy nie trenuje modeli)"""
+    with open(os.path.join(RESULTS_DIR, module.HISTORIES_NAME), 'r') as f:
+        return module.build_jobs(json.load(f)), STYLE
+
+
+# Skrypty z wykresami: {plik: funkcja zwracająca (zadania, styl) z modułu skryptu}
+FIGURE_SCRIPTS = {
+    '02_generate_thesis_figures.py': lambda module: (module.build_jobs(), module.THESIS_STYLE),
+    '04_random_forest_visualizations.py': lambda module: (module.build_jobs(), STYLE),
+    '06_feature_engineering_visualizations.py': lambda module: (module.build_jobs(), STYLE),
+    '08_neural_network_visualizations.py': lambda module: (module.build_jobs(), STYLE),
+    '09_generate_learning_curves.py': learning_curve_jobs,
+}
+
+
+def load_script(filename):
+    """Import skryptu jako modułu (kod główny w bloku __main__ nie jest wykonywany)"""
+    name = 'figures_' + os.path.splitext(filename)[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(os.path.dirname(__file__), filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def collect_jobs(scripts=None, draft=False):
+    """Lista par (zadania, styl) - po jednej dla każdego skryptu"""
+    job_sets = []
+    for filename in scripts or FIGURE_SCRIPTS:
+        jobs, style = FIGURE_SCRIPTS[filename](load_script(filename))
+        job_sets.append((jobs, draft_style(style) if draft else style))
+    return job_sets
+
+
+if __name__ == '__main__':
+    draft = '--draft' in sys.argv
+    scripts = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    path = DRAFT_PDF_PATH if draft else PDF_PATH
+
+    print("="*80)
+    print("EKSPORT WYKRESÓW DO PLIKU PDF" + (" (PROFIL ROBOCZY)" if draft else ""))
+    print("="*80)
+
+    start = time.perf_counter()
+    job_sets = collect_jobs(scripts, draft)
+    n_pages = export_pdf(job_sets, path, title='Heart Failure - wykresy')
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*80)
+    print(f"✓ Zapisano {n_pages} stron: {path} "
+          f"({os.path.getsize(path) / 1024:.0f} KB, {elapsed:.1f} s)")
+    print("="*80)
@@ -0,0 +1,377 @@
+"""
+Równoległe generowanie wykresów
+===============================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Wspólny mechanizm renderowania wykresów dla skryptów 02, 04, 06, 08 i 09:
+1. Każdy wykres to zadanie FigureJob: funkcja rysująca (zdefiniowana na
+   poziomie modułu) + słownik gotowych danych wejściowych. Funkcja nie
+   wczytuje plików ani nie liczy statystyk - tylko rysuje i zwraca figurę.
+2. render_jobs() rozdziela zadania na pulę procesów; każdy proces roboczy
+   ustawia raz backend Agg i wspólny styl (rcParams), a następnie zapisuje
+   swoje wykresy PNG
+3. Przy n_jobs=1 (lub jednym zadaniu) wykresy powstają w bieżącym procesie
+4. Przebudowa przyrostowa: dla każdego pliku PNG manifest
+   (figure_manifest.json w katalogu wykresów) przechowuje odciski
+   - danych wejściowych (skrót joblib.hash słownika inputs)
+   - kodu (źródło funkcji rysującej, użytych przez nią funkcji pomocniczych
+     z modułów projektu i stałych modułu, styl rcParams i wersja matplotlib)
+   Renderowane są tylko wykresy, których plik nie istnieje albo odcisk się
+   zmienił; force=True wymusza przebudowę wszystkich.
+5. Profil roboczy (draft=True): PNG w niskiej rozdzielczości (DRAFT_DPI)
+   w podkatalogu draft/ - szybkie iteracje bez nadpisywania wykresów do pracy
+6. export_pdf(): cały zestaw wykresów jako strony jednego wektorowego PDF
+   (jeden proces, wspólne czcionki i zasoby dokumentu) - export_figures.py
+
+Skrypty wywołujące render_jobs() muszą mieć kod główny w bloku
+if __name__ == '__main__' (wymóg puli procesów przy metodzie startu spawn).
+
+Użycie:
+    jobs = [FigureJob('../results/fig.png', plot_fn, {'values': values}, 'Opis')]
+    render_jobs(jobs)               # tylko nieaktualne wykresy
+    render_jobs(jobs, force=True)   # wszystkie wykresy
+    render_jobs(jobs, draft=True)   # szkice w ../results/draft/
+    export_pdf([(jobs, STYLE)], '../results/figures.pdf')
+"""
+
+import inspect
+import json
+import os
+import types
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import joblib
+import numpy as np
+
+# Wspólna konfiguracja matplotlib dla polskich znaków i wysokiej jakości
+STYLE = {
+    'font.family': 'DejaVu Sans',
+    'font.size': 11,
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 16,
+    'figure.dpi': 300,
+    'savefig.dpi': 300,
+    'savefig.bbox': 'tight'
+}
+
+# Nazwa pliku manifestu (w katalogu z wykresami)
+MANIFEST_NAME = 'figure_manifest.json'
+
+# Profil roboczy: rozdzielczość i podkatalog szkiców (obok wykresów docelowych)
+DRAFT_DPI = 72
+DRAFT_DIR = 'draft'
+
+# Katalog modułów projektu - funkcje zdefiniowane w tych plikach wchodzą do odcisku kodu
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class FigureJob:
+    """
+    Jeden wykres: ścieżka pliku PNG, funkcja rysująca i jej dane wejściowe
+
+    render(**inputs) musi zwrócić obiekt matplotlib.figure.Figure.
+    """
+
+    def __init__(self, path, render, inputs=None, title=None):
+        self.path = path
+        self.render = render
+        self.inputs = inputs or {}
+        self.title = title or os.path.basename(path)
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    def draft(self):
+        """To samo zadanie z plikiem w podkatalogu szkiców (DRAFT_DIR)"""
+        directory = os.path.join(os.path.dirname(self.path), DRAFT_DIR)
+        return FigureJob(os.path.join(directory, self.name), self.render, self.inputs, self.title)
+
+    def __repr__(self):
+        return f'FigureJob({self.name!r})'
+
+
+# ============================================================================
+# ODCISKI DANYCH I KODU
+# ============================================================================
+
+def _canonical(value):
+    """
+    Postać danych niezależna od wewnętrznego układu obiektów pandas
+
+    Ta sama ramka policzona od nowa i wczytana z cache w data/cache/ ma
+    różne bloki pamięci (inny pickle), choć identyczne wartości.
+    """
+    import pandas as pd
+    if isinstance(value, pd.DataFrame):
+        return ('DataFrame', _canonical(value.index), list(map(str, value.columns)),
+                [value[column].to_numpy() for column in value.columns])
+    if isinstance(value, pd.Series):
+        return ('Series', str(value.name), _canonical(value.index), value.to_numpy())
+    if isinstance(value, pd.Index):
+        return ('Index', [str(name) for name in value.names], np.asarray(value.tolist(), dtype=object))
+    if isinstance(value, dict):
+        return ('dict', [(key, _canonical(item)) for key, item in value.items()])
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, [_canonical(item) for item in value])
+    return value
+
+
+def input_fingerprint(inputs):
+    """Skrót danych wejściowych (tablice, ramki pandas, słowniki, liczby)"""
+    return joblib.hash(_canonical(inputs))
+
+
+def _global_names(code):
+    """Nazwy globalne użyte w kodzie funkcji, łącznie z zagnieżdżonymi (np. wyrażenia listowe)"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _is_project_code(obj):
+    """Czy obiekt pochodzi z modułu projektu (plik źródłowy w katalogu notebooks/), a nie z biblioteki"""
+    try:
+        source = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return source is not None and os.path.dirname(os.path.abspath(source)) == PROJECT_DIR
+
+
+def code_fingerprint(func, _seen=None):
+    """
+    Skrót kodu funkcji: jej źródło, źródła wywoływanych funkcji i klas z modułów
+    projektu (także importowanych, np. eda_stats.boxplot_stats) oraz wartości
+    użytych stałych modułu (kolory, słowniki nazw)
+
+    Moduły i obiekty z bibliotek są pomijane - zmiana jednej funkcji rysującej
+    lub pomocniczej unieważnia tylko wykresy, które z niej korzystają.
+    """
+    seen = set() if _seen is None else _seen
+    seen.add(func)
+    parts = [inspect.getsource(func)]
+    names = _global_names(func.__code__)
+    for name in sorted(names):
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if isinstance(value, types.ModuleType):
+            if _is_project_code(value):
+                # Odwołania przez atrybut modułu projektu (eda_stats.boxplot_stats)
+                for attr in sorted(names):
+                    member = getattr(value, attr, None)
+                    if inspect.isfunction(member) and member not in seen and _is_project_code(member):
+                        parts.append(code_fingerprint(member, seen))
+            continue
+        if inspect.isfunction(value) or inspect.isclass(value):
+            if value not in seen and _is_project_code(value):
+                seen.add(value)
+                parts.append(code_fingerprint(value, seen) if inspect.isfunction(value)
+                             else inspect.getsource(value))
+            continue
+        try:
+            parts.append(f'{name}={joblib.hash(value)}')
+        except Exception:
+            parts.append(f'{name}={value!r}')
+    return joblib.hash(parts)
+
+
+def job_fingerprint(job, style=STYLE):
+    """Odcisk wykresu: {'inputs': skrót danych, 'code': skrót kodu i stylu}"""
+    import matplotlib
+    return {
+        'inputs': input_fingerprint(job.inputs),
+        'code': joblib.hash([code_fingerprint(job.render), style, matplotlib.__version__])
+    }
+
+
+class FigureManifest:
+    """
+    Odciski wygenerowanych plików w jednym katalogu ({nazwa pliku: odcisk})
+
+    Zapis łączy wpisy z aktualną zawartością pliku na dysku, więc kilka
+    skryptów może równolegle aktualizować manifest tego samego katalogu.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.entries = self._read()
+        self._updated = {}
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Uszkodzony manifest - wszystkie pliki traktowane jako nieaktualne
+            return {}
+
+    def is_current(self, name, fingerprint):
+        """Czy plik istnieje i został wygenerowany z tym samym odciskiem"""
+        return (os.path.exists(os.path.join(self.directory, name))
+                and self.entries.get(name) == fingerprint)
+
+    def record(self, name, fingerprint):
+        self.entries[name] = fingerprint
+        self._updated[name] = fingerprint
+
+    def save(self):
+        entries = {**self._read(), **self._updated}
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self.path}.tmp{os.getpid()}'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.entries = entries
+
+
+# ============================================================================
+# RENDEROWANIE
+# ============================================================================
+
+def _init_worker(style):
+    """Inicjalizacja procesu roboczego: backend Agg i styl wykresów"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(style)
+    warnings.filterwarnings('ignore')
+
+
+def _render(job):
+    """Rysuje i zapisuje jeden wykres (wykonywane w procesie roboczym)"""
+    import matplotlib.pyplot as plt
+    fig = job.render(**job.inputs)
+    fig.savefig(job.path)
+    plt.close(fig)
+    return job.name
+
+
+def resolve_n_jobs(n_jobs, n_tasks):
+    """Liczba procesów jak w joblib (-1 = wszystkie rdzenie), najwyżej n_tasks"""
+    cpu_count = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == 0:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = max(1, cpu_count + 1 + n_jobs)
+    return max(1, min(n_jobs, n_tasks))
+
+
+def draft_style(style=STYLE):
+    """Styl profilu roboczego: ten sam wygląd, rozdzielczość DRAFT_DPI"""
+    return {**style, 'figure.dpi': DRAFT_DPI, 'savefig.dpi': DRAFT_DPI}
+
+
+def render_jobs(jobs, n_jobs=-1, style=STYLE, force=False, draft=False):
+    """
+    Renderuje nieaktualne zadania i zwraca listę nazw zapisanych plików
+
+    Wykresy z aktualnym odciskiem w manifeście są pomijane (chyba że
+    force=True). Postęp wypisywany jest w kolejności ukończenia wykresów.
+    draft=True zapisuje szkice (DRAFT_DPI) w podkatalogu DRAFT_DIR,
+    z osobnym manifestem.
+    """
+    jobs = list(jobs)
+    if draft:
+        jobs = [job.draft() for job in jobs]
+        style = draft_style(style)
+    manifests = {}
+    fingerprints = {}
+    stale = []
+    for job in jobs:
+        directory = os.path.dirname(os.path.abspath(job.path))
+        if directory not in manifests:
+            manifests[directory] = FigureManifest(directory)
+        fingerprints[job.path] = job_fingerprint(job, style)
+        if force or not manifests[directory].is_current(job.name, fingerprints[job.path]):
+            stale.append(job)
+
+    skipped = len(jobs) - len(stale)
+    print(f"\nWykresy do wygenerowania: {len(stale)}/{len(jobs)}"
+          + (f" (aktualne, pominięte: {skipped})" if skipped else ""))
+    jobs = stale
+    if not jobs:
+        return []
+    for directory in manifests:
+        os.makedirs(directory, exist_ok=True)
+
+    n_workers = resolve_n_jobs(n_jobs, len(jobs))
+    saved = []
+
+    def report(job):
+        saved.append(job.name)
+        print(f"[{len(saved)}/{len(jobs)}] {job.title}")
+        print(f"   ✓ Zapisano: {job.name}")
+        # Manifest zapisywany po każdym wykresie - przerwany przebieg zachowuje postęp
+        manifest = manifests[os.path.dirname(os.path.abspath(job.path))]
+        manifest.record(job.name, fingerprints[job.path])
+        manifest.save()
+
+    if n_workers == 1:
+        _init_worker(style)
+        for job in jobs:
+            _render(job)
+            report(job)
+        return saved
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(style,)) as executor:
+        futures = {executor.submit(_render, job): job for job in jobs}
+        for future in as_completed(futures):
+            future.result()
+            report(futures[future])
+    return saved
+
+
+def export_pdf(job_sets, path, title=None):
+    """
+    Zapisuje wykresy jako kolejne strony jednego pliku PDF i zwraca liczbę stron
+
+    Args:
+        job_sets: lista par (zadania, styl rcParams) - np. jedna para na skrypt
+        path: ścieżka pliku PDF
+        title: tytuł w metadanych dokumentu
+
+    Wszystkie strony powstają w bieżącym procesie i jednym dokumencie:
+    czcionki (podzbiory glifów) i inne zasoby są zapisywane raz dla całego
+    pliku. Elementy rastrowe (obrazy gęstości) mają rozdzielczość savefig.dpi
+    stylu - draft_style() zmniejsza plik szkicu.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+    warnings.filterwarnings('ignore')
+
+    job_sets = [(list(jobs), style) for jobs, style in job_sets]
+    n_pages = sum(len(jobs) for jobs, _ in job_sets)
+    print(f"\nStrony do wygenerowania: {n_pages}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Zapis do pliku tymczasowego - przerwany eksport nie psuje poprzedniego pliku;
+    # bez daty utworzenia plik zależy tylko od treści wykresów
+    tmp_path = f'{path}.tmp{os.getpid()}.pdf'
+    page = 0
+    with PdfPages(tmp_path, metadata={'Title': title, 'CreationDate': None}) as pdf:
+        for jobs, style in job_sets:
+            with plt.rc_context(style):
+                for job in jobs:
+                    fig = job.render(**job.inputs)
+                    pdf.savefig(fig)
+                    plt.close(fig)
+                    page += 1
+                    print(f"[{page}/{n_pages}] {job.title}")
+    os.replace(tmp_path, path)
+    return n_pages
@@ -0,0 +1,232 @@
+"""
+Płaska reprezentacja lasu losowego i wektorowa predykcja
+========================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Szybka predykcja lasu z 03_random_forest_model.py (pojedyncze wiersze i duże porcje):
+1. Eksport wszystkich drzew do ciągłych tablic NumPy: cecha, próg, lewe/prawe
+   dziecko (indeksy w tablicy całego lasu), kierunek braków danych i
+   prawdopodobieństwo klasy 1 w węźle; liść wskazuje sam na siebie
+2. Wartości cech zamieniane raz na kody przedziałów wyznaczonych przez progi lasu
+   (x <= próg  <=>  kod(x) <= kod(progu)) - wiersze o tych samych kodach trafiają
+   do tych samych liści, więc drzewa przechodzone są tylko dla unikalnych kodów
+3. Przejście wszystkich drzew naraz dla bloku wierszy: wektor par (drzewo, wiersz),
+   z którego w każdym kroku usuwane są pary, które doszły do liścia
+4. Wynik identyczny bitowo z RandomForestClassifier.predict_proba: wejście
+   rzutowane na float32 jak w sklearn, prawdopodobieństwa liści normalizowane
+   jak w DecisionTreeClassifier i sumowane w kolejności drzew
+
+Użycie:
+    from flat_forest import FlatForest
+    engine = FlatForest.from_sklearn(best_rf)
+    proba = engine.predict_proba(X_scaled)   # == best_rf.predict_proba(X_scaled)[:, 1]
+"""
+
+import numpy as np
+
+# Oznaczenie liścia w tablicach drzew sklearn (children_left)
+TREE_LEAF = -1
+
+# Rozmiar bloku przejścia: liczba par (drzewo, wiersz) przetwarzanych naraz
+BLOCK_NODES = 1 << 16
+
+# Tablice węzłów i tablice pomocnicze przejścia (wyznaczane z węzłów, zapisywane w artefakcie modelu)
+NODE_ARRAYS = ('feature', 'threshold', 'left', 'right', 'missing_left', 'value', 'roots')
+INDEX_ARRAYS = ('is_leaf', 'children', 'threshold_code', 'edges', 'edge_offsets')
+
+# Siatka kodów do wyszukiwania unikalnych wierszy tablicą obecności (zamiast sortowania)
+DENSE_GRID_LIMIT = 1 << 24
+
+
+class FeatureBins:
+    """
+    Przedziały wartości cech wyznaczone przez progi lasu
+
+    Kod wartości to liczba progów cechy mniejszych od niej (searchsorted), więc
+    x <= próg  <=>  kod(x) <= kod(progu); brak danych ma osobny kod nan_code
+    za ostatnim przedziałem. Wiersze o tych samych kodach trafiają w każdym
+    drzewie do tego samego liścia.
+
+    Args:
+        edges: posortowane unikalne progi wszystkich cech, cecha po cesze
+        edge_offsets: początki progów kolejnych cech w edges (+ koniec)
+    """
+
+    def __init__(self, edges, edge_offsets):
+        # Krawędzie przedziałów cechy (widoki) i kod braku danych
+        self.feature_edges = [edges[start:end] for start, end in zip(edge_offsets[:-1], edge_offsets[1:])]
+        self.nan_code = np.diff(edge_offsets) + 1
+        radix = self.nan_code + 1
+        self._strides = np.concatenate([[1], np.cumprod(radix[:-1])]).astype(np.int64)
+        self._radix = radix
+        self._grid_size = int(np.prod(radix.astype(object)))
+
+    def codes(self, X):
+        """Kody przedziałów wartości cech (n_wierszy x n_cech)"""
+        codes = np.empty(X.shape, np.int32)
+        for feature, edges in enumerate(self.feature_edges):
+            column = X[:, feature]
+            codes[:, feature] = np.searchsorted(edges, column)
+            missing = np.isnan(column)
+            if missing.any():
+                codes[missing, feature] = self.nan_code[feature]
+        return codes
+
+    def unique_codes(self, codes):
+        """Unikalne wiersze kodów i indeks odtwarzający kolejność (None - bez redukcji)"""
+        n_rows = len(codes)
+        if n_rows < 2 or self._grid_size >= 2**62:
+            return codes, None
+        keys = codes @ self._strides
+        if self._grid_size <= min(n_rows, DENSE_GRID_LIMIT):
+            present = np.zeros(self._grid_size, bool)
+            present[keys] = True
+            cells = np.flatnonzero(present)
+            position = np.zeros(self._grid_size, np.intp)
+            position[cells] = np.arange(len(cells))
+            inverse = position[keys]
+        else:
+            cells, inverse = np.unique(keys, return_inverse=True)
+        return (cells[:, None] // self._strides) % self._radix, inverse
+
+
+class FlatForest:
+    """
+    Las w płaskich tablicach (węzły wszystkich drzew jeden za drugim)
+
+    Args:
+        feature, threshold: cecha i próg podziału węzła (w liściu bez znaczenia)
+        left, right: indeksy dzieci w tablicy lasu (liść - indeks własny)
+        missing_left: brak danych (NaN) kierowany do lewego dziecka
+        value: prawdopodobieństwo klasy 1 w węźle
+        roots: indeksy korzeni drzew
+        n_features: liczba cech wejściowych
+        max_depth: największa głębokość drzewa
+    """
+
+    def __init__(self, feature, threshold, left, right, missing_left, value, roots, n_features, max_depth,
+                 index=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.n_features = int(n_features)
+        self.max_depth = int(max_depth)
+        self._use_index(index or self._index_nodes())
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """Eksport RandomForestClassifier (klasyfikacja binarna) do płaskich tablic"""
+        if forest.n_outputs_ != 1 or forest.n_classes_ != 2:
+            raise ValueError("FlatForest obsługuje tylko klasyfikację binarną z jednym wyjściem")
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])
+
+        arrays = {name: [] for name in ('feature', 'threshold', 'left', 'right', 'missing_left', 'value')}
+        for tree, offset in zip(trees, offsets):
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == TREE_LEAF
+            # Normalizacja jak w DecisionTreeClassifier.predict_proba
+            value = tree.value[:, 0, :]
+            arrays['value'].append(value[:, 1] / value.sum(axis=1))
+            arrays['feature'].append(np.where(leaf, 0, tree.feature))
+            arrays['threshold'].append(tree.threshold)
+            arrays['left'].append(np.where(leaf, nodes, tree.children_left) + offset)
+            arrays['right'].append(np.where(leaf, nodes, tree.children_right) + offset)
+            arrays['missing_left'].append(tree.missing_go_to_left.astype(bool) & ~leaf)
+
+        dtypes = {'feature': np.int32, 'threshold': np.float64, 'left': np.int32, 'right': np.int32,
+                  'missing_left': np.bool_, 'value': np.float64}
+        return cls(**{name: np.concatenate(parts).astype(dtypes[name]) for name, parts in arrays.items()},
+                   roots=offsets[:-1].astype(np.int32), n_features=forest.n_features_in_,
+                   max_depth=max(tree.max_depth for tree in trees))
+
+    @classmethod
+    def from_arrays(cls, arrays, n_features, max_depth):
+        """Las z tablic to_arrays (np. widoków pliku mapowanego w pamięci) - bez przeliczania"""
+        index = {name: arrays[name] for name in INDEX_ARRAYS}
+        return cls(**{name: arrays[name] for name in NODE_ARRAYS}, n_features=n_features,
+                   max_depth=max_depth, index=index)
+
+    def to_arrays(self):
+        """Wszystkie tablice lasu: węzły i tablice pomocnicze przejścia"""
+        return {**{name: getattr(self, name) for name in NODE_ARRAYS},
+                **{name: getattr(self, name) for name in INDEX_ARRAYS}}
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    def _index_nodes(self):
+        """Tablice pomocnicze przejścia: liście, dzieci parami, kody progów i krawędzie przedziałów cech"""
+        is_leaf = self.left == np.arange(self.n_nodes)
+        threshold_code = np.zeros(self.n_nodes, np.int32)
+        edges = []
+        for feature in range(self.n_features):
+            mask = ~is_leaf & (self.feature == feature)
+            edges.append(np.unique(self.threshold[mask]))
+            threshold_code[mask] = np.searchsorted(edges[-1], self.threshold[mask])
+        return {'is_leaf': is_leaf,
+                'children': np.column_stack([self.left, self.right]).ravel(),
+                'threshold_code': threshold_code,
+                'edges': np.concatenate(edges),
+                'edge_offsets': np.cumsum([0] + [len(part) for part in edges]).astype(np.int64)}
+
+    def _use_index(self, index):
+        for name in INDEX_ARRAYS:
+            setattr(self, name, index[name])
+        self.bins = FeatureBins(self.edges, self.edge_offsets)
+        self.nan_code = self.bins.nan_code
+
+    def codes(self, X):
+        """Kody przedziałów wartości cech (n_wierszy x n_cech)"""
+        return self.bins.codes(X)
+
+    def _traverse(self, codes):
+        """Przejście wszystkich drzew dla wierszy kodów; średnia prawdopodobieństw liści"""
+        n_trees = len(self.roots)
+        proba = np.empty(len(codes))
+        block = max(1, BLOCK_NODES // n_trees)
+        has_missing = bool((codes == self.nan_code).any())
+
+        for start in range(0, len(codes), block):
+            part = codes[start:start + block]
+            flat = part.ravel()
+            # Pary (drzewo, wiersz) w kolejności drzew; aktywne - jeszcze nie w liściu
+            leaves = np.repeat(self.roots, len(part))
+            active = np.flatnonzero(~self.is_leaf[leaves])
+            nodes = leaves[active]
+            base = np.tile(np.arange(len(part), dtype=np.int32) * self.n_features, n_trees)[active]
+            while len(nodes):
+                feature = self.feature[nodes]
+                code = flat[base + feature]
+                go_right = code > self.threshold_code[nodes]
+                if has_missing:
+                    go_right = np.where(code == self.nan_code[feature], ~self.missing_left[nodes], go_right)
+                nodes = self.children[2 * nodes + go_right]
+                done = self.is_leaf[nodes]
+                if done.any():
+                    leaves[active[done]] = nodes[done]
+                    inner = ~done
+                    active, nodes, base = active[inner], nodes[inner], base[inner]
+
+            # Suma w kolejności drzew, potem dzielenie - jak w RandomForestClassifier
+            total = np.zeros(len(part))
+            for leaf_values in self.value[leaves].reshape(n_trees, len(part)):
+                total += leaf_values
+            proba[start:start + block] = total / n_trees
+        return proba
+
+    def predict_proba(self, X):
+        """Prawdopodobieństwo klasy 1 dla wierszy X (n_wierszy x n_cech)"""
+        X = np.asarray(X, dtype=np.float32)  # jak sklearn (drzewa porównują wartości float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Oczekiwano macierzy o {self.n_features} kolumnach, otrzymano kształt {X.shape}")
+        unique_codes, inverse = self.bins.unique_codes(self.bins.codes(X))
+        proba = self._traverse(unique_codes)
+        return proba if inverse is None else proba[inverse]
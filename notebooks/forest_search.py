@@ -0,0 +1,293 @@
+"""
+Przeszukiwanie hiperparametrów lasu z przyrostowym dokładaniem drzew
+====================================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Wszystkie wartości n_estimators oceniane jednym lasem na parę (konfiguracja, fold):
+1. Konfiguracje pozostałych hiperparametrów losowane jak w RandomizedSearchCV
+   (ParameterSampler), jeden wspólny podział na foldy
+2. Las każdej pary rośnie przyrostowo (warm_start=True) do kolejnych punktów
+   kontrolnych n_estimators (50, 100, 200, 300, 500) i jest oceniany w każdym
+   z nich - przy całkowitym random_state dołożone drzewa są identyczne jak
+   w lesie trenowanym od zera, więc wyniki są te same co dla osobnych
+   kandydatów n_estimators, a każde drzewo powstaje tylko raz
+3. Opcjonalnie successive halving po punktach kontrolnych (factor): dalej
+   rośnie tylko najlepsza 1/factor konfiguracji
+4. Tryb OOB (oob=True): konfiguracje z bootstrap oceniane jednym lasem na
+   całym zbiorze - każdy wiersz przewidują drzewa, których próba bootstrap
+   go nie zawierała (out-of-bag), więc jeden trening zastępuje k foldów;
+   pozostałe konfiguracje oceniane walidacją krzyżową. Wyniki OOB (las na
+   całym zbiorze) i CV (lasy na (k-1)/k zbioru) mają różne obciążenie, więc
+   nie są porównywane: halving odbywa się osobno w każdym protokole, a
+   konfiguracje OOB z ostatniego punktu kontrolnego (finaliści) są oceniane
+   ponownie walidacją krzyżową - best_params_ wybierany jest tylko z wyników CV
+5. Wyniki w układzie wyszukiwarek sklearn: best_params_, best_score_,
+   best_estimator_, cv_results_ (wiersz na parę konfiguracja x n_estimators,
+   z kolumnami iter i n_resources jak w HalvingRandomSearchCV)
+
+Użycie:
+    from forest_search import WarmStartForestSearchCV
+    search = WarmStartForestSearchCV(RandomForestClassifier(random_state=42),
+                                     param_distributions, cv=cv, scoring='f1')
+    search.fit(X_train, y_train)
+    search.best_params_
+"""
+
+import math
+import time
+import warnings
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.stats import rankdata
+from sklearn.base import clone
+from sklearn.metrics import (accuracy_score, precision_score, recall_score, f1_score,
+                             roc_auc_score, check_scoring)
+from sklearn.model_selection import ParameterSampler, check_cv
+
+# Punkty kontrolne liczby drzew (jak dotychczasowa siatka n_estimators w 03)
+N_ESTIMATORS_GRID = (50, 100, 200, 300, 500)
+
+# Metryki liczone z prawdopodobieństw out-of-bag (nazwy jak parametr scoring w sklearn)
+OOB_METRICS = {
+    'accuracy': lambda y, proba: accuracy_score(y, proba > 0.5),
+    'precision': lambda y, proba: precision_score(y, proba > 0.5, zero_division=0),
+    'recall': lambda y, proba: recall_score(y, proba > 0.5),
+    'f1': lambda y, proba: f1_score(y, proba > 0.5),
+    'roc_auc': roc_auc_score
+}
+
+# Oznaczenie oceny OOB zamiast foldu w zadaniach przeszukiwania
+OOB = 'oob'
+
+
+def oob_metrics(forest, y, metrics=('accuracy', 'f1', 'roc_auc')):
+    """
+    Metryki z prawdopodobieństw out-of-bag lasu wytrenowanego z oob_score=True
+
+    Prawdopodobieństwo klasy 1 dla wiersza to średnia drzew, których próba
+    bootstrap go nie zawierała (predykcja jak w predict: proba > 0.5).
+    Wiersze bez żadnego drzewa OOB (przy małych lasach) są pomijane - sklearn
+    zwraca dla nich [0, 0] (nie NaN), co liczyłoby się jako pewna klasa 0.
+    """
+    decision = forest.oob_decision_function_
+    proba = decision[:, 1]
+    scored = decision.sum(axis=1) > 0
+    y = np.asarray(y)
+    return {metric: OOB_METRICS[metric](y[scored], proba[scored]) for metric in metrics}
+
+
+def _grow(forest, n_estimators, X, y, train, test, scorer):
+    """
+    Dokłada drzewa do n_estimators i ocenia las na foldzie testowym
+    albo (train=None) na całym zbiorze z próbek out-of-bag
+    """
+    start = time.perf_counter()
+    forest.set_params(n_estimators=n_estimators)
+    if train is None:
+        forest.fit(X, y)
+        fit_time = time.perf_counter() - start
+        return oob_metrics(forest, y, [scorer])[scorer], fit_time
+    forest.fit(X[train], y[train])
+    fit_time = time.perf_counter() - start
+    return scorer(forest, X[test], y[test]), fit_time
+
+
+class WarmStartForestSearchCV:
+    """
+    Losowe przeszukiwanie hiperparametrów lasu z oceną w punktach kontrolnych n_estimators
+
+    Args:
+        estimator: las sklearn (RandomForestClassifier) z całkowitym random_state
+        param_distributions: przestrzeń pozostałych hiperparametrów (bez n_estimators)
+        n_estimators: rosnące punkty kontrolne liczby drzew
+        n_candidates: liczba losowanych konfiguracji
+        factor: None - wszystkie konfiguracje rosną do ostatniego punktu;
+                liczba - po każdym punkcie zostaje najlepsza 1/factor konfiguracji
+        oob: ocena konfiguracji z bootstrap=True wynikiem out-of-bag jednego lasu
+             (scoring musi być nazwą z OOB_METRICS)
+        n_finalists: liczba najlepszych (według OOB) konfiguracji OOB z ostatniego
+                     punktu kontrolnego ocenianych ponownie walidacją krzyżową;
+                     None - wszystkie, które dotarły do ostatniego punktu
+        cv, scoring, n_jobs, random_state, refit, verbose: jak w RandomizedSearchCV
+                (n_jobs - wątki; budowa drzew zwalnia GIL)
+    """
+
+    def __init__(self, estimator, param_distributions, n_estimators=N_ESTIMATORS_GRID,
+                 n_candidates=100, factor=None, oob=False, n_finalists=None, cv=5, scoring=None,
+                 n_jobs=None, random_state=None, refit=True, verbose=0):
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_estimators = n_estimators
+        self.n_candidates = n_candidates
+        self.factor = factor
+        self.oob = oob
+        self.n_finalists = n_finalists
+        self.cv = cv
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.refit = refit
+        self.verbose = verbose
+
+    def fit(self, X, y):
+        X, y = np.asarray(X), np.asarray(y)
+        checkpoints = sorted(self.n_estimators)
+        folds = list(check_cv(self.cv, y, classifier=True).split(X, y))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+        if self.oob and self.scoring not in OOB_METRICS:
+            raise ValueError(f"Tryb OOB wymaga scoring z {sorted(OOB_METRICS)}, podano: {self.scoring!r}")
+        candidates = list(ParameterSampler(self.param_distributions, self.n_candidates,
+                                           random_state=self.random_state))
+
+        # Jeden las na parę (konfiguracja, fold) - albo jeden las OOB na konfigurację -
+        # rosnący przez wszystkie punkty kontrolne
+        bootstrap = self.estimator.get_params()['bootstrap']
+        splits = {}
+        forests = {}
+        for index, params in enumerate(candidates):
+            use_oob = self.oob and params.get('bootstrap', bootstrap)
+            splits[index] = [OOB] if use_oob else list(range(len(folds)))
+            for fold in splits[index]:
+                forests[index, fold] = clone(self.estimator).set_params(
+                    **params, warm_start=True, oob_score=fold == OOB)
+        alive = list(range(len(candidates)))
+        evaluations = []
+        self.n_candidates_, self.n_resources_ = [], []
+
+        for step, n_estimators in enumerate(checkpoints):
+            tasks = [(index, fold) for index in alive for fold in splits[index]]
+            if self.verbose:
+                n_oob = sum(splits[index] == [OOB] for index in alive)
+                print(f"n_estimators={n_estimators}: {len(alive)} konfiguracji "
+                      f"({n_oob} OOB, {len(alive) - n_oob} x {len(folds)} foldów)")
+            with warnings.catch_warnings():
+                # Ostrzeżenie sklearn o class_weight='balanced' przy warm_start dotyczy
+                # zmiany danych między wywołaniami fit - tu las rośnie zawsze na tym samym foldzie
+                warnings.filterwarnings('ignore', message='class_weight presets', category=UserWarning)
+                results = Parallel(n_jobs=self.n_jobs, prefer='threads')(
+                    delayed(_grow)(forests[index, fold], n_estimators, X, y,
+                                   *((None, None) if fold == OOB else folds[fold]),
+                                   self.scoring if fold == OOB else scorer)
+                    for index, fold in tasks)
+            results = dict(zip(tasks, results))
+
+            # Wiersz wyników: wyniki foldów (NaN przy ocenie OOB), wynik OOB (NaN przy CV), czasy
+            rows = []
+            for index in alive:
+                if splits[index] == [OOB]:
+                    score, fit_time = results[index, OOB]
+                    rows.append((np.full(len(folds), np.nan), score, np.array([fit_time])))
+                else:
+                    pairs = [results[index, fold] for fold in splits[index]]
+                    rows.append((np.array([score for score, _ in pairs]), np.nan,
+                                 np.array([fit_time for _, fit_time in pairs])))
+            scores = np.array([fold_scores.mean() if np.isnan(oob_score) else oob_score
+                               for fold_scores, oob_score, _ in rows])
+            evaluations += [(index, step, *row) for index, row in zip(alive, rows)]
+            self.n_candidates_.append(len(alive))
+            self.n_resources_.append(n_estimators)
+
+            if self.factor and step < len(checkpoints) - 1:
+                # Halving osobno w każdym protokole (OOB, CV) - wyniki porównywane tylko w obrębie protokołu
+                keep = set()
+                for use_oob in (True, False):
+                    group = [i for i, index in enumerate(alive) if (splits[index] == [OOB]) == use_oob]
+                    n_keep = math.ceil(len(group) / self.factor)
+                    order = np.argsort(-np.nan_to_num(scores[group], nan=-np.inf), kind='stable')
+                    keep.update(group[i] for i in order[:n_keep])
+                for i, index in enumerate(alive):
+                    if i not in keep:
+                        for fold in splits[index]:
+                            del forests[index, fold]
+                alive = [index for i, index in enumerate(alive) if i in keep]
+
+        forests.clear()
+        self._rescore_finalists(candidates, checkpoints[-1], evaluations, X, y, folds, scorer)
+        self.cv_results_ = self._cv_results(candidates, checkpoints, evaluations, len(folds))
+
+        # Najlepsza konfiguracja tylko spośród wyników CV (jeden protokół) - z ostatniego
+        # punktu kontrolnego (halving, jak w sklearn) albo z całej tabeli; przy remisie pierwsza
+        mean_scores = np.where(self.cv_results_['cv_scored'],
+                               np.nan_to_num(self.cv_results_['mean_test_score'], nan=-np.inf), -np.inf)
+        if self.factor:
+            mean_scores = np.where(self.cv_results_['iter'] == len(checkpoints) - 1, mean_scores, -np.inf)
+        self.best_index_ = int(np.argmax(mean_scores))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = self.cv_results_['mean_test_score'][self.best_index_]
+        if self.refit:
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        return self
+
+    def _rescore_finalists(self, candidates, n_estimators, evaluations, X, y, folds, scorer):
+        """
+        Walidacja krzyżowa konfiguracji OOB z ostatniego punktu kontrolnego
+
+        Finaliści to n_finalists najlepszych według OOB; ich lasy trenowane są
+        na foldach od razu do n_estimators drzew, a wyniki foldów trafiają do
+        wiersza ostatniego punktu kontrolnego (wynik OOB zostaje w oob_test_score).
+        """
+        last_step = max(step for _, step, _, _, _ in evaluations)
+        final_oob = [row for row, (_, step, _, oob_score, _) in enumerate(evaluations)
+                     if step == last_step and not np.isnan(oob_score)]
+        final_oob.sort(key=lambda row: -evaluations[row][3])
+        finalists = final_oob if self.n_finalists is None else final_oob[:self.n_finalists]
+        if not finalists:
+            return
+        if self.verbose:
+            print(f"Finaliści OOB oceniani walidacją krzyżową: {len(finalists)} x {len(folds)} foldów")
+
+        tasks = [(row, fold) for row in finalists for fold in range(len(folds))]
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='class_weight presets', category=UserWarning)
+            results = Parallel(n_jobs=self.n_jobs, prefer='threads')(
+                delayed(_grow)(clone(self.estimator).set_params(**candidates[evaluations[row][0]]),
+                               n_estimators, X, y, *folds[fold], scorer)
+                for row, fold in tasks)
+        results = dict(zip(tasks, results))
+        for row in finalists:
+            index, step, _, oob_score, times = evaluations[row]
+            pairs = [results[row, fold] for fold in range(len(folds))]
+            evaluations[row] = (index, step, np.array([score for score, _ in pairs]), oob_score,
+                                np.concatenate([times, [fit_time for _, fit_time in pairs]]))
+
+    @staticmethod
+    def _cv_results(candidates, checkpoints, evaluations, n_folds):
+        """
+        Tabela wyników w układzie cv_results_ wyszukiwarek sklearn
+
+        Wiersze ocenione tylko OOB mają NaN w kolumnach foldów i std_test_score,
+        a mean_test_score równe oob_test_score. Wiersze z wynikami foldów
+        (także finaliści OOB) mają mean_test_score z CV i cv_scored=True;
+        rank_test_score porządkuje tylko je (wiersze tylko OOB - na końcu).
+        """
+        params = [{**candidates[index], 'n_estimators': checkpoints[step]}
+                  for index, step, _, _, _ in evaluations]
+        scores = np.array([fold_scores for _, _, fold_scores, _, _ in evaluations])
+        oob_scores = np.array([oob_score for _, _, _, oob_score, _ in evaluations])
+        fit_times = [times for _, _, _, _, times in evaluations]
+        cv_scored = ~np.isnan(scores).all(axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # średnia z samych NaN (wiersze OOB)
+            mean_scores = np.where(cv_scored, np.nanmean(scores, axis=1), oob_scores)
+
+        results = {
+            'iter': np.array([step for _, step, _, _, _ in evaluations]),
+            'n_resources': np.array([checkpoints[step] for _, step, _, _, _ in evaluations]),
+            'mean_fit_time': np.array([times.mean() for times in fit_times]),
+            'std_fit_time': np.array([times.std() for times in fit_times]),
+            'params': params
+        }
+        for name in sorted({name for row in params for name in row}):
+            results[f'param_{name}'] = np.array([row.get(name) for row in params], dtype=object)
+        for fold in range(n_folds):
+            results[f'split{fold}_test_score'] = scores[:, fold]
+        results['oob_test_score'] = oob_scores
+        results['cv_scored'] = cv_scored
+        results['mean_test_score'] = mean_scores
+        results['std_test_score'] = scores.std(axis=1)
+        comparable = np.where(cv_scored, np.nan_to_num(mean_scores, nan=-np.inf), -np.inf)
+        results['rank_test_score'] = rankdata(-comparable, method='min').astype(np.int32)
+        return results
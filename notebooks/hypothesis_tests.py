@@ -0,0 +1,230 @@
+"""
+Testy statystyczne dla wszystkich cech naraz
+============================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Porównanie grup DEATH_EVENT (przeżyli vs zmarli) dla wszystkich cech
+jedną operacją macierzową zamiast pętli test-po-teście:
+- test t (Studenta lub Welcha) i test U Manna-Whitneya dla cech numerycznych
+  (scipy.stats z axis=0 - jedno wywołanie dla całej macierzy cech)
+- test chi-kwadrat z poprawką Yatesa dla tabel 2x2 liczony wektorowo,
+  test dokładny Fishera dla tabel z małymi licznościami oczekiwanymi
+- korekta wielokrotnych porównań (Bonferroni, Holm, Benjamini-Hochberg)
+- test permutacyjny różnicy średnich z konfigurowalną liczbą permutacji,
+  liczony blokami (macierz etykiet @ macierz cech) równolegle w procesach,
+  z rozmiarem bloku ograniczonym liczbą wierszy (stała pamięć)
+
+Każda funkcja zwraca ramkę (wiersz = cecha) z kolumnami statistic, p_value
+i p_adjusted.
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import stats
+
+from schema import TARGET
+
+# Domyślna korekta wielokrotnych porównań
+CORRECTION = 'holm'
+
+# Test Fishera zamiast chi-kwadrat, gdy najmniejsza liczność oczekiwana < progu
+FISHER_MIN_EXPECTED = 5
+
+# Liczba permutacji w jednym bloku (jedno mnożenie macierzy)
+PERMUTATION_BLOCK = 500
+
+# Największy rozmiar macierzy etykiet bloku (permutacje x wiersze, float64 - 32 MB na proces)
+PERMUTATION_CELLS = 1 << 22
+
+
+def adjust_pvalues(p_values, method=CORRECTION):
+    """
+    Korekta p-wartości dla wielokrotnych porównań
+
+    Args:
+        p_values: tablica p-wartości jednej rodziny testów
+        method: 'bonferroni', 'holm' lub 'fdr_bh' (Benjamini-Hochberg)
+    """
+    p_values = np.asarray(p_values, dtype=np.float64)
+    m = p_values.size
+    if method == 'bonferroni':
+        return np.minimum(p_values * m, 1.0)
+
+    order = np.argsort(p_values)
+    ranked = p_values[order]
+    if method == 'holm':
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    elif method == 'fdr_bh':
+        adjusted = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+    else:
+        raise ValueError(f"Nieznana korekta: {method} (dostępne: bonferroni, holm, fdr_bh)")
+
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def _split_groups(df, features, by):
+    """Macierze cech dla grup 0 (przeżyli) i 1 (zmarli)"""
+    values = df[features].to_numpy(dtype=np.float64)
+    groups = df[by].to_numpy()
+    return values[groups == 0], values[groups == 1]
+
+
+def _result_frame(features, statistic, p_values, correction, **columns):
+    return pd.DataFrame({
+        'statistic': statistic,
+        **columns,
+        'p_value': p_values,
+        'p_adjusted': adjust_pvalues(p_values, correction)
+    }, index=pd.Index(features, name='feature'))
+
+
+def ttest_features(df, features, by=TARGET, equal_var=False, correction=CORRECTION):
+    """
+    Test t dla wszystkich cech naraz (grupa 0 vs grupa 1)
+
+    Domyślnie test Welcha; equal_var=True daje klasyczny test Studenta
+    (identyczny ze stats.ttest_ind wywoływanym osobno dla każdej cechy).
+    """
+    features = list(features)
+    group_0, group_1 = _split_groups(df, features, by)
+    result = stats.ttest_ind(group_0, group_1, axis=0, equal_var=equal_var)
+    return _result_frame(features, result.statistic, result.pvalue, correction,
+                         df=result.df)
+
+
+def mannwhitney_features(df, features, by=TARGET, correction=CORRECTION):
+    """Test U Manna-Whitneya dla wszystkich cech naraz (przybliżenie normalne z poprawką na remisy)"""
+    features = list(features)
+    group_0, group_1 = _split_groups(df, features, by)
+    result = stats.mannwhitneyu(group_0, group_1, axis=0, method='asymptotic')
+    return _result_frame(features, result.statistic, result.pvalue, correction)
+
+
+def chi2_tables(counts, features, correction=CORRECTION, fisher_min_expected=FISHER_MIN_EXPECTED):
+    """
+    Testy niezależności dla stosu tabel 2x2 (cecha, wartość cechy, wartość celu)
+
+    Statystyka chi-kwadrat z poprawką Yatesa (jak stats.chi2_contingency)
+    liczona jest wektorowo dla wszystkich tabel. Tabele, w których najmniejsza
+    liczność oczekiwana jest mniejsza niż fisher_min_expected, testowane są
+    dokładnym testem Fishera - wtedy statistic to iloraz szans z testu Fishera
+    (kolumna test mówi, która statystyka i p-wartość obowiązuje; etykieta
+    do wykresów - test_label).
+
+    Args:
+        counts: tablica (liczba cech, 2, 2), np. streaming.ContingencyReducer.counts
+        features: nazwy cech w kolejności pierwszej osi counts
+    """
+    observed = np.asarray(counts, dtype=np.float64)
+    n = observed.sum(axis=(1, 2), keepdims=True)
+    expected = observed.sum(axis=2, keepdims=True) * observed.sum(axis=1, keepdims=True) / n
+
+    # Poprawka Yatesa: |O - E| pomniejszone o 0.5 (nie więcej niż do zera)
+    diff = expected - observed
+    corrected = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+    chi2 = ((corrected - expected) ** 2 / expected).sum(axis=(1, 2))
+    p_values = stats.chi2.sf(chi2, df=1)
+
+    min_expected = expected.min(axis=(1, 2))
+    test = np.where(min_expected < fisher_min_expected, 'fisher', 'chi2')
+    statistic = chi2.copy()
+    for i in np.flatnonzero(test == 'fisher'):
+        result = stats.fisher_exact(np.asarray(counts[i]))
+        statistic[i], p_values[i] = result.statistic, result.pvalue
+
+    return _result_frame(list(features), statistic, p_values, correction,
+                         test=test, min_expected=min_expected)
+
+
+def chi2_features(df, features, by=TARGET, correction=CORRECTION):
+    """Testy chi-kwadrat / Fishera dla cech binarnych względem zmiennej `by`"""
+    features = list(features)
+    target = df[by].to_numpy().astype(np.int64)
+    counts = np.stack([
+        np.bincount(2 * df[feature].to_numpy().astype(np.int64) + target, minlength=4).reshape(2, 2)
+        for feature in features
+    ])
+    return chi2_tables(counts, features, correction)
+
+
+def _count_extreme(values, n_positive, observed, n_resamples, seed):
+    """Liczba permutacji etykiet z |różnicą średnich| >= obserwowanej (jeden blok)"""
+    rng = np.random.default_rng(seed)
+    n = values.shape[0]
+    total = values.sum(axis=0)
+    labels = np.zeros((n_resamples, n))
+    labels[:, :n_positive] = 1.0
+    labels = rng.permuted(labels, axis=1)
+
+    sum_1 = labels @ values
+    diff = (total - sum_1) / (n - n_positive) - sum_1 / n_positive
+    # Tolerancja chroni przed błędem zaokrąglenia przy permutacji równej obserwacji
+    return (np.abs(diff) >= np.abs(observed) * (1 - 1e-12)).sum(axis=0)
+
+
+def permutation_test_features(df, features, by=TARGET, n_resamples=9999, n_jobs=-1,
+                              random_state=42, correction=CORRECTION):
+    """
+    Dwustronny test permutacyjny różnicy średnich dla wszystkich cech naraz
+
+    Permutacje etykiet grup są wspólne dla wszystkich cech, więc każdy blok
+    PERMUTATION_BLOCK permutacji to jedno mnożenie macierzy (permutacje x wiersze)
+    @ (wiersze x cechy). Bloki liczone są równolegle (n_jobs procesów)
+    z niezależnymi ziarnami, więc wynik zależy tylko od random_state.
+    Liczba permutacji w bloku jest ograniczona przez PERMUTATION_CELLS / liczba
+    wierszy, więc pamięć procesu nie rośnie z liczbą wierszy.
+    p = (liczba permutacji co najmniej tak skrajnych + 1) / (n_resamples + 1).
+    """
+    features = list(features)
+    values = df[features].to_numpy(dtype=np.float64)
+    groups = df[by].to_numpy()
+    n_positive = int((groups == 1).sum())
+    # Centrowanie kolumn poprawia dokładność sum przy dużych wartościach
+    values = values - values.mean(axis=0)
+    observed = values[groups == 0].mean(axis=0) - values[groups == 1].mean(axis=0)
+
+    block = max(1, min(PERMUTATION_BLOCK, PERMUTATION_CELLS // len(values)))
+    block_sizes = [block] * (n_resamples // block)
+    if n_resamples % block:
+        block_sizes.append(n_resamples % block)
+    seeds = np.random.SeedSequence(random_state).spawn(len(block_sizes))
+
+    counts = Parallel(n_jobs=n_jobs)(
+        delayed(_count_extreme)(values, n_positive, observed, size, seed)
+        for size, seed in zip(block_sizes, seeds)
+    )
+    p_values = (np.sum(counts, axis=0) + 1) / (n_resamples + 1)
+    return _result_frame(features, observed, p_values, correction)
+
+
+def test_all_features(df, numerical_features, binary_features, by=TARGET,
+                      equal_var=False, correction=CORRECTION):
+    """
+    Komplet testów porównujących grupy `by`
+
+    Zwraca słownik ramek: 'ttest', 'mannwhitney' (cechy numeryczne)
+    oraz 'chi2' (cechy binarne). Korekta wielokrotnych porównań stosowana
+    jest osobno w każdej rodzinie testów.
+    """
+    return {
+        'ttest': ttest_features(df, numerical_features, by, equal_var, correction),
+        'mannwhitney': mannwhitney_features(df, numerical_features, by, correction),
+        'chi2': chi2_features(df, binary_features, by, correction)
+    }
+
+
+def test_label(row):
+    """Opis wyniku testu z chi2_tables do wykresu: statystyka zgodna z testem, p-wartość i gwiazdki"""
+    statistic = (f"Fisher OR={row['statistic']:.2f}" if row['test'] == 'fisher'
+                 else f"χ²={row['statistic']:.2f}")
+    return f"{statistic}, p={row['p_value']:.4f} {significance_stars(row['p_value'])}"
+
+
+def significance_stars(p_value):
+    """Oznaczenie istotności używane na wykresach (***, **, *, ns)"""
+    return "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*" if p_value < 0.05 else "ns"
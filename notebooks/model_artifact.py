@@ -0,0 +1,154 @@
+"""
+Artefakt modelu mapowany w pamięci
+==================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Format pliku modelu Random Forest (las + scaler) dla procesów scoringu:
+1. Jeden plik: znacznik formatu, nagłówek JSON (wersja, cechy, parametry lasu,
+   położenie i typy tablic) i tablice NumPy wyrównane do ALIGNMENT bajtów
+2. Wczytanie to np.memmap pliku i widoki tablic - bez deserializacji (pickle)
+   i bez kopiowania, więc czas nie zależy od liczby drzew; strony pliku
+   w pamięci podręcznej systemu są współdzielone przez wszystkie procesy,
+   więc pamięć nie rośnie z liczbą procesów scoringu
+3. Zapisane są też tablice pomocnicze FlatForest - wczytanie niczego nie przelicza
+4. Scaler jako średnie i skale cech (standardize - wynik jak StandardScaler.transform)
+
+Użycie:
+    from model_artifact import write_artifact, read_artifact
+    write_artifact(path, FlatForest.from_sklearn(best_rf), scaler, features)
+    artifact = read_artifact(path)   # {'features', 'scaler_mean', 'scaler_scale', 'engine'}
+"""
+
+import json
+import os
+
+import numpy as np
+
+from flat_forest import FlatForest
+
+# Znacznik początku pliku i wersja formatu
+MAGIC = b'HFFOREST'
+ARTIFACT_VERSION = 1
+
+# Wyrównanie początku każdej tablicy (bajty; wielokrotność rozmiaru każdego typu)
+ALIGNMENT = 64
+
+# Długość nagłówka zapisana po znaczniku (liczba bez znaku, little-endian)
+HEADER_LENGTH_BYTES = 8
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_artifact(path, engine, scaler, features):
+    """
+    Zapisuje las (FlatForest) i scaler (StandardScaler) do pliku artefaktu
+
+    Zapis do pliku tymczasowego i podmiana - procesy z otwartym poprzednim
+    plikiem dalej czytają jego (niezmienione) strony.
+    """
+    # Wyłączone centrowanie/skalowanie jako odejmowanie zera/dzielenie przez jeden (wynik bez zmian)
+    n_features = len(features)
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    arrays = {**engine.to_arrays(),
+              'scaler_mean': np.asarray(mean, np.float64), 'scaler_scale': np.asarray(scale, np.float64)}
+
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps({
+        'version': ARTIFACT_VERSION,
+        'features': list(features),
+        'n_features': engine.n_features,
+        'max_depth': engine.max_depth,
+        'n_trees': len(engine.roots),
+        'arrays': layout
+    }).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + HEADER_LENGTH_BYTES + len(header))
+
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + len(header).to_bytes(HEADER_LENGTH_BYTES, 'little') + header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_artifact(path):
+    """
+    Mapuje plik artefaktu w pamięci (tylko do odczytu)
+
+    Zwraca słownik: features, scaler_mean, scaler_scale i engine (FlatForest
+    na widokach tablic pliku).
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"To nie jest plik artefaktu modelu: {path}")
+    start = len(MAGIC) + HEADER_LENGTH_BYTES
+    header_length = int.from_bytes(bytes(buffer[len(MAGIC):start]), 'little')
+    header = json.loads(bytes(buffer[start:start + header_length]).decode('utf-8'))
+    if header['version'] != ARTIFACT_VERSION:
+        raise ValueError(f"Niezgodna wersja artefaktu modelu: {path}")
+
+    data_start = _aligned(start + header_length)
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        begin = data_start + spec['offset']
+        end = begin + dtype.itemsize * int(np.prod(spec['shape']))
+        # Widok ndarray na stronach pliku (bez kopii)
+        arrays[name] = np.asarray(buffer[begin:end]).view(dtype).reshape(spec['shape'])
+
+    return {
+        'features': header['features'],
+        'scaler_mean': arrays['scaler_mean'],
+        'scaler_scale': arrays['scaler_scale'],
+        'engine': FlatForest.from_arrays(arrays, header['n_features'], header['max_depth'])
+    }
+
+
+def standardize(frame, features, mean, scale):
+    """
+    Standaryzacja kolumn cech - te same operacje i typ wyniku co StandardScaler.transform
+    (kolumny zmiennoprzecinkowe w swoim wspólnym typie, pozostałe jako float64)
+    """
+    values = frame[features].to_numpy()
+    values = values.astype(values.dtype if values.dtype.kind == 'f' else np.float64, copy=True)
+    # Średnie i skale rzutowane na typ danych przed odejmowaniem/dzieleniem (jak w sklearn)
+    values -= mean.astype(values.dtype)
+    values /= scale.astype(values.dtype)
+    return values
+
+
+def mapping_memory(path):
+    """
+    Pamięć mapowań pliku w bieżącym procesie (kB, /proc/self/smaps - tylko Linux):
+    {'rss', 'shared', 'private'}; None, jeśli niedostępne
+    """
+    if not os.path.exists('/proc/self/smaps'):
+        return None
+    path = os.path.realpath(path)
+    memory = {'rss': 0, 'shared': 0, 'private': 0}
+    fields = {'Rss:': 'rss', 'Shared_Clean:': 'shared', 'Shared_Dirty:': 'shared',
+              'Private_Clean:': 'private', 'Private_Dirty:': 'private'}
+    inside = False
+    with open('/proc/self/smaps', 'r') as f:
+        for line in f:
+            parts = line.split()
+            if '-' in parts[0] and not parts[0].endswith(':'):
+                # Wiersz nagłówka mapowania: zakres adresów ... ścieżka
+                inside = parts[-1] == path
+            elif inside and parts[0] in fields:
+                memory[fields[parts[0]]] += int(parts[1])
+    return memory
@@ -0,0 +1,119 @@
+"""
+Scoring wsadowy modelem Random Forest
+=====================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Ścieżka predykcji dla kontenerów wsadowych, uruchamianych wiele razy dziennie:
+1. Model (las, scaler dopasowany na zbiorze treningowym, lista cech) zapisany
+   przez 03_random_forest_model.py: artefakt mapowany w pamięci (model_artifact,
+   ARTIFACT_PATH) do scoringu i pełny obiekt sklearn (joblib, MODEL_PATH)
+   do analiz i benchmarku
+2. Odczyt pliku wejściowego porcjami, tylko kolumny cech modelu
+   (data_loader.iter_chunks) - plik nie musi zawierać zmiennej celu;
+   sprawdzane są tylko typy, a wiersze spoza zakresów kohorty ze schematu
+   są oceniane i oznaczane (kolumna out_of_range), nie odrzucają porcji
+3. Predykcja płaską reprezentacją lasu (flat_forest.FlatForest) na widokach
+   pliku artefaktu - wynik identyczny z predict_proba sklearn
+4. Zapis prawdopodobieństw, decyzji i oznaczeń porcjami do pliku CSV
+
+Stały koszt uruchomienia to głównie importy, więc ścieżka scoringu importuje
+tylko numpy i pandas - nigdy sklearn (artefakt nie wymaga deserializacji),
+matplotlib, seaborn ani tensorflow (sprawdza to startup_budget.py).
+
+Użycie:
+    python scoring.py wejście.csv wyjście.csv [ścieżka_modelu]
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+from data_loader import PROJECT_DIR, CHUNK_SIZE, iter_chunks
+from flat_forest import FlatForest
+from model_artifact import read_artifact, standardize, write_artifact
+from schema import out_of_range
+
+MODEL_PATH = os.path.join(PROJECT_DIR, 'results', 'rf_model.joblib')
+ARTIFACT_PATH = os.path.join(PROJECT_DIR, 'results', 'rf_model.forest')
+
+# Wersja formatu pliku modelu sklearn (save_model)
+MODEL_VERSION = 1
+
+
+def save_model(model, scaler, features, path=MODEL_PATH, artifact_path=ARTIFACT_PATH):
+    """Zapisuje wytrenowany las razem ze scalerem i kolejnością cech (obiekt sklearn i artefakt)"""
+    import joblib
+
+    bundle = {'version': MODEL_VERSION, 'model': model, 'scaler': scaler, 'features': list(features)}
+    # Zapis do pliku tymczasowego - przerwany zapis nie psuje poprzedniego modelu
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    joblib.dump(bundle, tmp_path)
+    os.replace(tmp_path, path)
+    write_artifact(artifact_path, FlatForest.from_sklearn(model), scaler, features)
+
+
+def load_estimator(path=MODEL_PATH):
+    """Pełny model sklearn (las, scaler, cechy) - do analiz i porównań, nie do scoringu"""
+    import joblib
+
+    bundle = joblib.load(path)
+    if bundle.get('version') != MODEL_VERSION:
+        raise ValueError(f"Niezgodny format modelu: {path}")
+    return bundle
+
+
+def load_model(path=ARTIFACT_PATH):
+    """Model do scoringu: artefakt mapowany w pamięci (features, scaler_mean, scaler_scale, engine)"""
+    return read_artifact(path)
+
+
+def predict_proba(bundle, frame):
+    """Prawdopodobieństwo klasy 1 (DEATH_EVENT) dla wierszy ramki z kolumnami cech modelu"""
+    values = standardize(frame, bundle['features'], bundle['scaler_mean'], bundle['scaler_scale'])
+    return bundle['engine'].predict_proba(values)
+
+
+def score_chunks(bundle, chunks):
+    """
+    Dla każdej porcji: ramka z prawdopodobieństwem, decyzją (jak model.predict)
+    i oznaczeniem wierszy spoza zakresów kohorty (ekstrapolacja modelu)
+    """
+    for chunk in chunks:
+        proba = predict_proba(bundle, chunk)
+        yield pd.DataFrame({'proba': proba, 'prediction': (proba > 0.5).astype('uint8'),
+                            'out_of_range': out_of_range(chunk, bundle['features']).astype('uint8')},
+                           index=chunk.index)
+
+
+def score_file(input_path, output_path, model_path=ARTIFACT_PATH, chunksize=CHUNK_SIZE):
+    """
+    Ocenia plik CSV porcjami i zapisuje wyniki do output_path
+
+    Zwraca (liczba wierszy, liczba wierszy spoza zakresów kohorty).
+    """
+    bundle = load_model(model_path)
+    chunks = iter_chunks(input_path, chunksize, columns=bundle['features'], check_ranges=False)
+    n_rows = n_out_of_range = 0
+    tmp_path = f'{output_path}.tmp{os.getpid()}'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        for scores in score_chunks(bundle, chunks):
+            scores.to_csv(f, header=n_rows == 0, index=False)
+            n_rows += len(scores)
+            n_out_of_range += int(scores['out_of_range'].sum())
+    os.replace(tmp_path, output_path)
+    return n_rows, n_out_of_range
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Użycie: python scoring.py wejście.csv wyjście.csv [ścieżka_modelu]")
+        sys.exit(2)
+
+    n_rows, n_out_of_range = score_file(sys.argv[1], sys.argv[2],
+                                        sys.argv[3] if len(sys.argv) > 3 else ARTIFACT_PATH)
+    print(f"✓ Oceniono {n_rows} wierszy: {sys.argv[2]}")
+    if n_out_of_range:
+        print(f"⚠ {n_out_of_range} wierszy spoza zakresów kohorty (kolumna out_of_range)")
@@ -0,0 +1,103 @@
+"""
+Budżet czasu uruchomienia ścieżki scoringu
+==========================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Kontrola stałego kosztu startu kontenerów scoringu (głównie importy):
+1. Każdy moduł importowany w świeżym interpreterze z -X importtime
+2. Naruszenie, jeśli import wciąga matplotlib, seaborn, tensorflow lub sklearn
+   (ciężkie zależności mają być importowane leniwie, w etapach, które ich używają)
+3. Naruszenie, jeśli łączny czas importów przekracza budżet
+   (mediana z kilku powtórzeń, bo pierwszy start bywa zimny)
+4. Raport najdroższych pakietów - wskazuje, co przenieść do importu lokalnego
+
+Użycie:
+    python startup_budget.py [--budget SEKUNDY] [moduł ...]
+    (kod wyjścia 1 przy naruszeniu - do użycia przy budowie obrazu kontenera)
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Moduły ścieżki scoringu i pakiety, których nie mogą importować
+SCORING_MODULES = ['scoring', 'model_artifact', 'flat_forest', 'data_loader', 'schema', 'curves']
+FORBIDDEN_MODULES = ('matplotlib', 'seaborn', 'tensorflow', 'keras', 'sklearn')
+
+# Budżet łącznego czasu importów jednego modułu (sekundy) i liczba powtórzeń
+IMPORT_BUDGET = 2.5
+REPEATS = 3
+
+
+def measure_import(module, cwd=None):
+    """
+    Import modułu w świeżym interpreterze
+
+    Zwraca (czas importów w sekundach, {pakiet najwyższego poziomu: czas własny},
+    posortowana lista modułów obecnych w sys.modules po imporcie).
+    """
+    code = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             cwd=cwd or os.path.dirname(os.path.abspath(__file__)),
+                             capture_output=True, text=True, check=True)
+
+    # Wiersze: "import time: self [us] | cumulative | imported package";
+    # bez wcięcia w nazwie = import najwyższego poziomu (czas skumulowany obejmuje zależności),
+    # czas własny sumowany po pakietach wskazuje, kto faktycznie kosztuje
+    seconds = 0.0
+    packages = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            seconds += int(cumulative) / 1e6
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0.0) + int(own) / 1e6
+    return seconds, packages, json.loads(process.stdout)
+
+
+def check_module(module, budget=IMPORT_BUDGET, repeats=REPEATS, forbidden=FORBIDDEN_MODULES):
+    """Wynik kontroli jednego modułu: czas (mediana), najdroższe pakiety i naruszenia"""
+    runs = sorted((measure_import(module) for _ in range(repeats)), key=lambda run: run[0])
+    seconds, packages, modules = runs[len(runs) // 2]
+
+    violations = [f"importuje {name}" for name in forbidden
+                  if any(loaded == name or loaded.startswith(name + '.') for loaded in modules)]
+    if seconds > budget:
+        violations.append(f"czas importów {seconds:.2f} s > budżet {budget:.2f} s")
+    top = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {'module': module, 'seconds': seconds, 'top': top, 'violations': violations}
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    budget = IMPORT_BUDGET
+    if '--budget' in args:
+        index = args.index('--budget')
+        budget = float(args[index + 1])
+        del args[index:index + 2]
+    modules = args or SCORING_MODULES
+
+    print("="*80)
+    print(f"BUDŻET URUCHOMIENIA ŚCIEŻKI SCORINGU (budżet: {budget:.2f} s, mediana z {REPEATS})")
+    print("="*80)
+
+    failed = False
+    for module in modules:
+        result = check_module(module, budget)
+        status = '✓' if not result['violations'] else '✗'
+        print(f"\n{status} {module}: {result['seconds']:.3f} s")
+        print("   Najdroższe pakiety: " + ", ".join(f"{name} {seconds:.3f} s"
+                                                    for name, seconds in result['top']))
+        for violation in result['violations']:
+            print(f"   NARUSZENIE: {violation}")
+        failed |= bool(result['violations'])
+
+    print("\n" + "="*80)
+    print("BUDŻET PRZEKROCZONY" if failed else "WSZYSTKIE MODUŁY MIESZCZĄ SIĘ W BUDŻECIE")
+    print("="*80)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,826 @@
+"""
+Strumieniowe przetwarzanie dużych eksportów rejestru
+====================================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Obliczenie statystyk z 01_exploratory_data_analysis.py bez wczytywania
+całego pliku do pamięci:
+1. data_loader.iter_chunks() dostarcza porcje o stałej liczbie wierszy
+2. run_pipeline() przekazuje każdą porcję do wszystkich reduktorów
+3. Reduktor przechowuje tylko zwarty stan (momenty, liczności),
+   więc pamięć nie rośnie wraz z liczbą wierszy
+
+Reduktor to dowolny obiekt z metodami update(chunk) i result(),
+np. statystyki opisowe, macierz korelacji, tabele kontyngencji
+lub scoring modelu na kolejnych porcjach.
+
+Stany reduktorów są statystykami dostatecznymi, które można łączyć (merge):
+- momenty Welforda/Chana (count, mean, M2, min, max),
+- macierz współmomentów (dla df.corr()),
+- liczności tabel kontyngencji (dla testów chi-kwadrat),
+- liczności siatki 2-D par cech w każdej klasie (wykresy gęstości),
+- histogramy, wąsy i wartości odstające wykresów pudełkowych (agregaty rozkładów).
+Dopisanie nowej porcji pacjentów kosztuje O(rozmiar porcji), a stany
+policzone osobno (pliki, ośrodki) łączą się dokładnie - EDAState.merge().
+Stan używany przez 01 (eda_stats.load_eda_state) po dopisaniu wierszy na końcu
+pliku CSV uzupełniany jest tylko o nowe wiersze (build_state z offset).
+
+Kwantyle (mediana, granice IQR) nie dają się złożyć z porcji dokładnie,
+dlatego streaming_eda() zwraca statystyki count/mean/std/min/max.
+Przybliżone kwantyle w jednym przebiegu i w ograniczonej pamięci daje
+szkic KLL (QuantileSketch) - wykorzystywany przez eda_stats w trybie 'sketch'.
+
+Użycie:
+    python streaming.py [ścieżka_do_csv] [rozmiar_porcji]
+    python streaming.py update STAN.npz NOWE_WIERSZE.csv
+    python streaming.py merge WYNIK.npz STAN_1.npz STAN_2.npz [...]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_PATH, CHUNK_SIZE, iter_chunks
+from schema import SCHEMA, TARGET, NUMERICAL_FEATURES, BINARY_FEATURES, out_of_range
+
+# Siatka wykresów gęstości: liczba przedziałów na oś i próg komórki "rzadkiej"
+# (komórki z najwyżej DENSITY_SPARSE_MAX punktami danej klasy rysowane są jako punkty)
+DENSITY_BINS = 80
+DENSITY_SPARSE_MAX = 16
+
+# Agregaty rozkładów: liczby przedziałów histogramów używane przez wykresy,
+# limit zapamiętanych wartości odstających (z każdej strony) i rozmiar próbki wierszy
+DISTRIBUTION_BINS = (20, 30)
+DISTRIBUTION_MAX_FLIERS = 1000
+DISTRIBUTION_SAMPLE = 500
+
+# Wersja formatu zapisanego stanu (EDAState.save)
+STATE_VERSION = 1
+
+# Rozmiar szkicu kwantyli KLL - błąd rangi rzędu 1/k, pamięć ~3k wartości na kolumnę
+SKETCH_K = 200
+
+
+class Moments:
+    """
+    Liczność, średnia, suma kwadratów odchyleń (M2), minimum i maksimum
+    dla wielu kolumn naraz
+
+    Porcje łączone są wzorem Chana (równoległa wersja algorytmu Welforda),
+    co jest stabilne numerycznie także przy dziesiątkach milionów wierszy.
+    """
+
+    def __init__(self, n_columns):
+        self.n = 0
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, values):
+        """Dodaje porcję danych (macierz wiersze x kolumny)"""
+        values = np.asarray(values, dtype=np.float64)
+        n_b = values.shape[0]
+        if n_b == 0:
+            return
+        mean_b = values.mean(axis=0)
+        m2_b = ((values - mean_b) ** 2).sum(axis=0)
+        self._combine(n_b, mean_b, m2_b, values.min(axis=0), values.max(axis=0))
+
+    def merge(self, other):
+        """Dołącza stan policzony na innej części danych"""
+        if other.n:
+            self._combine(other.n, other.mean, other.m2, other.min, other.max)
+
+    def _combine(self, n_b, mean_b, m2_b, min_b, max_b):
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * (self.n * n_b / n)
+        self.min = np.minimum(self.min, min_b)
+        self.max = np.maximum(self.max, max_b)
+        self.n = n
+
+    def var(self, ddof=1):
+        return self.m2 / (self.n - ddof)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.var(ddof))
+
+    def to_arrays(self):
+        return {'n': np.array(self.n), 'mean': self.mean, 'm2': self.m2,
+                'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        state = cls(len(arrays['mean']))
+        state.n = int(arrays['n'])
+        state.mean, state.m2 = arrays['mean'], arrays['m2']
+        state.min, state.max = arrays['min'], arrays['max']
+        return state
+
+
+class CoMoments:
+    """Średnie i macierz współmomentów (sum iloczynów odchyleń) kolumn"""
+
+    def __init__(self, n_columns):
+        self.n = 0
+        self.mean = np.zeros(n_columns)
+        self.comoment = np.zeros((n_columns, n_columns))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        n_b = values.shape[0]
+        if n_b == 0:
+            return
+        mean_b = values.mean(axis=0)
+        centered = values - mean_b
+        self._combine(n_b, mean_b, centered.T @ centered)
+
+    def merge(self, other):
+        if other.n:
+            self._combine(other.n, other.mean, other.comoment)
+
+    def _combine(self, n_b, mean_b, comoment_b):
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (n_b / n)
+        self.comoment = self.comoment + comoment_b + np.outer(delta, delta) * (self.n * n_b / n)
+        self.n = n
+
+    def correlation(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        return self.comoment / np.outer(scale, scale)
+
+    def to_arrays(self):
+        return {'n': np.array(self.n), 'mean': self.mean, 'comoment': self.comoment}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        state = cls(len(arrays['mean']))
+        state.n = int(arrays['n'])
+        state.mean, state.comoment = arrays['mean'], arrays['comoment']
+        return state
+
+
+class QuantileSketch:
+    """
+    Szkic kwantyli KLL (Karnin, Lang, Liberty) dla jednej kolumny
+
+    Wartości trafiają na poziom 0; przepełniony poziom h jest sortowany,
+    a co druga wartość (od losowego przesunięcia) przechodzi na poziom h+1
+    z dwukrotnie większą wagą. Pojemności poziomów maleją geometrycznie
+    (k, 2k/3, 4k/9, ...), więc szkic przechowuje ~3k wartości niezależnie
+    od liczby wierszy, a błąd rangi kwantyla jest rzędu n/k.
+    Minimum, maksimum i liczność są dokładne. Szkice można łączyć (merge).
+    """
+
+    def __init__(self, k=SKETCH_K, seed=0):
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        self.n += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _compress(self):
+        # Kompakcja tylko gdy szkic przekroczy łączną pojemność poziomów;
+        # kompaktowany jest najniższy przepełniony poziom
+        while sum(items.size for items in self.levels) > sum(
+                self._capacity(level) for level in range(len(self.levels))):
+            level = next(level for level, items in enumerate(self.levels)
+                         if items.size >= self._capacity(level))
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # Przy nieparzystej liczbie wartości jedna zostaje na poziomie
+            n_kept = items.size % 2
+            offset = self._rng.integers(2)
+            promoted = items[n_kept + offset::2]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            self.levels[level] = items[:n_kept]
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values), 2 ** level, dtype=np.int64)
+                                  for level, values in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        """Przybliżone kwantyle (q skalar lub tablica z przedziału [0, 1])"""
+        items, cumulative = self._weighted_items()
+        q = np.asarray(q, dtype=np.float64)
+        position = np.searchsorted(cumulative, q * (self.n - 1), side='right')
+        values = items[np.minimum(position, len(items) - 1)]
+        # Skrajne kwantyle są znane dokładnie
+        return np.where(q <= 0, self.min, np.where(q >= 1, self.max, values))
+
+    def rank(self, x, side='left'):
+        """Przybliżona liczba wartości < x (side='left') lub <= x (side='right')"""
+        items, cumulative = self._weighted_items()
+        position = np.searchsorted(items, x, side=side)
+        return np.where(position > 0, cumulative[np.maximum(position - 1, 0)], 0)
+
+
+# ============================================================================
+# REDUKTORY
+# ============================================================================
+
+class MomentsReducer:
+    """Statystyki opisowe (count/mean/std/min/max), opcjonalnie w podziale na grupy"""
+
+    def __init__(self, features, by=None):
+        self.features = list(features)
+        self.by = by
+        self.states = {}
+
+    def _state(self, key):
+        if key not in self.states:
+            self.states[key] = Moments(len(self.features))
+        return self.states[key]
+
+    def update(self, chunk):
+        values = chunk[self.features].to_numpy(dtype=np.float64)
+        if self.by is None:
+            self._state(None).update(values)
+            return
+        groups = chunk[self.by].to_numpy()
+        for key in np.unique(groups):
+            self._state(key.item()).update(values[groups == key])
+
+    def merge(self, other):
+        for key, state in other.states.items():
+            self._state(key).merge(state)
+
+    def overall(self):
+        """Stan dla wszystkich wierszy (złączenie stanów grup)"""
+        total = Moments(len(self.features))
+        for state in self.states.values():
+            total.merge(state)
+        return total
+
+    def _describe(self, state):
+        return pd.DataFrame([np.full(len(self.features), float(state.n)), state.mean,
+                             state.std(), state.min, state.max],
+                            index=['count', 'mean', 'std', 'min', 'max'],
+                            columns=self.features)
+
+    def result(self):
+        if self.by is None:
+            return self._describe(self._state(None))
+        return {key: self._describe(state) for key, state in sorted(self.states.items())}
+
+
+class CorrelationReducer:
+    """Macierz korelacji Pearsona (jak df.corr())"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.state = CoMoments(len(self.columns))
+
+    def update(self, chunk):
+        self.state.update(chunk[self.columns].to_numpy(dtype=np.float64))
+
+    def merge(self, other):
+        self.state.merge(other.state)
+
+    def result(self):
+        return pd.DataFrame(self.state.correlation(), index=self.columns, columns=self.columns)
+
+
+class ValueCountsReducer:
+    """Liczności wartości kolumn dyskretnych (jak value_counts())"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.counts = {column: pd.Series(dtype='int64') for column in self.columns}
+
+    def update(self, chunk):
+        for column in self.columns:
+            self.counts[column] = self.counts[column].add(chunk[column].value_counts(), fill_value=0)
+
+    def merge(self, other):
+        for column in self.columns:
+            self.counts[column] = self.counts[column].add(other.counts[column], fill_value=0)
+
+    def result(self):
+        return {column: counts.astype('int64').sort_index() for column, counts in self.counts.items()}
+
+
+class ContingencyReducer:
+    """
+    Tabele kontyngencji 2x2 cech binarnych względem zmiennej celu (jak pd.crosstab)
+
+    Liczności przechowywane są w tablicy (cecha, wartość cechy, wartość celu),
+    więc łączenie stanów to zwykłe dodawanie.
+    """
+
+    def __init__(self, features, target=TARGET):
+        self.features = list(features)
+        self.target = target
+        self.counts = np.zeros((len(self.features), 2, 2), dtype=np.int64)
+
+    def update(self, chunk):
+        target = chunk[self.target].to_numpy().astype(np.int64)
+        for i, feature in enumerate(self.features):
+            codes = 2 * chunk[feature].to_numpy().astype(np.int64) + target
+            self.counts[i] += np.bincount(codes, minlength=4).reshape(2, 2)
+
+    def merge(self, other):
+        self.counts += other.counts
+
+    def table(self, feature):
+        counts = self.counts[self.features.index(feature)]
+        return pd.DataFrame(counts, index=pd.Index([0, 1], name=feature),
+                            columns=pd.Index([0, 1], name=self.target))
+
+    def result(self):
+        return {feature: self.table(feature) for feature in self.features}
+
+
+class DensityReducer:
+    """
+    Liczności w siatce 2-D (x, y) osobno dla każdej klasy zmiennej binarnej `by`
+    oraz punkty z rzadkich komórek (do nałożenia na obraz gęstości)
+
+    Komórka liczona jest jednym bincount na porcję. Punkty kandydujące są
+    przechowywane tylko dopóki ich komórka ma najwyżej sparse_max punktów
+    danej klasy, więc pamięć jest ograniczona przez liczbę komórek,
+    a nie liczbę wierszy. Zakresy osi (np. min/max ze statystyk opisowych)
+    muszą być znane przed pierwszą porcją; wartości spoza zakresu trafiają
+    do skrajnych komórek.
+    """
+
+    def __init__(self, x, y, x_range, y_range, bins=DENSITY_BINS, by=TARGET,
+                 sparse_max=DENSITY_SPARSE_MAX):
+        self.x, self.y, self.by = x, y, by
+        self.sparse_max = sparse_max
+        self.x_edges = density_edges(x, x_range, bins)
+        self.y_edges = density_edges(y, y_range, bins)
+        self.counts = np.zeros((2, len(self.x_edges) - 1, len(self.y_edges) - 1), dtype=np.int64)
+        # Kandydaci na punkty rzadkich komórek: (numer komórki, x, y)
+        self.cells = np.empty(0, dtype=np.int64)
+        self.points = np.empty((0, 2))
+
+    @staticmethod
+    def _bin(values, edges):
+        n_bins = len(edges) - 1
+        scaled = (values - edges[0]) / (edges[-1] - edges[0]) * n_bins
+        return np.clip(scaled.astype(np.int64), 0, n_bins - 1)
+
+    def update(self, chunk):
+        x = chunk[self.x].to_numpy(dtype=np.float64)
+        y = chunk[self.y].to_numpy(dtype=np.float64)
+        labels = chunk[self.by].to_numpy().astype(np.int64)
+        _, nx, ny = self.counts.shape
+        cells = (labels * nx + self._bin(x, self.x_edges)) * ny + self._bin(y, self.y_edges)
+        self.counts += np.bincount(cells, minlength=self.counts.size).reshape(self.counts.shape)
+
+        sparse = self.counts.ravel()[cells] <= self.sparse_max
+        self.cells = np.concatenate([self.cells, cells[sparse]])
+        self.points = np.concatenate([self.points, np.column_stack([x[sparse], y[sparse]])])
+        self._prune()
+
+    def merge(self, other):
+        self.counts += other.counts
+        self.cells = np.concatenate([self.cells, other.cells])
+        self.points = np.concatenate([self.points, other.points])
+        self._prune()
+
+    def _prune(self):
+        keep = self.counts.ravel()[self.cells] <= self.sparse_max
+        self.cells, self.points = self.cells[keep], self.points[keep]
+
+    def result(self):
+        """
+        Słownik: x_edges, y_edges, counts (klasa x przedziały x x przedziały y),
+        sparse_max,
+        sparse_points {klasa: tablica (n, 2) punktów z rzadkich komórek}
+        """
+        labels = self.cells // (self.counts.shape[1] * self.counts.shape[2])
+        return {
+            'x_edges': self.x_edges,
+            'y_edges': self.y_edges,
+            'counts': self.counts.copy(),
+            'sparse_max': self.sparse_max,
+            'sparse_points': {key: self.points[labels == key] for key in (0, 1)}
+        }
+
+
+def density_edges(column, value_range, bins=DENSITY_BINS):
+    """
+    Granice przedziałów osi siatki gęstości
+
+    Cechy całkowitoliczbowe (typ ze SCHEMA) o rozpiętości nie większej niż bins
+    dostają po jednym przedziale na wartość - inaczej co drugi wiersz siatki
+    byłby pusty. Stała kolumna dostaje jeden przedział o szerokości 1.
+    """
+    low, high = float(value_range[0]), float(value_range[1])
+    if np.issubdtype(np.dtype(SCHEMA[column][1]), np.integer) and high - low + 1 <= bins:
+        return np.arange(low - 0.5, high + 1)
+    if high <= low:
+        return np.array([low - 0.5, high + 0.5])
+    return np.linspace(low, high, bins + 1)
+
+
+class DistributionReducer:
+    """
+    Agregaty rozkładów kolumn do wykresów bez dostępu do surowych wierszy,
+    opcjonalnie w podziale na grupy
+
+    Dla każdej grupy i cechy: histogramy o stałych granicach (DISTRIBUTION_BINS
+    przedziałów między min a max), wąsy wykresu pudełkowego (skrajne wartości
+    w granicach IQR), wartości odstające (najbardziej skrajne, najwyżej
+    max_fliers z każdej strony; liczba wszystkich jest dokładna) oraz
+    ograniczona próbka wierszy (najmniejsze losowe priorytety).
+
+    Args:
+        limits: {grupa: statystyki opisowe} z kolumnami min, max, 25%, 50%, 75%,
+                mean, lower_bound, upper_bound (grupa None bez podziału)
+    """
+
+    def __init__(self, features, limits, by=None, bins=DISTRIBUTION_BINS,
+                 max_fliers=DISTRIBUTION_MAX_FLIERS, sample_size=DISTRIBUTION_SAMPLE, seed=0):
+        self.features = list(features)
+        self.limits = {key: stats.loc[self.features] for key, stats in limits.items()}
+        self.by = by
+        self.bins = tuple(bins)
+        self.max_fliers = max_fliers
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.states = {}
+
+    def _state(self, key):
+        if key not in self.states:
+            stats = self.limits[key]
+            n_features = len(self.features)
+            self.states[key] = {
+                'edges': {bins: [histogram_edges(low, high, bins, SCHEMA.get(feature, (None, 'float64'))[1])
+                                 for feature, low, high in zip(self.features, stats['min'], stats['max'])]
+                          for bins in self.bins},
+                'counts': {bins: np.zeros((n_features, bins), dtype=np.int64) for bins in self.bins},
+                'whislo': np.full(n_features, np.inf),
+                'whishi': np.full(n_features, -np.inf),
+                'low': [np.empty(0) for _ in self.features],
+                'high': [np.empty(0) for _ in self.features],
+                'n_low': np.zeros(n_features, dtype=np.int64),
+                'n_high': np.zeros(n_features, dtype=np.int64),
+                'sample': np.empty((0, n_features)),
+                'priority': np.empty(0)
+            }
+        return self.states[key]
+
+    def _update(self, key, values):
+        state = self._state(key)
+        stats = self.limits[key]
+        for bins in self.bins:
+            for i, edges in enumerate(state['edges'][bins]):
+                state['counts'][bins][i] += np.histogram(values[:, i], bins=edges)[0]
+
+        lower = stats['lower_bound'].to_numpy()
+        upper = stats['upper_bound'].to_numpy()
+        inside = (values >= lower) & (values <= upper)
+        state['whislo'] = np.minimum(state['whislo'], np.where(inside, values, np.inf).min(axis=0))
+        state['whishi'] = np.maximum(state['whishi'], np.where(inside, values, -np.inf).max(axis=0))
+        for i in range(len(self.features)):
+            column = values[:, i]
+            low, high = column[column < lower[i]], column[column > upper[i]]
+            state['n_low'][i] += low.size
+            state['n_high'][i] += high.size
+            state['low'][i] = _smallest(np.concatenate([state['low'][i], low]), self.max_fliers)
+            state['high'][i] = _smallest(np.concatenate([state['high'][i], high]), self.max_fliers, largest=True)
+
+        self._add_sample(state, values, self.rng.random(values.shape[0]))
+
+    def _add_sample(self, state, sample, priority):
+        sample = np.concatenate([state['sample'], sample])
+        priority = np.concatenate([state['priority'], priority])
+        if priority.size > self.sample_size:
+            # Najmniejsze priorytety, z zachowaniem kolejności napływu wierszy
+            keep = np.sort(np.argpartition(priority, self.sample_size - 1)[:self.sample_size])
+            sample, priority = sample[keep], priority[keep]
+        state['sample'], state['priority'] = sample, priority
+
+    def update(self, chunk):
+        values = chunk[self.features].to_numpy(dtype=np.float64)
+        if self.by is None:
+            self._update(None, values)
+            return
+        groups = chunk[self.by].to_numpy()
+        for key in np.unique(groups):
+            self._update(key.item(), values[groups == key])
+
+    def merge(self, other):
+        for key, other_state in other.states.items():
+            state = self._state(key)
+            for bins in self.bins:
+                state['counts'][bins] += other_state['counts'][bins]
+            state['whislo'] = np.minimum(state['whislo'], other_state['whislo'])
+            state['whishi'] = np.maximum(state['whishi'], other_state['whishi'])
+            state['n_low'] += other_state['n_low']
+            state['n_high'] += other_state['n_high']
+            for i in range(len(self.features)):
+                state['low'][i] = _smallest(np.concatenate([state['low'][i], other_state['low'][i]]),
+                                            self.max_fliers)
+                state['high'][i] = _smallest(np.concatenate([state['high'][i], other_state['high'][i]]),
+                                             self.max_fliers, largest=True)
+            self._add_sample(state, other_state['sample'], other_state['priority'])
+
+    def _describe(self, key, state):
+        stats = self.limits[key]
+        result = {}
+        for i, feature in enumerate(self.features):
+            q1, median, q3 = stats.loc[feature, ['25%', '50%', '75%']]
+            result[feature] = {
+                'n': int(state['counts'][self.bins[0]][i].sum()),
+                'mean': float(stats.at[feature, 'mean']),
+                'min': float(stats.at[feature, 'min']),
+                'max': float(stats.at[feature, 'max']),
+                'q1': float(q1),
+                'med': float(median),
+                'q3': float(q3),
+                # Reguła matplotlib: wąs nie może wejść do wnętrza pudełka
+                'whislo': float(min(state['whislo'][i], q1)),
+                'whishi': float(max(state['whishi'][i], q3)),
+                'n_fliers': int(state['n_low'][i] + state['n_high'][i]),
+                'fliers': np.concatenate([state['low'][i], state['high'][i]]),
+                'hist': {bins: (state['edges'][bins][i], state['counts'][bins][i].copy()) for bins in self.bins},
+                'sample': state['sample'][:, i].copy()
+            }
+        return result
+
+    def result(self):
+        """Słownik {grupa: {cecha: agregat}} (grupa None bez podziału)"""
+        return {key: self._describe(key, state)
+                for key, state in sorted(self.states.items(), key=lambda item: str(item[0]))}
+
+
+def histogram_edges(low, high, bins, dtype='float64'):
+    """
+    Granice przedziałów jak w np.histogram(values, bins=bins) dla wartości z [low, high]
+
+    numpy liczy granice w typie kolumny zmiennoprzecinkowej (float32 dla wyników
+    badań, patrz SCHEMA), a dla kolumn całkowitych w float64 - tu tak samo.
+    """
+    dtype = np.dtype(dtype) if np.issubdtype(np.dtype(dtype), np.floating) else np.dtype(np.float64)
+    low, high = dtype.type(low), dtype.type(high)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1, dtype=dtype).astype(np.float64)
+
+
+def _smallest(values, k, largest=False):
+    """Najwyżej k najmniejszych (największych) wartości, w kolejności napływu"""
+    if values.size <= k:
+        return values
+    scores = -values if largest else values
+    return values[np.sort(np.argpartition(scores, k - 1)[:k])]
+
+
+class QuantileSketchReducer:
+    """Szkice kwantyli KLL kolumn, opcjonalnie w podziale na grupy"""
+
+    def __init__(self, features, by=None, k=SKETCH_K):
+        self.features = list(features)
+        self.by = by
+        self.k = k
+        self.states = {}
+
+    def _state(self, key):
+        if key not in self.states:
+            self.states[key] = [QuantileSketch(self.k, seed=i) for i in range(len(self.features))]
+        return self.states[key]
+
+    def _update(self, key, values):
+        for sketch, column in zip(self._state(key), values.T):
+            sketch.update(column)
+
+    def update(self, chunk):
+        values = chunk[self.features].to_numpy(dtype=np.float64)
+        if self.by is None:
+            self._update(None, values)
+            return
+        groups = chunk[self.by].to_numpy()
+        for key in np.unique(groups):
+            self._update(key.item(), values[groups == key])
+
+    def merge(self, other):
+        for key, sketches in other.states.items():
+            for sketch, other_sketch in zip(self._state(key), sketches):
+                sketch.merge(other_sketch)
+
+    def result(self):
+        """Słownik {grupa: {cecha: QuantileSketch}} (grupa None bez podziału)"""
+        return {key: dict(zip(self.features, sketches))
+                for key, sketches in sorted(self.states.items(), key=lambda item: str(item[0]))}
+
+
+class EDAState:
+    """
+    Komplet statystyk dostatecznych dla 01_exploratory_data_analysis.py
+
+    Składa się z momentów cech numerycznych w grupach DEATH_EVENT, współmomentów
+    wszystkich kolumn (korelacje w kolejności df.corr()) i tabel kontyngencji
+    cech binarnych. Sam jest reduktorem: update(porcja), merge(stan), result().
+    """
+
+    def __init__(self):
+        self.columns = list(SCHEMA)
+        self.moments = MomentsReducer(NUMERICAL_FEATURES, by=TARGET)
+        self.correlation = CorrelationReducer(self.columns)
+        self.contingency = ContingencyReducer(BINARY_FEATURES)
+
+    @property
+    def n_rows(self):
+        return self.correlation.state.n
+
+    def update(self, chunk):
+        self.moments.update(chunk)
+        self.correlation.update(chunk)
+        self.contingency.update(chunk)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.correlation.merge(other.correlation)
+        self.contingency.merge(other.contingency)
+        return self
+
+    def save(self, path):
+        """Zapisuje stan do pliku .npz"""
+        arrays = {'version': np.array(STATE_VERSION), 'columns': np.array(self.columns)}
+        for key, state in self.moments.states.items():
+            for name, values in state.to_arrays().items():
+                arrays[f'moments_{key}_{name}'] = values
+        for name, values in self.correlation.state.to_arrays().items():
+            arrays[f'comoments_{name}'] = values
+        arrays['contingency'] = self.contingency.counts
+        # Zapis do pliku tymczasowego - przerwany zapis nie psuje poprzedniego stanu
+        tmp_path = f'{path}.tmp{os.getpid()}.npz'
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        state = cls()
+        with np.load(path) as arrays:
+            if int(arrays['version']) != STATE_VERSION or list(arrays['columns']) != state.columns:
+                raise ValueError(f"Niezgodny format stanu: {path}")
+
+            def group(prefix):
+                return {name[len(prefix):]: arrays[name] for name in arrays.files
+                        if name.startswith(prefix)}
+
+            keys = sorted({int(name.split('_')[1]) for name in arrays.files
+                           if name.startswith('moments_')})
+            for key in keys:
+                state.moments.states[key] = Moments.from_arrays(group(f'moments_{key}_'))
+            state.correlation.state = CoMoments.from_arrays(group('comoments_'))
+            state.contingency.counts = arrays['contingency'].copy()
+        return state
+
+    def result(self):
+        """
+        Zwraca słownik z: liczbą wierszy, rozkładem DEATH_EVENT i cech binarnych,
+        statystykami opisowymi (ogółem i w grupach), macierzą korelacji,
+        tabelami kontyngencji, testami t-Studenta oraz testami chi-kwadrat.
+        """
+        moments_by_group = self.moments.result()
+        contingency = self.contingency.result()
+
+        value_counts = {feature: table.sum(axis=1).rename_axis(None)
+                        for feature, table in contingency.items()}
+        value_counts[TARGET] = pd.Series({key: state.n for key, state
+                                          in sorted(self.moments.states.items())}, dtype='int64')
+
+        # scipy tylko dla testów - import modułu (np. przez scoring) go nie wymaga
+        from scipy import stats
+
+        # Test t-Studenta z momentów grup (równoważny stats.ttest_ind)
+        survived, died = moments_by_group[0], moments_by_group[1]
+        ttests = {}
+        for feature in NUMERICAL_FEATURES:
+            t_stat, p_value = stats.ttest_ind_from_stats(
+                survived.at['mean', feature], survived.at['std', feature], survived.at['count', feature],
+                died.at['mean', feature], died.at['std', feature], died.at['count', feature]
+            )
+            ttests[feature] = (t_stat, p_value)
+
+        chi2_tests = {}
+        for feature, table in contingency.items():
+            chi2, p_value, dof, expected = stats.chi2_contingency(table)
+            chi2_tests[feature] = (chi2, p_value)
+
+        return {
+            'n_rows': self.n_rows,
+            'value_counts': value_counts,
+            'describe': self.moments._describe(self.moments.overall()),
+            'describe_by_group': moments_by_group,
+            'correlation': self.correlation.result(),
+            'ttests': ttests,
+            'contingency': contingency,
+            'chi2_tests': chi2_tests
+        }
+
+
+def run_pipeline(chunks, reducers):
+    """Przekazuje każdą porcję do wszystkich reduktorów i zwraca ich wyniki"""
+    for chunk in chunks:
+        for reducer in reducers:
+            reducer.update(chunk)
+    return [reducer.result() for reducer in reducers]
+
+
+def build_state(path=DATA_PATH, chunksize=CHUNK_SIZE, state=None, check_ranges=True, offset=0):
+    """
+    Buduje EDAState w jednym przebiegu po pliku (lub dopisuje plik do istniejącego stanu)
+
+    check_ranges=False (dopisywanie nowych pacjentów) - zakresy kohorty ze schematu
+    nie odrzucają porcji, sprawdzane są tylko typy. offset > 0 - tylko wiersze
+    dopisane do pliku za tym bajtem. Zwraca (stan, liczba wierszy spoza zakresów).
+    """
+    state = EDAState() if state is None else state
+    n_out_of_range = 0
+    for chunk in iter_chunks(path, chunksize, check_ranges=check_ranges, offset=offset):
+        state.update(chunk)
+        n_out_of_range += int(out_of_range(chunk).sum())
+    return state, n_out_of_range
+
+
+def streaming_eda(path=DATA_PATH, chunksize=CHUNK_SIZE):
+    """
+    Statystyki z 01_exploratory_data_analysis.py obliczone w jednym przebiegu
+    po porcjach pliku (zawartość wyniku - patrz EDAState.result)
+    """
+    state, _ = build_state(path, chunksize)
+    return state.result()
+
+
+def print_summary(summary):
+    print("="*80)
+    print("STRUMIENIOWA ANALIZA DANYCH")
+    print("="*80)
+    print(f"\nLiczba wierszy: {summary['n_rows']}")
+    print("\nStatystyki opisowe dla cech numerycznych:")
+    print(summary['describe'])
+    print("\nKorelacje z DEATH_EVENT (posortowane):")
+    print(summary['correlation'][TARGET].sort_values(ascending=False))
+    print("\nTesty t-Studenta (przeżyli vs zmarli):")
+    for feature, (t_stat, p_value) in summary['ttests'].items():
+        print(f"  {feature}: t={t_stat:.4f}, p={p_value:.4f}")
+    print("\nTesty chi-kwadrat (cechy binarne vs DEATH_EVENT):")
+    for feature, (chi2, p_value) in summary['chi2_tests'].items():
+        print(f"  {feature}: χ²={chi2:.2f}, p={p_value:.4f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'update':
+        # Dopisanie nowej porcji pacjentów do zapisanego stanu - O(rozmiar porcji)
+        state_path, batch_path = sys.argv[2], sys.argv[3]
+        state = EDAState.load(state_path) if os.path.exists(state_path) else None
+        state, n_out_of_range = build_state(batch_path, state=state, check_ranges=False)
+        state.save(state_path)
+        print(f"✓ Zaktualizowano stan: {state_path} ({state.n_rows} wierszy)")
+        if n_out_of_range:
+            print(f"⚠ {n_out_of_range} nowych wierszy spoza zakresów kohorty ze schematu")
+    elif len(sys.argv) > 1 and sys.argv[1] == 'merge':
+        # Złączenie stanów policzonych osobno (np. w różnych ośrodkach)
+        output_path, state_paths = sys.argv[2], sys.argv[3:]
+        state = EDAState()
+        for state_path in state_paths:
+            state.merge(EDAState.load(state_path))
+        state.save(output_path)
+        print(f"✓ Złączono stany ({len(state_paths)}): {output_path} ({state.n_rows} wierszy)")
+        print_summary(state.result())
+    else:
+        path = sys.argv[1] if len(sys.argv) > 1 else DATA_PATH
+        chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else CHUNK_SIZE
+        print_summary(streaming_eda(path, chunksize))
@@ -0,0 +1,251 @@
+"""
+Generator syntetycznych danych w skali rejestru
+===============================================
+
+Autor: Heart Failure Research Team
+Data: 2026-10-18
+
+Cel: Dane do testów obciążeniowych i benchmarków wszystkich etapów
+(1e3 - 1e8 wierszy) na wzór heart_failure_data.csv:
+1. Dopasowanie do pliku źródłowego - osobno dla DEATH_EVENT = 0 i 1:
+   - rozkłady brzegowe: empiryczne funkcje kwantylowe kolumn
+   - struktura zależności: kopuła gaussowska; korelacje ukryte startują
+     od korelacji normalnych wyników rang i są kalibrowane (kilka kroków
+     na stałej próbie), aby korelacje Pearsona wygenerowanych kolumn
+     - także binarnych - odpowiadały korelacjom w danych
+2. Generowanie porcjami: z ~ N(0, R) -> u = Φ(z) -> x = kwantyl empiryczny(u)
+   - cechy binarne: x = 1 gdy u > 1 - p (p - odsetek jedynek w klasie)
+   - pozostałe: interpolacja liniowa między wartościami obserwowanymi,
+     zaokrąglenie do liczb całkowitych (typy całkowite) lub 2 miejsc po przecinku
+3. Zapis porcjami do CSV (lub Parquet, jeśli dostępny jest pyarrow)
+   z tymi samymi 13 kolumnami, nazwami i zakresami co plik źródłowy;
+   bloki CSV formatowane są równolegle w procesach (joblib)
+
+Każdy blok BLOCK_ROWS wierszy ma własne ziarno wyprowadzone z (seed, numer bloku),
+więc wynik zależy tylko od seed i liczby wierszy (nie od rozmiaru porcji
+ani liczby procesów) i nie wymaga dostępu do sieci.
+
+Użycie:
+    python synthetic_data.py LICZBA_WIERSZY [ścieżka_wyjściowa.csv|.parquet] [seed]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import stats
+
+from data_loader import DATA_PATH, PROJECT_DIR, CHUNK_SIZE, load_data
+from schema import SCHEMA, TARGET
+
+SYNTHETIC_DIR = os.path.join(PROJECT_DIR, 'data', 'synthetic')
+
+# Liczba miejsc po przecinku dla kolumn zmiennoprzecinkowych
+FLOAT_DECIMALS = 2
+
+# Domyślne ziarno generatora
+SEED = 42
+
+# Liczba wierszy w bloku z jednym ziarnem (jednostka pracy dla procesów)
+BLOCK_ROWS = 100_000
+
+# Kalibracja korelacji ukrytych: liczba wierszy próby i liczba kroków
+CALIBRATION_ROWS = 100_000
+CALIBRATION_STEPS = 8
+
+
+class SyntheticGenerator:
+    """
+    Kopuła gaussowska z empirycznymi rozkładami brzegowymi, osobno dla każdej klasy
+
+    Użycie:
+        generator = SyntheticGenerator().fit(load_data())
+        for chunk in generator.iter_chunks(n_rows=10**6):
+            ...
+    """
+
+    def __init__(self):
+        self.features = [name for name in SCHEMA if name != TARGET]
+        self.classes = {}
+        self.positive_rate = None
+
+    def fit(self, df):
+        """Dopasowanie rozkładów brzegowych i korelacji do danych (kanoniczne nazwy kolumn)"""
+        target = df[TARGET].to_numpy()
+        self.positive_rate = float(target.mean())
+        for key in (0, 1):
+            values = df.loc[target == key, self.features].to_numpy(dtype=np.float64)
+            sorted_values = np.sort(values, axis=0)
+            # Punkt startowy: korelacje normalnych wyników rang (remisy - rangi średnie)
+            scores = stats.norm.ppf(stats.rankdata(values, axis=0) / (len(values) + 1))
+            latent = _correlation(scores)
+            self.classes[key] = {
+                'sorted_values': sorted_values,
+                'cholesky': self._calibrate(latent, _correlation(values), sorted_values, key)
+            }
+        return self
+
+    def _calibrate(self, latent, target, sorted_values, key):
+        """
+        Korekta korelacji ukrytych tak, aby korelacje po przekształceniu
+        przez rozkłady brzegowe były równe korelacjom w danych (dla cech
+        binarnych korelacja ukryta musi być większa niż obserwowana)
+        """
+        z = np.random.default_rng([SEED, key]).standard_normal((CALIBRATION_ROWS, len(self.features)))
+        for _ in range(CALIBRATION_STEPS):
+            cholesky = np.linalg.cholesky(_nearest_positive_definite(latent))
+            achieved = _correlation(self._marginals(stats.norm.cdf(z @ cholesky.T), sorted_values))
+            latent = np.clip(latent + (target - achieved), -0.99, 0.99)
+            np.fill_diagonal(latent, 1.0)
+        return np.linalg.cholesky(_nearest_positive_definite(latent))
+
+    def sample(self, n_rows, rng):
+        """Losuje n_rows wierszy (kanoniczne nazwy kolumn, typy ze schematu)"""
+        labels = (rng.random(n_rows) < self.positive_rate).astype(np.uint8)
+        data = np.empty((n_rows, len(self.features)))
+        for key, model in self.classes.items():
+            mask = labels == key
+            z = rng.standard_normal((int(mask.sum()), len(self.features))) @ model['cholesky'].T
+            data[mask] = self._marginals(stats.norm.cdf(z), model['sorted_values'])
+
+        df = pd.DataFrame(data, columns=self.features)
+        df[TARGET] = labels
+        return df[list(SCHEMA)].astype({name: dtype for name, (_, dtype, _) in SCHEMA.items()})
+
+    def _marginals(self, u, sorted_values):
+        """Przekształcenie u ~ U(0, 1) przez empiryczne funkcje kwantylowe kolumn"""
+        n = sorted_values.shape[0]
+        grid = np.arange(n) / (n - 1)
+        columns = []
+        for i, feature in enumerate(self.features):
+            dtype = np.dtype(SCHEMA[feature][1])
+            observed = sorted_values[:, i]
+            if SCHEMA[feature][2] == (0, 1):
+                columns.append((u[:, i] > 1 - observed.mean()).astype(np.float64))
+                continue
+            values = np.interp(u[:, i], grid, observed)
+            columns.append(np.round(values, 0 if dtype.kind in 'iu' else FLOAT_DECIMALS))
+        return np.column_stack(columns)
+
+    def block(self, index, n_rows, seed=SEED):
+        """Blok numer `index` z n_rows wierszami (najwyżej BLOCK_ROWS) - zależy tylko od (seed, index)"""
+        return self.sample(n_rows, np.random.default_rng([seed, index]))
+
+    def _blocks(self, n_rows):
+        return [(index, min(BLOCK_ROWS, n_rows - start))
+                for index, start in enumerate(range(0, n_rows, BLOCK_ROWS))]
+
+    def iter_chunks(self, n_rows, chunksize=CHUNK_SIZE, seed=SEED):
+        """Porcje o stałej liczbie wierszy (sklejone z kolejnych bloków)"""
+        buffer = None
+        for index, size in self._blocks(n_rows):
+            block = self.block(index, size, seed)
+            buffer = block if buffer is None else pd.concat([buffer, block], ignore_index=True)
+            while len(buffer) >= chunksize:
+                yield buffer.iloc[:chunksize].reset_index(drop=True)
+                buffer = buffer.iloc[chunksize:].reset_index(drop=True)
+        if buffer is not None and len(buffer):
+            yield buffer
+
+
+def _correlation(values):
+    """Macierz korelacji kolumn (kolumny stałe - brak korelacji, 1 na przekątnej)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = np.nan_to_num(np.corrcoef(values, rowvar=False))
+    np.fill_diagonal(correlation, 1.0)
+    return correlation
+
+
+def _nearest_positive_definite(matrix, min_eigenvalue=1e-6):
+    """Macierz korelacji z ujemnymi wartościami własnymi przycinanymi do min_eigenvalue"""
+    eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+    fixed = eigenvectors @ np.diag(np.maximum(eigenvalues, min_eigenvalue)) @ eigenvectors.T
+    scale = np.sqrt(np.diag(fixed))
+    return fixed / np.outer(scale, scale)
+
+
+def to_source_format(chunk):
+    """Nazwy kolumn i kolejność jak w heart_failure_data.csv"""
+    return chunk.rename(columns={name: source for name, (source, _, _) in SCHEMA.items()})
+
+
+def _format_block(generator, index, n_rows, seed, header):
+    """Blok danych jako tekst CSV (wykonywane w procesach roboczych)"""
+    return to_source_format(generator.block(index, n_rows, seed)).to_csv(
+        index=False, header=header, lineterminator='\n')
+
+
+def write_synthetic(n_rows, path=None, chunksize=CHUNK_SIZE, seed=SEED, source=DATA_PATH, n_jobs=-1):
+    """
+    Zapisuje n_rows syntetycznych wierszy do pliku CSV lub Parquet (rozszerzenie .parquet)
+
+    CSV: bloki formatowane równolegle (n_jobs procesów), zapisywane w kolejności.
+    Parquet: jedna grupa wierszy na porcję chunksize.
+    Zwraca ścieżkę pliku wynikowego.
+    """
+    if path is None:
+        path = os.path.join(SYNTHETIC_DIR, f'heart_failure_synthetic_{n_rows}_seed{seed}.csv')
+    generator = SyntheticGenerator().fit(load_data(source))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    if path.endswith('.parquet'):
+        _write_parquet((to_source_format(chunk) for chunk in generator.iter_chunks(n_rows, chunksize, seed)),
+                       tmp_path)
+    else:
+        texts = Parallel(n_jobs=n_jobs, return_as='generator')(
+            delayed(_format_block)(generator, index, size, seed, index == 0)
+            for index, size in generator._blocks(n_rows)
+        )
+        with open(tmp_path, 'w', newline='') as f:
+            for text in texts:
+                f.write(text)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_parquet(chunks, path):
+    # pyarrow jest opcjonalny - potrzebny tylko dla formatu Parquet
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Zapis do Parquet wymaga pakietu pyarrow (pip install pyarrow)")
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    n_rows = int(float(sys.argv[1]))
+    path = sys.argv[2] if len(sys.argv) > 2 else None
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else SEED
+
+    print("="*80)
+    print("GENEROWANIE DANYCH SYNTETYCZNYCH")
+    print("="*80)
+    print(f"\nLiczba wierszy: {n_rows:,}")
+    print(f"Ziarno: {seed}")
+
+    start = time.perf_counter()
+    path = write_synthetic(n_rows, path, seed=seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n✓ Zapisano: {path}")
+    print(f"✓ Rozmiar pliku: {os.path.getsize(path) / 2**20:.1f} MB")
+    print(f"✓ Czas: {elapsed:.1f} s ({n_rows / elapsed:,.0f} wierszy/s)")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Moduły z notebooks/ importowane jak w skryptach (uruchamianych z tego katalogu)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'notebooks'))
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from cross_validation import FoldCache
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(60, 3)) * [1, 10, 100] + [0, 5, -50], columns=['a', 'b', 'c'])
+    y = np.tile([0, 1, 1], 20)
+    return X, y
+
+
+def test_scaler_statistics_from_training_rows_only(data):
+    X, y = data
+    cache = FoldCache(3, y)
+    for (train, test), (X_train, X_test) in zip(cache.folds, cache.transformed('base', StandardScaler(), X)):
+        mean, std = X.iloc[train].mean().to_numpy(), X.iloc[train].std(ddof=0).to_numpy()
+        np.testing.assert_allclose(X_train, (X.iloc[train].to_numpy() - mean) / std)
+        np.testing.assert_allclose(X_test, (X.iloc[test].to_numpy() - mean) / std)
+
+
+def test_same_data_returns_cached_matrices(data):
+    X, y = data
+    cache = FoldCache(3, y)
+    first = cache.transformed('base', StandardScaler(), X)
+    assert cache.transformed('base', StandardScaler(), X.copy()) is first
+
+
+@pytest.mark.parametrize('change', ['values', 'columns', 'shape'])
+def test_name_reused_with_different_data_raises(data, change):
+    X, y = data
+    cache = FoldCache(3, y)
+    cache.transformed('base', StandardScaler(), X)
+    other = {'values': X * 2,
+             'columns': X.rename(columns={'c': 'd'}),
+             'shape': X[['a', 'b']]}[change]
+    with pytest.raises(ValueError, match="'base'"):
+        cache.transformed('base', StandardScaler(), other)
+    # Inna nazwa - nowe dopasowanie
+    assert len(cache.transformed('other', StandardScaler(), other)) == 3
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import eda_stats
+import streaming
+from data_loader import DATA_PATH, iter_chunks
+
+
+@pytest.fixture
+def csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(eda_stats, 'CACHE_DIR', str(tmp_path / 'cache'))
+    offsets = []
+
+    def spy(*args, **kwargs):
+        offsets.append(kwargs.get('offset', 0))
+        return iter_chunks(*args, **kwargs)
+
+    monkeypatch.setattr(streaming, 'iter_chunks', spy)
+    df = pd.read_csv(DATA_PATH)
+    path = tmp_path / 'data.csv'
+    df.iloc[:200].to_csv(path, index=False)
+    return path, df, offsets
+
+
+def assert_same_state(state, expected):
+    assert state.n_rows == expected.n_rows
+    np.testing.assert_array_equal(state.contingency.counts, expected.contingency.counts)
+    np.testing.assert_allclose(state.result()['correlation'], expected.result()['correlation'])
+
+
+def test_appended_rows_are_folded_into_cached_state(csv):
+    path, df, offsets = csv
+    eda_stats.load_eda_state(str(path))
+    size = path.stat().st_size
+    with open(path, 'a') as f:
+        df.iloc[200:].to_csv(f, index=False, header=False)
+
+    offsets.clear()
+    state = eda_stats.load_eda_state(str(path))
+    assert offsets == [size]
+    assert_same_state(state, streaming.build_state(str(path))[0])
+
+
+def test_edited_file_rebuilds_state(csv):
+    path, df, offsets = csv
+    eda_stats.load_eda_state(str(path))
+    df.iloc[1:201].to_csv(path, index=False)
+
+    offsets.clear()
+    state = eda_stats.load_eda_state(str(path))
+    assert offsets == [0]
+    assert_same_state(state, streaming.build_state(str(path))[0])
@@ -0,0 +1,53 @@
+import importlib
+import linecache
+import sys
+
+import pytest
+
+import figure_jobs
+
+HELPER = '''
+def box(values):
+    return {{'med': values[len(values) // 2]{suffix}}}
+'''
+
+PLOTS = '''
+import numpy as np
+import helper_mod
+from helper_mod import box
+
+
+def plot_direct(values):
+    return box(values), np.median(values)
+
+
+def plot_attribute(values):
+    return helper_mod.box(values)
+'''
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(figure_jobs, 'PROJECT_DIR', str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'plots_mod.py').write_text(PLOTS)
+
+    def load(suffix):
+        (tmp_path / 'helper_mod.py').write_text(HELPER.format(suffix=suffix))
+        for name in ('helper_mod', 'plots_mod'):
+            sys.modules.pop(name, None)
+        linecache.clearcache()
+        importlib.invalidate_caches()
+        return importlib.import_module('plots_mod')
+
+    yield load
+    for name in ('helper_mod', 'plots_mod'):
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.parametrize('plot', ['plot_direct', 'plot_attribute'])
+def test_helper_change_in_project_module_changes_fingerprint(project, plot):
+    before = figure_jobs.code_fingerprint(getattr(project(''), plot))
+    assert figure_jobs.code_fingerprint(getattr(project(''), plot)) == before
+    after = figure_jobs.code_fingerprint(getattr(project(", 'n': len(values)"), plot))
+    assert after != before
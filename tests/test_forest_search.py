@@ -0,0 +1,83 @@
+import math
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import StratifiedKFold, cross_val_score
+
+import forest_search
+from forest_search import WarmStartForestSearchCV
+
+PARAM_DISTRIBUTIONS = {
+    'bootstrap': [True, False],
+    'max_depth': [2, 4, None],
+    'min_samples_leaf': [1, 4],
+    'max_features': ['sqrt', None]
+}
+CHECKPOINTS = (5, 10, 20)
+
+
+@pytest.fixture(scope='module')
+def data():
+    return make_classification(n_samples=150, n_features=6, n_informative=3, random_state=0)
+
+
+def make_search(**params):
+    return WarmStartForestSearchCV(RandomForestClassifier(random_state=0), PARAM_DISTRIBUTIONS,
+                                   n_estimators=CHECKPOINTS, n_candidates=12, factor=2, oob=True,
+                                   cv=StratifiedKFold(3, shuffle=True, random_state=0), scoring='f1',
+                                   random_state=0, refit=False, **params)
+
+
+def test_halving_within_each_protocol(data):
+    X, y = data
+    search = make_search().fit(X, y)
+    results = search.cv_results_
+    oob_rows = ~np.isnan(results['oob_test_score'])
+    for step in range(len(CHECKPOINTS) - 1):
+        for protocol in (oob_rows, ~oob_rows):
+            n_before = np.sum((results['iter'] == step) & protocol)
+            n_after = np.sum((results['iter'] == step + 1) & protocol)
+            assert n_after == math.ceil(n_before / 2)
+
+
+def test_selection_uses_cross_validation_only(data):
+    X, y = data
+    search = make_search().fit(X, y)
+    results = search.cv_results_
+    final = results['iter'] == len(CHECKPOINTS) - 1
+    # Wszyscy kandydaci ostatniej rundy (także OOB) mają wyniki foldów
+    assert results['cv_scored'][final].all()
+    assert not np.isnan(results['oob_test_score'][final]).all()
+
+    # best_score_ to wynik CV liczony od zera tym samym podziałem, najlepszy wśród finalistów
+    finalists = np.array(results['params'])[final]
+    cv_scores = [cross_val_score(RandomForestClassifier(random_state=0, **params), X, y, scoring='f1',
+                                 cv=StratifiedKFold(3, shuffle=True, random_state=0)).mean()
+                 for params in finalists]
+    assert search.best_score_ == pytest.approx(max(cv_scores), abs=1e-12)
+    # Wybrana konfiguracja to finalista z najlepszym wynikiem CV (nie z najlepszym OOB)
+    assert search.best_params_ == finalists[int(np.argmax(cv_scores))]
+
+
+@pytest.mark.parametrize('bias', [-0.5, 0.5])
+def test_selection_does_not_depend_on_oob_bias(data, monkeypatch, bias):
+    X, y = data
+    reference = make_search().fit(X, y)
+    # Stałe obciążenie wyniku OOB względem CV nie może zmienić wyboru
+    f1 = forest_search.OOB_METRICS['f1']
+    monkeypatch.setitem(forest_search.OOB_METRICS, 'f1', lambda y, proba: f1(y, proba) + bias)
+    biased = make_search().fit(X, y)
+    assert biased.best_params_ == reference.best_params_
+    assert biased.best_score_ == reference.best_score_
+
+
+def test_oob_metrics_skip_rows_without_oob_trees(data):
+    X, y = data
+    forest = RandomForestClassifier(n_estimators=3, oob_score=True, random_state=0).fit(X, y)
+    decision = forest.oob_decision_function_
+    scored = decision.sum(axis=1) > 0
+    assert not scored.all()
+    expected = forest_search.OOB_METRICS['accuracy'](y[scored], decision[scored, 1])
+    assert forest_search.oob_metrics(forest, y, ['accuracy'])['accuracy'] == expected